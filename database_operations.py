@@ -5,16 +5,286 @@ Provides CRUD operations and business logic for all database entities
 """
 
 import json
+import math
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
 import uuid
+from array import array
+from concurrent.futures import Future
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Tuple
 import logging
 from dataclasses import dataclass
-from init_database import DatabaseManager
+from init_database import DatabaseManager, PERFORMANCE_INDEXES, row_count_sql, tuple_cursor
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib encoder is used instead
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional; transcripts are then stored as plain text
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
 
+# INSERT ... RETURNING needs SQLite 3.35+; older libraries fall back to lastrowid
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+@lru_cache(maxsize=64)
+def _without_returning(query: str) -> str:
+    """The INSERT without its RETURNING clause
+
+    Also used for executemany(), which rejects statements that return rows
+    on Python 3.12+.
+    """
+    return query[: query.rindex("RETURNING")]
+
+
+def _insert_sql(query: str) -> str:
+    """The INSERT as written, or without its RETURNING clause on old SQLite"""
+    return query if _HAS_RETURNING else _without_returning(query)
+
+
+def _execute_insert(conn: sqlite3.Connection, query: str, params: Tuple[Any, ...]) -> int:
+    """Run an INSERT ... RETURNING id and return the new row's id"""
+    if _HAS_RETURNING:
+        return tuple_cursor(conn).execute(query, params).fetchone()[0]
+    return conn.execute(_insert_sql(query), params).lastrowid
+
+
+def _fts_match_query(search_term: str) -> str:
+    """Turn free text into an FTS5 query: every word must match as a prefix"""
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", search_term))
+
+
+def _dumps_json(value: Any) -> str:
+    """Serialize a value to JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+# Transcripts of at least this many UTF-8 bytes are stored zstd-compressed in
+# interview_recordings.transcript_text_zstd when zstandard is installed
+_COMPRESS_MIN_BYTES = 4096
+
+
+def _compress_transcript(text: Optional[str]) -> Tuple[Optional[str], Optional[bytes]]:
+    """Column values (transcript_text, transcript_text_zstd) for a transcript"""
+    if zstandard is None or text is None:
+        return text, None
+    data = text.encode("utf-8")
+    if len(data) < _COMPRESS_MIN_BYTES:
+        return text, None
+    return None, zstandard.ZstdCompressor(level=3).compress(data)
+
+
+def _decompress_recording(recording: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace a recording's transcript_text_zstd with the decoded transcript_text"""
+    blob = recording.pop("transcript_text_zstd", None)
+    if blob is not None:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read compressed transcripts")
+        recording["transcript_text"] = zstandard.ZstdDecompressor().decompress(blob).decode("utf-8")
+    return recording
+
+
+def _recording_params(
+    interview_id: int, recording_type: str, file_path: Optional[str],
+    transcript_text: Optional[str], *details: Any,
+) -> Tuple[Any, ...]:
+    """Parameters for _INSERT_RECORDING_SQL from the public recording tuple"""
+    return (interview_id, recording_type, file_path, *_compress_transcript(transcript_text), *details)
+
+
+# Minutes between started_at and the bound end time, computed inside the UPDATE;
+# keeps the previous value when started_at is not set
+_DURATION_ASSIGNMENT = (
+    "duration_minutes = COALESCE("
+    "(CAST(strftime('%s', ?) AS INTEGER) - CAST(strftime('%s', started_at) AS INTEGER)) / 60, "
+    "duration_minutes)"
+)
+
+
+@lru_cache(maxsize=256)
+def _build_update_sql(
+    table: str,
+    keys: Tuple[str, ...],
+    where: str = "id",
+    touch_updated_at: bool = True,
+    extra: Tuple[str, ...] = (),
+) -> str:
+    """Build (once per update shape) the UPDATE statement for the given columns
+
+    ``extra`` holds raw assignments (e.g. _DURATION_ASSIGNMENT) whose parameters
+    follow the column values.
+    """
+    set_clause = ", ".join([f"{key} = ?" for key in keys] + list(extra))
+    if touch_updated_at:
+        set_clause += ", updated_at = CURRENT_TIMESTAMP"
+    return f"UPDATE {table} SET {set_clause} WHERE {where} = ?"
+
+
+# Statements used on every scoring run, kept as constants so each call reuses
+# the same text (and the connection's cached prepared statement)
+_INSERT_SCORING_ANALYSIS_SQL = """
+INSERT INTO scoring_analysis
+(interview_id, technical_skills_score, technical_skills_reasoning,
+ problem_solving_score, problem_solving_reasoning, communication_score,
+ communication_reasoning, cultural_fit_score, cultural_fit_reasoning,
+ resume_match_score, interview_performance_score, overall_impression_score,
+ overall_impression_reasoning, key_strengths, areas_for_improvement,
+ detailed_feedback, recommendation, recommendation_reasoning, model_version)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+RETURNING id
+"""
+
+_INSERT_FINAL_SCORE_SQL = """
+INSERT INTO final_scores
+(interview_id, final_score, weighted_technical_score, weighted_behavioral_score,
+ weighted_communication_score, weighted_cultural_fit_score, scoring_methodology,
+ pass_fail_status, confidence_level, human_review_required, final_decision,
+ decision_reasoning)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+RETURNING id
+"""
+
+_INSERT_RECORDING_SQL = """
+INSERT INTO interview_recordings
+(interview_id, recording_type, file_path, transcript_text, transcript_text_zstd,
+ transcript_jsonl_path, formatted_transcript_path, duration_seconds, file_size_mb,
+ mime_type)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+RETURNING id
+"""
+
+# Stand-in for interview_summary_mat (same columns as used below, latest final
+# score per interview) on databases that don't have the table
+_INTERVIEW_SUMMARY_FALLBACK = """(
+    SELECT i.id AS interview_id, i.started_at, fs.final_score, fs.final_decision
+    FROM interviews i
+    LEFT JOIN final_scores fs
+        ON fs.id = (SELECT MAX(id) FROM final_scores WHERE interview_id = i.id)
+)"""
+
+# Secondary indexes that InterviewDatabaseOps.bulk_load() drops while loading
+_BULK_LOAD_INDEXES = ("idx_recordings_interview", "idx_feedback_interview_created")
+
+# Written in batches by _SystemEventWriter, so no RETURNING clause
+_INSERT_SYSTEM_EVENT_SQL = """
+INSERT INTO system_events
+(event_type, entity_type, entity_id, event_data, user_id)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+
+def _system_event_params(
+    event_type: str,
+    entity_type: Optional[str],
+    entity_id: Any,
+    event_data: Optional[Dict[str, Any]],
+    user_id: Optional[str],
+) -> Tuple[Any, ...]:
+    """Parameters for _INSERT_SYSTEM_EVENT_SQL"""
+    return (
+        event_type,
+        entity_type,
+        entity_id,
+        _dumps_json(event_data) if event_data else None,
+        user_id,
+    )
+
+
+def _scoring_analysis_params(
+    interview_id: int, scores: Dict[str, Any], model_version: Optional[str]
+) -> Tuple[Any, ...]:
+    """Parameters for _INSERT_SCORING_ANALYSIS_SQL"""
+    return (
+        interview_id,
+        scores.get("technical_skills_score"),
+        scores.get("technical_skills_reasoning"),
+        scores.get("problem_solving_score"),
+        scores.get("problem_solving_reasoning"),
+        scores.get("communication_score"),
+        scores.get("communication_reasoning"),
+        scores.get("cultural_fit_score"),
+        scores.get("cultural_fit_reasoning"),
+        scores.get("resume_match_score"),
+        scores.get("interview_performance_score"),
+        scores.get("overall_impression_score"),
+        scores.get("overall_impression_reasoning"),
+        _dumps_json(scores.get("key_strengths", [])),
+        _dumps_json(scores.get("areas_for_improvement", [])),
+        scores.get("detailed_feedback"),
+        scores.get("recommendation"),
+        scores.get("recommendation_reasoning"),
+        model_version,
+    )
+
+
+def _keyset_page_sql(
+    table: str, active_only: bool, after: Optional[Tuple[str, int]], limit: Optional[int]
+) -> Tuple[str, Tuple[Any, ...]]:
+    """Newest-first listing of a table, optionally one keyset page after (created_at, id)"""
+    conditions, params = [], []
+    if active_only:
+        conditions.append("is_active = 1")
+    if after is not None:
+        conditions.append("(created_at, id) < (?, ?)")
+        params.extend(after)
+    query = f"SELECT * FROM {table}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY created_at DESC, id DESC"
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+    return query, tuple(params)
+
+
+# (results key, table, alias, join condition) for the header query of
+# get_interview_full_results; the interview itself is the FROM table
+_FULL_RESULTS_HEADER = (
+    ("interview", "interviews", "i", None),
+    ("job_description", "job_descriptions", "jd", "jd.id = i.job_description_id"),
+    ("resume", "resumes", "r", "r.id = i.resume_id"),
+    (
+        "match_rating",
+        "match_ratings",
+        "mr",
+        "mr.job_description_id = i.job_description_id AND mr.resume_id = i.resume_id",
+    ),
+    (
+        "scoring_analysis",
+        "scoring_analysis",
+        "sa",
+        "sa.id = (SELECT MIN(id) FROM scoring_analysis WHERE interview_id = i.id)",
+    ),
+    (
+        "final_score",
+        "final_scores",
+        "fs",
+        "fs.id = (SELECT MIN(id) FROM final_scores WHERE interview_id = i.id)",
+    ),
+)
+
+# (results key, table) for the per-interview child rows
+_FULL_RESULTS_CHILDREN = (
+    ("recordings", "interview_recordings"),
+    ("feedback", "interview_feedback"),
+)
+
+
 @dataclass
 class JobDescription:
     """Data class for job descriptions"""
@@ -79,6 +349,90 @@ class Interview:
     updated_at: Optional[str] = None
 
 
+class _SystemEventWriter:
+    """Writes system events from a background thread in batched transactions
+
+    Events are queued by submit() and inserted with executemany, one transaction
+    per batch of up to BATCH_SIZE events or FLUSH_INTERVAL seconds, whichever
+    comes first. The thread exits after IDLE_TIMEOUT seconds without events and
+    is restarted by the next submit(). It is not a daemon thread, so a normal
+    interpreter exit waits for queued events; events queued when the process
+    is killed are lost.
+    """
+
+    BATCH_SIZE = 256
+    FLUSH_INTERVAL = 0.05
+    IDLE_TIMEOUT = 1.0
+
+    def __init__(self, db_manager: DatabaseManager):
+        self._db_manager = db_manager
+        self._queue: "queue.Queue[Tuple[Optional[Tuple[Any, ...]], Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, params: Tuple[Any, ...]) -> "Future[int]":
+        """Queue one event; the future resolves to its ID or the write error"""
+        future: "Future[int]" = Future()
+        with self._lock:
+            self._queue.put((params, future))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="system-event-writer")
+                self._thread.start()
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until every event queued so far has been written"""
+        with self._lock:
+            if self._thread is None:
+                return
+            marker: Future = Future()
+            self._queue.put((None, marker))
+        marker.result(timeout)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.IDLE_TIMEOUT)]
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while len(batch) < self.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._write(batch)
+
+    def _write(self, batch: List[Tuple[Optional[Tuple[Any, ...]], Future]]) -> None:
+        events = [(params, future) for params, future in batch if params is not None]
+        if events:
+            try:
+                with self._db_manager.get_connection() as conn:
+                    conn.executemany(_INSERT_SYSTEM_EVENT_SQL, [params for params, _ in events])
+                    last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                # AUTOINCREMENT ids inside one write transaction are consecutive
+                first_id = last_id - len(events) + 1
+                for offset, (_, future) in enumerate(events):
+                    future.set_result(first_id + offset)
+            except Exception as e:
+                logger.exception("Error logging system events")
+                for _, future in events:
+                    future.set_exception(e)
+
+        for params, future in batch:
+            if params is None:
+                future.set_result(None)
+
+
 class InterviewDatabaseOps:
     """Database operations class for interview application"""
 
@@ -90,6 +444,30 @@ class InterviewDatabaseOps:
             db_path: Path to SQLite database file
         """
         self.db_manager = DatabaseManager(db_path)
+        self._columns: Dict[str, Tuple[str, ...]] = {}
+        self._full_results_queries = None
+
+        # Job description / resume rows by (table, id, data version). The data
+        # version moves on every commit from any connection or process, so
+        # edits are never served stale.
+        self._row_cache = lru_cache(maxsize=512)(self._fetch_row)
+
+        self._event_writer: Optional[_SystemEventWriter] = None
+        self._event_writer_lock = threading.Lock()
+
+    def _fetch_row(self, table: str, row_id: int, version: Optional[Tuple[int, int]]) -> Dict[str, Any]:
+        """Load one row by ID; raises LookupError so misses aren't cached"""
+        rows = self.db_manager.execute_query(f"SELECT * FROM {table} WHERE id = ?", (row_id,))
+        if not rows:
+            raise LookupError(f"{table} row {row_id} not found")
+        return dict(rows[0])
+
+    def _get_cached_row(self, table: str, row_id: int) -> Dict[str, Any]:
+        # Uncommitted rows of an open write block are never cached
+        if self.db_manager.in_write_block:
+            return self._fetch_row(table, row_id, None)
+        # A copy, so callers may modify their row without touching the cache
+        return dict(self._row_cache(table, row_id, self.db_manager.data_version()))
 
     # ==================== JOB DESCRIPTIONS ====================
 
@@ -109,6 +487,7 @@ class InterviewDatabaseOps:
             (title, company, description_text, description_pdf_path, description_image_path,
              requirements, skills_required, experience_level, location, salary_range, is_active)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
             """
 
             params = (
@@ -126,58 +505,53 @@ class InterviewDatabaseOps:
             )
 
             with self.db_manager.get_connection() as conn:
-                cursor = conn.execute(query, params)
-                conn.commit()
-                job_id = cursor.lastrowid
-                logger.info(f"Created job description with ID: {job_id}")
+                job_id = _execute_insert(conn, query, params)
+                logger.info("Created job description with ID: %s", job_id)
                 return job_id
 
-        except Exception as e:
-            logger.error(f"Error creating job description: {e}")
+        except Exception:
+            logger.exception("Error creating job description")
             return None
 
     def get_job_description(self, job_id: int) -> Optional[Dict[str, Any]]:
-        """Get job description by ID"""
+        """Get job description by ID (cached until the next write)"""
         try:
-            query = "SELECT * FROM job_descriptions WHERE id = ?"
-            rows = self.db_manager.execute_query(query, (job_id,))
-            if rows:
-                return dict(rows[0])
+            return self._get_cached_row("job_descriptions", job_id)
+        except LookupError:
             return None
-        except Exception as e:
-            logger.error(f"Error getting job description: {e}")
+        except Exception:
+            logger.exception("Error getting job description")
             return None
 
-    def list_job_descriptions(self, active_only: bool = True) -> List[Dict[str, Any]]:
-        """Get all job descriptions"""
-        try:
-            if active_only:
-                query = "SELECT * FROM job_descriptions WHERE is_active = 1 ORDER BY created_at DESC"
-            else:
-                query = "SELECT * FROM job_descriptions ORDER BY created_at DESC"
+    def list_job_descriptions(
+        self,
+        active_only: bool = True,
+        after: Optional[Tuple[str, int]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get job descriptions, newest first
 
-            rows = self.db_manager.execute_query(query)
+        Pass limit for one page and the last row's (created_at, id) as after
+        for the next one.
+        """
+        try:
+            query, params = _keyset_page_sql("job_descriptions", active_only, after, limit)
+            rows = self.db_manager.execute_query(query, params)
             return [dict(row) for row in rows]
-        except Exception as e:
-            logger.error(f"Error listing job descriptions: {e}")
+        except Exception:
+            logger.exception("Error listing job descriptions")
             return []
 
     def update_job_description(self, job_id: int, updates: Dict[str, Any]) -> bool:
         """Update job description"""
         try:
-            # Build dynamic update query
-            set_clause = ", ".join([f"{key} = ?" for key in updates.keys()])
-            query = f"""
-            UPDATE job_descriptions 
-            SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """
-
-            params = list(updates.values()) + [job_id]
+            keys = tuple(sorted(updates))
+            query = _build_update_sql("job_descriptions", keys)
+            params = [updates[key] for key in keys] + [job_id]
             return self.db_manager.execute_update(query, tuple(params))
 
-        except Exception as e:
-            logger.error(f"Error updating job description: {e}")
+        except Exception:
+            logger.exception("Error updating job description")
             return False
 
     # ==================== RESUMES ====================
@@ -190,6 +564,7 @@ class InterviewDatabaseOps:
             (candidate_name, email, phone, resume_text, resume_pdf_path, resume_image_path,
              skills, experience_years, education, certifications, linkedin_url, portfolio_url, is_active)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
             """
 
             params = (
@@ -209,26 +584,22 @@ class InterviewDatabaseOps:
             )
 
             with self.db_manager.get_connection() as conn:
-                cursor = conn.execute(query, params)
-                conn.commit()
-                resume_id = cursor.lastrowid
-                logger.info(f"Created resume with ID: {resume_id}")
+                resume_id = _execute_insert(conn, query, params)
+                logger.info("Created resume with ID: %s", resume_id)
                 return resume_id
 
-        except Exception as e:
-            logger.error(f"Error creating resume: {e}")
+        except Exception:
+            logger.exception("Error creating resume")
             return None
 
     def get_resume(self, resume_id: int) -> Optional[Dict[str, Any]]:
-        """Get resume by ID"""
+        """Get resume by ID (cached until the next write)"""
         try:
-            query = "SELECT * FROM resumes WHERE id = ?"
-            rows = self.db_manager.execute_query(query, (resume_id,))
-            if rows:
-                return dict(rows[0])
+            return self._get_cached_row("resumes", resume_id)
+        except LookupError:
             return None
-        except Exception as e:
-            logger.error(f"Error getting resume: {e}")
+        except Exception:
+            logger.exception("Error getting resume")
             return None
 
     def find_resume_by_email(self, email: str) -> Optional[Dict[str, Any]]:
@@ -239,24 +610,27 @@ class InterviewDatabaseOps:
             if rows:
                 return dict(rows[0])
             return None
-        except Exception as e:
-            logger.error(f"Error finding resume by email: {e}")
+        except Exception:
+            logger.exception("Error finding resume by email")
             return None
 
-    def list_resumes(self, active_only: bool = True) -> List[Dict[str, Any]]:
-        """Get all resumes"""
-        try:
-            if active_only:
-                query = (
-                    "SELECT * FROM resumes WHERE is_active = 1 ORDER BY created_at DESC"
-                )
-            else:
-                query = "SELECT * FROM resumes ORDER BY created_at DESC"
+    def list_resumes(
+        self,
+        active_only: bool = True,
+        after: Optional[Tuple[str, int]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get resumes, newest first
 
-            rows = self.db_manager.execute_query(query)
+        Pass limit for one page and the last row's (created_at, id) as after
+        for the next one.
+        """
+        try:
+            query, params = _keyset_page_sql("resumes", active_only, after, limit)
+            rows = self.db_manager.execute_query(query, params)
             return [dict(row) for row in rows]
-        except Exception as e:
-            logger.error(f"Error listing resumes: {e}")
+        except Exception:
+            logger.exception("Error listing resumes")
             return []
 
     # ==================== INTERVIEWS ====================
@@ -274,6 +648,7 @@ class InterviewDatabaseOps:
              scheduled_at, started_at, ended_at, duration_minutes, interviewer_notes,
              candidate_feedback, technical_assessment, behavioral_assessment)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
             """
 
             params = (
@@ -293,18 +668,16 @@ class InterviewDatabaseOps:
             )
 
             with self.db_manager.get_connection() as conn:
-                cursor = conn.execute(query, params)
-                conn.commit()
-                interview_id = cursor.lastrowid
-                logger.info(f"Created interview with ID: {interview_id}")
+                interview_id = _execute_insert(conn, query, params)
+                logger.info("Created interview with ID: %s", interview_id)
 
                 # Log system event
                 self.log_system_event("interview_created", "interview", interview_id)
 
                 return interview_id
 
-        except Exception as e:
-            logger.error(f"Error creating interview: {e}")
+        except Exception:
+            logger.exception("Error creating interview")
             return None
 
     def get_interview(self, interview_id: int) -> Optional[Dict[str, Any]]:
@@ -315,8 +688,8 @@ class InterviewDatabaseOps:
             if rows:
                 return dict(rows[0])
             return None
-        except Exception as e:
-            logger.error(f"Error getting interview: {e}")
+        except Exception:
+            logger.exception("Error getting interview")
             return None
 
     def get_interview_by_session(self, session_id: str) -> Optional[Dict[str, Any]]:
@@ -327,8 +700,8 @@ class InterviewDatabaseOps:
             if rows:
                 return dict(rows[0])
             return None
-        except Exception as e:
-            logger.error(f"Error getting interview by session: {e}")
+        except Exception:
+            logger.exception("Error getting interview by session")
             return None
 
     def update_interview_status(
@@ -339,43 +712,38 @@ class InterviewDatabaseOps:
     ) -> bool:
         """Update interview status and optional additional fields"""
         try:
-            updates = {"status": status, "updated_at": datetime.now().isoformat()}
+            now = datetime.now().isoformat()
+            updates = {"status": status, "updated_at": now}
+            extra: Tuple[str, ...] = ()
+            extra_params: Tuple[Any, ...] = ()
 
             # Add status-specific updates
             if status == "in_progress" and not additional_updates:
-                updates["started_at"] = datetime.now().isoformat()
+                updates["started_at"] = now
             elif status == "completed":
-                updates["ended_at"] = datetime.now().isoformat()
+                updates["ended_at"] = now
 
-                # Calculate duration if started_at exists
-                interview = self.get_interview(interview_id)
-                if interview and interview.get("started_at"):
-                    started = datetime.fromisoformat(interview["started_at"])
-                    ended = datetime.now()
-                    duration = int((ended - started).total_seconds() / 60)
-                    updates["duration_minutes"] = duration
+                # Let SQLite derive the duration from started_at in the same UPDATE
+                if not additional_updates or "duration_minutes" not in additional_updates:
+                    extra = (_DURATION_ASSIGNMENT,)
+                    extra_params = (now,)
 
             # Add any additional updates
             if additional_updates:
                 updates.update(additional_updates)
 
-            return self.update_interview(interview_id, updates)
+            return self._update_interview(interview_id, updates, extra, extra_params)
 
-        except Exception as e:
-            logger.error(f"Error updating interview status: {e}")
+        except Exception:
+            logger.exception("Error updating interview status")
             return False
 
     def update_interview_using_session_id(self, session_id: str, updates: Dict[str, Any]) -> bool:
         """Update interview with arbitrary fields"""
         try:
-            set_clause = ", ".join([f"{key} = ?" for key in updates.keys()])
-            query = f"""
-            UPDATE interviews 
-            SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-            WHERE session_id = ?
-            """
-
-            params = list(updates.values()) + [session_id]
+            keys = tuple(sorted(updates))
+            query = _build_update_sql("interviews", keys, where="session_id")
+            params = [updates[key] for key in keys] + [session_id]
             success = self.db_manager.execute_update(query, tuple(params))
 
             if success:
@@ -383,21 +751,26 @@ class InterviewDatabaseOps:
 
             return success
 
-        except Exception as e:
-            logger.error(f"Error updating interview: {e}")
+        except Exception:
+            logger.exception("Error updating interview")
             return False
 
     def update_interview(self, interview_id: int, updates: Dict[str, Any]) -> bool:
         """Update interview with arbitrary fields"""
-        try:
-            set_clause = ", ".join([f"{key} = ?" for key in updates.keys()])
-            query = f"""
-            UPDATE interviews 
-            SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """
+        return self._update_interview(interview_id, updates)
 
-            params = list(updates.values()) + [interview_id]
+    def _update_interview(
+        self,
+        interview_id: int,
+        updates: Dict[str, Any],
+        extra: Tuple[str, ...] = (),
+        extra_params: Tuple[Any, ...] = (),
+    ) -> bool:
+        """Update interview fields plus optional raw SET assignments"""
+        try:
+            keys = tuple(sorted(updates))
+            query = _build_update_sql("interviews", keys, extra=extra)
+            params = [updates[key] for key in keys] + list(extra_params) + [interview_id]
             success = self.db_manager.execute_update(query, tuple(params))
 
             if success:
@@ -405,8 +778,8 @@ class InterviewDatabaseOps:
 
             return success
 
-        except Exception as e:
-            logger.error(f"Error updating interview: {e}")
+        except Exception:
+            logger.exception("Error updating interview")
             return False
 
     def list_interviews(
@@ -439,8 +812,8 @@ class InterviewDatabaseOps:
             )
             return [dict(row) for row in results] if results else []
 
-        except Exception as e:
-            logger.error(f"Error listing interviews: {e}")
+        except Exception:
+            logger.exception("Error listing interviews")
             return []
 
     def get_interview_summary(self, interview_id: int) -> Optional[Dict[str, Any]]:
@@ -464,8 +837,8 @@ class InterviewDatabaseOps:
             results = self.db_manager.execute_query(query, (interview_id,))
             return dict(results[0]) if results else None
 
-        except Exception as e:
-            logger.error(f"Error getting interview summary: {e}")
+        except Exception:
+            logger.exception("Error getting interview summary")
             return None
 
     # ==================== MATCH RATINGS ====================
@@ -481,51 +854,47 @@ class InterviewDatabaseOps:
     ) -> Optional[int]:
         """Create or update match rating between job and resume"""
         try:
-            # Check if rating already exists
-            existing = self.get_match_rating(job_description_id, resume_id)
-
-            if existing:
-                # Update existing rating
-                updates = {
-                    "overall_match_score": overall_score,
-                    "match_reasoning": reasoning,
-                    "detailed_analysis": (
-                        json.dumps(detailed_analysis) if detailed_analysis else None
-                    ),
-                    "model_version": model_version,
-                    "generated_at": datetime.now().isoformat(),
-                }
-
-                success = self.update_match_rating(existing["id"], updates)
-                return existing["id"] if success else None
-
-            else:
-                # Create new rating
-                query = """
-                INSERT INTO match_ratings 
-                (job_description_id, resume_id, overall_match_score, match_reasoning,
-                 detailed_analysis, model_version)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """
-
-                params = (
-                    job_description_id,
-                    resume_id,
-                    overall_score,
-                    reasoning,
-                    json.dumps(detailed_analysis) if detailed_analysis else None,
-                    model_version,
-                )
+            # Insert, or refresh the existing rating for this job-resume pair,
+            # in one statement
+            query = """
+            INSERT INTO match_ratings 
+            (job_description_id, resume_id, overall_match_score, match_reasoning,
+             detailed_analysis, model_version)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(job_description_id, resume_id) DO UPDATE SET
+                overall_match_score = excluded.overall_match_score,
+                match_reasoning = excluded.match_reasoning,
+                detailed_analysis = excluded.detailed_analysis,
+                model_version = excluded.model_version,
+                generated_at = CURRENT_TIMESTAMP
+            RETURNING id
+            """
 
-                with self.db_manager.get_connection() as conn:
-                    cursor = conn.execute(query, params)
-                    conn.commit()
-                    rating_id = cursor.lastrowid
-                    logger.info(f"Created match rating with ID: {rating_id}")
-                    return rating_id
+            params = (
+                job_description_id,
+                resume_id,
+                overall_score,
+                reasoning,
+                _dumps_json(detailed_analysis) if detailed_analysis else None,
+                model_version,
+            )
 
-        except Exception as e:
-            logger.error(f"Error creating match rating: {e}")
+            with self.db_manager.get_connection() as conn:
+                if _HAS_RETURNING:
+                    rating_id = _execute_insert(conn, query, params)
+                else:
+                    # lastrowid is stale when the upsert updated an existing
+                    # rating, so look the row up by its conflict key
+                    conn.execute(_insert_sql(query), params)
+                    rating_id = conn.execute(
+                        "SELECT id FROM match_ratings WHERE job_description_id = ? AND resume_id = ?",
+                        (job_description_id, resume_id),
+                    ).fetchone()[0]
+                logger.info("Saved match rating with ID: %s", rating_id)
+                return rating_id
+
+        except Exception:
+            logger.exception("Error creating match rating")
             return None
 
     def get_match_rating(
@@ -541,25 +910,21 @@ class InterviewDatabaseOps:
             if rows:
                 return dict(rows[0])
             return None
-        except Exception as e:
-            logger.error(f"Error getting match rating: {e}")
+        except Exception:
+            logger.exception("Error getting match rating")
             return None
 
     def update_match_rating(self, rating_id: int, updates: Dict[str, Any]) -> bool:
         """Update match rating"""
         try:
-            set_clause = ", ".join([f"{key} = ?" for key in updates.keys()])
-            query = f"""
-            UPDATE match_ratings 
-            SET {set_clause}
-            WHERE id = ?
-            """
-
-            params = list(updates.values()) + [rating_id]
+            # match_ratings has no updated_at column
+            keys = tuple(sorted(updates))
+            query = _build_update_sql("match_ratings", keys, touch_updated_at=False)
+            params = [updates[key] for key in keys] + [rating_id]
             return self.db_manager.execute_update(query, tuple(params))
 
-        except Exception as e:
-            logger.error(f"Error updating match rating: {e}")
+        except Exception:
+            logger.exception("Error updating match rating")
             return False
 
     # ==================== INTERVIEW RECORDINGS ====================
@@ -574,14 +939,9 @@ class InterviewDatabaseOps:
     ) -> Optional[int]:
         """Add interview recording/transcript"""
         try:
-            query = """
-            INSERT INTO interview_recordings 
-            (interview_id, recording_type, file_path, transcript_text, transcript_jsonl_path,
-             formatted_transcript_path, duration_seconds, file_size_mb, mime_type)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
+            query = _INSERT_RECORDING_SQL
 
-            params = (
+            params = _recording_params(
                 interview_id,
                 recording_type,
                 file_path,
@@ -594,26 +954,86 @@ class InterviewDatabaseOps:
             )
 
             with self.db_manager.get_connection() as conn:
-                cursor = conn.execute(query, params)
-                conn.commit()
-                recording_id = cursor.lastrowid
-                logger.info(f"Added interview recording with ID: {recording_id}")
+                recording_id = _execute_insert(conn, query, params)
+                logger.info("Added interview recording with ID: %s", recording_id)
                 return recording_id
 
-        except Exception as e:
-            logger.error(f"Error adding interview recording: {e}")
+        except Exception:
+            logger.exception("Error adding interview recording")
             return None
 
+    def add_interview_recordings_bulk(self, records: List[Tuple[Any, ...]]) -> int:
+        """
+        Add many recordings in a single transaction
+
+        Args:
+            records: Tuples of (interview_id, recording_type, file_path,
+                transcript_text, transcript_jsonl_path, formatted_transcript_path,
+                duration_seconds, file_size_mb, mime_type)
+
+        Returns:
+            int: Number of recordings added (0 if the batch failed)
+        """
+        if not records:
+            return 0
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.executemany(
+                    _without_returning(_INSERT_RECORDING_SQL),
+                    (_recording_params(*record) for record in records),
+                )
+            logger.info("Added %s interview recordings", len(records))
+            return len(records)
+
+        except Exception:
+            logger.exception("Error adding interview recordings")
+            return 0
+
+    def has_interview_recording(self, interview_id: int, recording_type: str) -> bool:
+        """Check for a recording of the given type without loading any recordings"""
+        try:
+            query = """
+            SELECT EXISTS(
+                SELECT 1 FROM interview_recordings
+                WHERE interview_id = ? AND recording_type = ?
+            )
+            """
+            rows = self.db_manager.execute_query(query, (interview_id, recording_type))
+            return bool(rows[0][0])
+        except Exception:
+            logger.exception("Error checking interview recordings")
+            return False
+
     def get_interview_recordings(self, interview_id: int) -> List[Dict[str, Any]]:
         """Get all recordings for an interview"""
         try:
             query = "SELECT * FROM interview_recordings WHERE interview_id = ? ORDER BY created_at"
             rows = self.db_manager.execute_query(query, (interview_id,))
-            return [dict(row) for row in rows]
-        except Exception as e:
-            logger.error(f"Error getting interview recordings: {e}")
+            return [_decompress_recording(dict(row)) for row in rows]
+        except Exception:
+            logger.exception("Error getting interview recordings")
             return []
 
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        """
+        Drop the recording and feedback indexes for the duration of a bulk load
+
+        The indexes are rebuilt (and ANALYZE rerun) when the block exits, so many
+        inserts don't each pay for index maintenance.
+        """
+        with self.db_manager.get_connection() as conn:
+            for name in _BULK_LOAD_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+        try:
+            yield
+        finally:
+            with self.db_manager.get_connection() as conn:
+                for statement in PERFORMANCE_INDEXES:
+                    if statement.split()[5] in _BULK_LOAD_INDEXES:
+                        conn.execute(statement)
+                conn.execute("ANALYZE")
+
     # ==================== SCORING AND FINAL SCORES ====================
 
     def create_scoring_analysis(
@@ -624,63 +1044,50 @@ class InterviewDatabaseOps:
     ) -> Optional[int]:
         """Create detailed scoring analysis"""
         try:
-            query = """
-            INSERT INTO scoring_analysis 
-            (interview_id, technical_skills_score, technical_skills_reasoning,
-             problem_solving_score, problem_solving_reasoning, communication_score,
-             communication_reasoning, cultural_fit_score, cultural_fit_reasoning,
-             resume_match_score, interview_performance_score, overall_impression_score,
-             overall_impression_reasoning, key_strengths, areas_for_improvement,
-             detailed_feedback, recommendation, recommendation_reasoning, model_version)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-
-            params = (
-                interview_id,
-                scores.get("technical_skills_score"),
-                scores.get("technical_skills_reasoning"),
-                scores.get("problem_solving_score"),
-                scores.get("problem_solving_reasoning"),
-                scores.get("communication_score"),
-                scores.get("communication_reasoning"),
-                scores.get("cultural_fit_score"),
-                scores.get("cultural_fit_reasoning"),
-                scores.get("resume_match_score"),
-                scores.get("interview_performance_score"),
-                scores.get("overall_impression_score"),
-                scores.get("overall_impression_reasoning"),
-                json.dumps(scores.get("key_strengths", [])),
-                json.dumps(scores.get("areas_for_improvement", [])),
-                scores.get("detailed_feedback"),
-                scores.get("recommendation"),
-                scores.get("recommendation_reasoning"),
-                model_version,
-            )
+            query = _INSERT_SCORING_ANALYSIS_SQL
+            params = _scoring_analysis_params(interview_id, scores, model_version)
 
             with self.db_manager.get_connection() as conn:
-                cursor = conn.execute(query, params)
-                conn.commit()
-                analysis_id = cursor.lastrowid
-                logger.info(f"Created scoring analysis with ID: {analysis_id}")
+                analysis_id = _execute_insert(conn, query, params)
+                logger.info("Created scoring analysis with ID: %s", analysis_id)
                 return analysis_id
 
-        except Exception as e:
-            logger.error(f"Error creating scoring analysis: {e}")
+        except Exception:
+            logger.exception("Error creating scoring analysis")
             return None
 
+    def create_scoring_analyses_bulk(
+        self, analyses: List[Tuple[int, Dict[str, Any], Optional[str]]]
+    ) -> int:
+        """
+        Create many scoring analyses in a single transaction
+
+        Args:
+            analyses: Tuples of (interview_id, scores, model_version), with the
+                same scores dict accepted by create_scoring_analysis
+
+        Returns:
+            int: Number of analyses created (0 if the batch failed)
+        """
+        if not analyses:
+            return 0
+        try:
+            params = [_scoring_analysis_params(*analysis) for analysis in analyses]
+            with self.db_manager.get_connection() as conn:
+                conn.executemany(_without_returning(_INSERT_SCORING_ANALYSIS_SQL), params)
+            logger.info("Created %s scoring analyses", len(params))
+            return len(params)
+
+        except Exception:
+            logger.exception("Error creating scoring analyses")
+            return 0
+
     def create_final_score(
         self, interview_id: int, final_score: float, decision: str, **kwargs
     ) -> Optional[int]:
         """Create final score and decision"""
         try:
-            query = """
-            INSERT INTO final_scores 
-            (interview_id, final_score, weighted_technical_score, weighted_behavioral_score,
-             weighted_communication_score, weighted_cultural_fit_score, scoring_methodology,
-             pass_fail_status, confidence_level, human_review_required, final_decision,
-             decision_reasoning)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
+            query = _INSERT_FINAL_SCORE_SQL
 
             pass_fail = "pass" if final_score >= 6.0 else "fail"  # Default threshold
 
@@ -700,87 +1107,278 @@ class InterviewDatabaseOps:
             )
 
             with self.db_manager.get_connection() as conn:
-                cursor = conn.execute(query, params)
-                conn.commit()
-                score_id = cursor.lastrowid
-                logger.info(f"Created final score with ID: {score_id}")
+                score_id = _execute_insert(conn, query, params)
+                logger.info("Created final score with ID: %s", score_id)
 
-                # Log system event
-                self.log_system_event("final_score_generated", "final_scores", score_id)
+            # Log system event in the background, after the score is committed
+            self.log_system_event_async("final_score_generated", "final_scores", score_id)
 
-                return score_id
+            return score_id
 
-        except Exception as e:
-            logger.error(f"Error creating final score: {e}")
+        except Exception:
+            logger.exception("Error creating final score")
             return None
 
+    def _table_columns(self, table: str) -> Tuple[str, ...]:
+        """Column names of a table, read once per instance"""
+        columns = self._columns.get(table)
+        if columns is None:
+            rows = self.db_manager.execute_query(f"PRAGMA table_info({table})")
+            columns = tuple(row["name"] for row in rows)
+            self._columns[table] = columns
+        return columns
+
+    def _build_full_results_queries(self) -> Tuple[str, list, str, Dict[str, Tuple[str, ...]]]:
+        """Build the header and children queries used by get_interview_full_results"""
+        # Header: the interview plus every 1:1 related row, one column block per
+        # results key, aliased as "<alias>.<column>"
+        select, joins, sections = [], [], []
+        for key, table, alias, condition in _FULL_RESULTS_HEADER:
+            columns = [(column, len(select) + n) for n, column in enumerate(self._table_columns(table))]
+            select.extend(f'{alias}.{column} AS "{alias}.{column}"' for column, _ in columns)
+            id_index = next(index for column, index in columns if column == "id")
+            sections.append((key, id_index, columns))
+            if condition:
+                joins.append(f"LEFT JOIN {table} {alias} ON {condition}")
+        header_sql = (
+            f"SELECT {', '.join(select)} FROM interviews i {' '.join(joins)} WHERE i.id = ?"
+        )
+
+        # Children: recordings and feedback share one UNION ALL, padded to the
+        # union of both column sets
+        child_columns = {key: self._table_columns(table) for key, table in _FULL_RESULTS_CHILDREN}
+        all_columns = list(dict.fromkeys(c for columns in child_columns.values() for c in columns))
+        parts = []
+        for key, table in _FULL_RESULTS_CHILDREN:
+            present = set(child_columns[key])
+            padded = ", ".join(c if c in present else f"NULL AS {c}" for c in all_columns)
+            parts.append(f"SELECT '{key}' AS kind, {padded} FROM {table} WHERE interview_id = ?")
+        children_sql = " UNION ALL ".join(parts) + " ORDER BY kind, created_at, id"
+
+        return header_sql, sections, children_sql, child_columns
+
     def get_interview_full_results(self, interview_id: int) -> Dict[str, Any]:
-        """Get complete interview results including all related data"""
+        """Get complete interview results including all related data
+
+        Runs two queries: a LEFT JOIN for the interview and its 1:1 rows (job
+        description, resume, match rating, first scoring analysis, first final
+        score) and a UNION ALL for its recordings and feedback.
+        """
         try:
-            results = {}
+            if self._full_results_queries is None:
+                self._full_results_queries = self._build_full_results_queries()
+            header_sql, sections, children_sql, child_columns = self._full_results_queries
 
-            # Get interview details
-            interview = self.get_interview(interview_id)
-            if not interview:
+            rows = self.db_manager.execute_query(header_sql, (interview_id,))
+            if not rows:
                 return {}
 
-            results["interview"] = interview
-
-            # Get job description and resume
-            results["job_description"] = self.get_job_description(
-                interview["job_description_id"]
+            row = rows[0]
+            results = {}
+            for key, id_index, columns in sections:
+                if row[id_index] is None:
+                    results[key] = None
+                else:
+                    results[key] = {column: row[index] for column, index in columns}
+
+            results["recordings"] = []
+            results["feedback"] = []
+            rows = self.db_manager.execute_query(
+                children_sql, (interview_id,) * len(_FULL_RESULTS_CHILDREN)
             )
-            results["resume"] = self.get_resume(interview["resume_id"])
+            for row in rows:
+                kind = row["kind"]
+                results[kind].append({column: row[column] for column in child_columns[kind]})
+            for recording in results["recordings"]:
+                _decompress_recording(recording)
 
-            # Get match rating
-            results["match_rating"] = self.get_match_rating(
-                interview["job_description_id"], interview["resume_id"]
-            )
+            return results
 
-            # Get recordings and transcripts
-            results["recordings"] = self.get_interview_recordings(interview_id)
+        except Exception:
+            logger.exception("Error getting interview full results")
+            return {}
 
-            # Get scoring analysis
-            query = "SELECT * FROM scoring_analysis WHERE interview_id = ?"
-            rows = self.db_manager.execute_query(query, (interview_id,))
-            results["scoring_analysis"] = dict(rows[0]) if rows else None
+    def get_all_interview_results(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get scoring analyses and final scores for all interviews
+
+        Without ``limit`` every row is returned (None for an empty table),
+        including rows without an interview ID unless ``after_id`` is given.
+        With ``limit`` one page of interviews is returned; pages are cut on
+        interview ID so both lists cover the same interviews. Pass the
+        returned ``next_cursor`` as ``after_id`` to fetch the next page; it
+        is None after the last page.
+        """
+        tables = (("scoring_analysis", "scoring_analysis"), ("final_score", "final_scores"))
+        try:
+            if limit is None:
+                results = {}
+                for key, table in tables:
+                    if after_id is None:
+                        query, params = f"SELECT * FROM {table} ORDER BY id", ()
+                    else:
+                        query = f"SELECT * FROM {table} WHERE interview_id > ? ORDER BY id"
+                        params = (after_id,)
+                    rows = self.db_manager.execute_query(query, params)
+                    results[key] = [dict(row) for row in rows] or None
+                return results
+
+            query = "SELECT id FROM interviews WHERE id > ? ORDER BY id LIMIT ?"
+            page = [
+                row["id"] for row in self.db_manager.execute_query(query, (after_id or 0, limit))
+            ]
+            if not page:
+                return {"scoring_analysis": [], "final_score": [], "next_cursor": None}
+
+            bounds = (page[0], page[-1])
+            results = {}
+            for key, table in tables:
+                query = f"SELECT * FROM {table} WHERE interview_id BETWEEN ? AND ? ORDER BY id"
+                results[key] = [dict(row) for row in self.db_manager.execute_query(query, bounds)]
+            results["next_cursor"] = page[-1] if len(page) == limit else None
+            return results
 
-            # Get final score
-            query = "SELECT * FROM final_scores WHERE interview_id = ?"
-            rows = self.db_manager.execute_query(query, (interview_id,))
-            results["final_score"] = dict(rows[0]) if rows else None
+        except Exception:
+            logger.exception("Error getting interview results")
+            return {}
 
-            # Get interview feedback
-            query = "SELECT * FROM interview_feedback WHERE interview_id = ? ORDER BY created_at"
-            rows = self.db_manager.execute_query(query, (interview_id,))
-            results["feedback"] = [dict(row) for row in rows]
+    def iter_scoring_analyses(self) -> Iterator[Dict[str, Any]]:
+        """Stream every scoring analysis without loading the table into memory"""
+        for row in self.db_manager.iter_query("SELECT * FROM scoring_analysis ORDER BY id"):
+            yield dict(row)
 
-            return results
+    def iter_final_scores(self) -> Iterator[Dict[str, Any]]:
+        """Stream every final score without loading the table into memory"""
+        for row in self.db_manager.iter_query("SELECT * FROM final_scores ORDER BY id"):
+            yield dict(row)
 
-        except Exception as e:
-            logger.error(f"Error getting interview full results: {e}")
-            return {}
+    def average_final_score(self) -> float:
+        """Mean of all final scores, computed by SQLite (0 when there are none)"""
+        try:
+            rows = self.db_manager.execute_query(
+                "SELECT COALESCE(AVG(final_score), 0) AS average FROM final_scores"
+            )
+            return float(rows[0]["average"])
+        except Exception:
+            logger.exception("Error getting average final score")
+            return 0.0
+
+    def get_analytics_counts(self) -> Dict[str, Any]:
+        """Job, resume and interview totals plus the average final score
 
-    def get_all_interview_results(self) -> Dict[str, Any]:
-        """Get complete interview results including all related data"""
+        One round trip; the totals come from the trigger-maintained
+        table_row_counts when it is in place rather than counting every row.
+        Zeros are returned if the query fails.
+        """
         try:
-            results = {}
+            tracked = self.db_manager.has_row_counts
+            query = (
+                "SELECT "
+                + ", ".join(
+                    f"{row_count_sql(table, tracked)} AS {table}"
+                    for table in ("job_descriptions", "resumes", "interviews")
+                )
+                + ", (SELECT COALESCE(AVG(final_score), 0) FROM final_scores) AS average_score"
+            )
+            return dict(self.db_manager.execute_query(query)[0])
+        except Exception:
+            logger.exception("Error getting analytics counts")
+            return {"job_descriptions": 0, "resumes": 0, "interviews": 0, "average_score": 0}
 
-            # Get scoring analysis
-            query = "SELECT * FROM scoring_analysis"
-            rows = self.db_manager.execute_query(query)
-            results["scoring_analysis"] = rows if rows else None
+    # ==================== SCORING CACHE ====================
 
-            # Get final score
-            query = "SELECT * FROM final_scores"
-            rows = self.db_manager.execute_query(query)
-            results["final_score"] = rows if rows else None
+    def get_cached_scoring(self, cache_key: str, max_age_days: int = 30) -> Optional[str]:
+        """Get a cached scoring response no older than max_age_days, or None"""
+        try:
+            query = """
+            SELECT response_text FROM scoring_cache
+            WHERE cache_key = ? AND created_at > datetime('now', ?)
+            """
+            rows = self.db_manager.execute_query(query, (cache_key, f"-{max_age_days} days"))
+            return rows[0]["response_text"] if rows else None
+        except Exception:
+            logger.exception("Error reading scoring cache")
+            return None
 
-            return results
+    def cache_scoring(
+        self, cache_key: str, response_text: str, model_version: Optional[str] = None
+    ) -> bool:
+        """Store (or replace) the scoring response for cache_key"""
+        return self.db_manager.execute_update(
+            """
+            INSERT OR REPLACE INTO scoring_cache (cache_key, response_text, model_version)
+            VALUES (?, ?, ?)
+            """,
+            (cache_key, response_text, model_version),
+        )
 
-        except Exception as e:
-            logger.error(f"Error getting interview full results: {e}")
-            return {}
+    def find_similar_scoring(
+        self,
+        interview_id: int,
+        context_key: str,
+        embedding: Sequence[float],
+        min_similarity: float = 0.97,
+        max_age_days: int = 30,
+    ) -> Optional[str]:
+        """
+        Get the cached response for this interview whose transcript embedding
+        is most similar to ``embedding`` within the same context, if the
+        cosine similarity reaches min_similarity
+
+        Responses are never shared between interviews: two interviews of one
+        candidate for one job have the same context but must be scored apart.
+
+        Args:
+            interview_id: Interview being scored
+            context_key: Hash of everything but the transcript (resume, job
+                description, prompt, model)
+            embedding: L2-normalized transcript embedding
+        """
+        try:
+            query = """
+            SELECT embedding, response_text FROM scoring_embeddings
+            WHERE interview_id = ? AND context_key = ? AND created_at > datetime('now', ?)
+            """
+            params = (interview_id, context_key, f"-{max_age_days} days")
+            best_text, best_similarity = None, min_similarity
+            for row in self.db_manager.iter_query(query, params):
+                cached = array("f")
+                cached.frombytes(row["embedding"])
+                if len(cached) != len(embedding):
+                    continue
+                similarity = math.fsum(a * b for a, b in zip(cached, embedding))
+                if similarity >= best_similarity:
+                    best_text, best_similarity = row["response_text"], similarity
+            return best_text
+        except Exception:
+            logger.exception("Error searching scoring embeddings")
+            return None
+
+    def cache_scoring_embedding(
+        self,
+        interview_id: int,
+        context_key: str,
+        embedding: Sequence[float],
+        response_text: str,
+    ) -> bool:
+        """Store an interview's transcript embedding with the response it was scored with"""
+        return self.db_manager.execute_update(
+            """
+            INSERT INTO scoring_embeddings (interview_id, context_key, embedding, response_text)
+            VALUES (?, ?, ?, ?)
+            """,
+            (interview_id, context_key, array("f", embedding).tobytes(), response_text),
+        )
+
+    def purge_scoring_cache(self, max_age_days: int = 30) -> bool:
+        """Delete cached scoring responses and embeddings older than max_age_days"""
+        cutoff = (f"-{max_age_days} days",)
+        return self.db_manager.execute_update(
+            "DELETE FROM scoring_cache WHERE created_at <= datetime('now', ?)", cutoff
+        ) and self.db_manager.execute_update(
+            "DELETE FROM scoring_embeddings WHERE created_at <= datetime('now', ?)", cutoff
+        )
 
     # ==================== SYSTEM EVENTS ====================
 
@@ -794,53 +1392,118 @@ class InterviewDatabaseOps:
     ) -> Optional[int]:
         """Log system event"""
         try:
-            query = """
-            INSERT INTO system_events 
-            (event_type, entity_type, entity_id, event_data, user_id)
-            VALUES (?, ?, ?, ?, ?)
-            """
-
-            params = (
-                event_type,
-                entity_type,
-                entity_id,
-                json.dumps(event_data) if event_data else None,
-                user_id,
-            )
-
+            params = _system_event_params(event_type, entity_type, entity_id, event_data, user_id)
             with self.db_manager.get_connection() as conn:
-                cursor = conn.execute(query, params)
-                conn.commit()
-                return cursor.lastrowid
+                return conn.execute(_INSERT_SYSTEM_EVENT_SQL, params).lastrowid
 
-        except Exception as e:
-            logger.error(f"Error logging system event: {e}")
+        except Exception:
+            logger.exception("Error logging system event")
             return None
 
+    def log_system_event_async(
+        self,
+        event_type: str,
+        entity_type: str = None,
+        entity_id: int = None,
+        event_data: Dict[str, Any] = None,
+        user_id: str = None,
+    ) -> "Future[int]":
+        """
+        Queue a system event for a background writer and return immediately
+
+        For hot paths that don't need the event ID. Queued events are written
+        in batches; they are lost if the process is killed before then.
+
+        Returns:
+            Future resolving to the event ID, or raising the write error
+        """
+        with self._event_writer_lock:
+            if self._event_writer is None:
+                self._event_writer = _SystemEventWriter(self.db_manager)
+        params = _system_event_params(event_type, entity_type, entity_id, event_data, user_id)
+        return self._event_writer.submit(params)
+
+    def flush_events(self, timeout: Optional[float] = None) -> None:
+        """Wait until all system events queued by log_system_event_async are written"""
+        if self._event_writer is not None:
+            self._event_writer.flush(timeout)
+
     # ==================== UTILITY METHODS ====================
 
+    def _interview_summary_source(self) -> str:
+        """interview_summary_mat, or an equivalent subquery if it isn't in place"""
+        if self.db_manager.has_summary_table:
+            return "interview_summary_mat"
+        return _INTERVIEW_SUMMARY_FALLBACK
+
     def get_recent_interviews(self, days: int = 7) -> List[Dict[str, Any]]:
-        """Get recent interviews"""
+        """Get recent interviews with the columns of the interview_summary view
+
+        The trigger-maintained interview_summary_mat table picks the recent
+        interviews through its started_at index and supplies their latest
+        final score; only those interviews are joined to the other tables.
+        """
         try:
-            query = """
-            SELECT * FROM interview_summary 
-            WHERE started_at > datetime('now', '-{} days')
-            ORDER BY started_at DESC
-            """.format(
-                days
-            )
+            query = f"""
+            SELECT i.*, i.id AS interview_id,
+                   jd.title AS job_title, jd.company,
+                   r.candidate_name, r.email,
+                   mr.overall_match_score,
+                   m.final_score, m.final_decision
+            FROM {self._interview_summary_source()} m
+            JOIN interviews i ON i.id = m.interview_id
+            LEFT JOIN job_descriptions jd ON i.job_description_id = jd.id
+            LEFT JOIN resumes r ON i.resume_id = r.id
+            LEFT JOIN match_ratings mr
+                ON (i.job_description_id = mr.job_description_id AND i.resume_id = mr.resume_id)
+            WHERE m.started_at > datetime('now', printf('-%d days', ?))
+            ORDER BY m.started_at DESC
+            """
 
-            rows = self.db_manager.execute_query(query)
+            rows = self.db_manager.execute_query(query, (int(days),))
             return [dict(row) for row in rows]
-        except Exception as e:
-            logger.error(f"Error getting recent interviews: {e}")
+        except Exception:
+            logger.exception("Error getting recent interviews")
             return []
 
+    def get_recent_interview_stats(self, days: int = 7) -> Dict[str, int]:
+        """Count recent interviews and hire/reject decisions in one query"""
+        try:
+            query = f"""
+            SELECT COUNT(*) AS total,
+                   COUNT(*) FILTER (WHERE final_decision = 'hire') AS hired,
+                   COUNT(*) FILTER (WHERE final_decision = 'reject') AS rejected
+            FROM {self._interview_summary_source()}
+            WHERE started_at > datetime('now', printf('-%d days', ?))
+            """
+
+            rows = self.db_manager.execute_query(query, (int(days),))
+            return dict(rows[0]) if rows else {"total": 0, "hired": 0, "rejected": 0}
+        except Exception:
+            logger.exception("Error getting recent interview stats")
+            return {"total": 0, "hired": 0, "rejected": 0}
+
     def search_candidates(self, search_term: str) -> List[Dict[str, Any]]:
-        """Search candidates by name or email"""
+        """Search candidates by name or email
+
+        Uses the resumes_fts full-text index (prefix match on each word of the
+        search term) when available, otherwise a LIKE scan.
+        """
         try:
+            match = _fts_match_query(search_term)
+            if match and self.db_manager.has_search_index:
+                query = """
+                SELECT r.*
+                FROM resumes_fts f
+                JOIN resumes r ON r.id = f.rowid
+                WHERE resumes_fts MATCH ? AND r.is_active = 1
+                ORDER BY f.rank
+                """
+                rows = self.db_manager.execute_query(query, (match,))
+                return [dict(row) for row in rows]
+
             query = """
-            SELECT * FROM resumes 
+            SELECT * FROM resumes
             WHERE (candidate_name LIKE ? OR email LIKE ?) AND is_active = 1
             ORDER BY candidate_name
             """
@@ -848,12 +1511,82 @@ class InterviewDatabaseOps:
             term = f"%{search_term}%"
             rows = self.db_manager.execute_query(query, (term, term))
             return [dict(row) for row in rows]
-        except Exception as e:
-            logger.error(f"Error searching candidates: {e}")
+        except Exception:
+            logger.exception("Error searching candidates")
             return []
 
+    def search_candidate_interviews(self, search_term: str) -> List[Dict[str, Any]]:
+        """Search candidates like search_candidates() and join their interviews
+
+        Returns one row per candidate interview (resume_id, candidate_name,
+        email, id, session_id, status, final_score, final_decision), grouped by
+        candidate with the newest interviews first. Candidates without
+        interviews get a single row whose interview columns are None.
+        """
+        select = """
+        SELECT r.id AS resume_id, r.candidate_name, r.email,
+               i.id, i.session_id, i.status, fs.final_score, fs.final_decision
+        """
+        joins = """
+        LEFT JOIN interviews i ON i.resume_id = r.id
+        LEFT JOIN final_scores fs ON fs.interview_id = i.id
+        """
+        try:
+            match = _fts_match_query(search_term)
+            if match and self.db_manager.has_search_index:
+                query = f"""
+                {select}
+                FROM resumes_fts f
+                JOIN resumes r ON r.id = f.rowid
+                {joins}
+                WHERE resumes_fts MATCH ? AND r.is_active = 1
+                ORDER BY f.rank, r.id, i.created_at DESC
+                """
+                params = (match,)
+            else:
+                query = f"""
+                {select}
+                FROM resumes r
+                {joins}
+                WHERE (r.candidate_name LIKE ? OR r.email LIKE ?) AND r.is_active = 1
+                ORDER BY r.candidate_name, r.id, i.created_at DESC
+                """
+                term = f"%{search_term}%"
+                params = (term, term)
+
+            rows = self.db_manager.execute_query(query, params)
+            return [dict(row) for row in rows]
+        except Exception:
+            logger.exception("Error searching candidate interviews")
+            return []
+
+
+# Shared InterviewDatabaseOps per database path, handed out by get_db_ops()
+_DB_OPS_INSTANCES: Dict[str, InterviewDatabaseOps] = {}
+_DB_OPS_LOCK = threading.Lock()
+
 
 # Convenience functions for easy import
 def get_db_ops(db_path: str = "db/interview_database.db") -> InterviewDatabaseOps:
-    """Get database operations instance"""
-    return InterviewDatabaseOps(db_path)
+    """Get the shared database operations instance for a database path
+
+    Reusing one instance keeps its connections, statement cache and row cache
+    warm across calls.
+    """
+    key = os.path.abspath(db_path)
+    db_ops = _DB_OPS_INSTANCES.get(key)
+    if db_ops is not None:
+        return db_ops  # warm path: no lock, just the dict lookup
+    with _DB_OPS_LOCK:
+        db_ops = _DB_OPS_INSTANCES.get(key)
+        if db_ops is None:
+            db_ops = _DB_OPS_INSTANCES[key] = InterviewDatabaseOps(db_path)
+        return db_ops
+
+
+def close_db_ops() -> None:
+    """Close the connections of every shared instance; they reopen on next use"""
+    with _DB_OPS_LOCK:
+        for db_ops in _DB_OPS_INSTANCES.values():
+            db_ops.flush_events()
+            db_ops.db_manager.close()
@@ -31,7 +31,7 @@ CREATE TABLE assessment_questions (
     run_code_template TEXT,
     submit_code_template TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 -- Table to store candidate resumes
@@ -103,6 +103,7 @@ CREATE TABLE interview_recordings (
     recording_type VARCHAR(50) NOT NULL, -- 'audio', 'video', 'screen_share', 'transcript'
     file_path VARCHAR(500),
     transcript_text TEXT,
+    transcript_text_zstd BLOB, -- zstd-compressed transcript_text for large transcripts
     transcript_jsonl_path VARCHAR(500), -- Path to detailed JSONL transcript
     formatted_transcript_path VARCHAR(500), -- Path to formatted transcript
     duration_seconds INTEGER,
@@ -188,6 +189,26 @@ CREATE TABLE system_events (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Raw model responses keyed by a hash of the scoring inputs, so re-scoring the
+-- same transcript, resume and job description doesn't call the model again
+CREATE TABLE IF NOT EXISTS scoring_cache (
+    cache_key TEXT PRIMARY KEY, -- SHA-256 of the scoring inputs, prompt and model
+    response_text TEXT NOT NULL,
+    model_version VARCHAR(100),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Transcript embeddings of scored interviews, for reusing a response when the
+-- same interview's transcript is re-scored with only trivial changes
+CREATE TABLE IF NOT EXISTS scoring_embeddings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    interview_id INTEGER, -- Responses are only reused for the same interview
+    context_key TEXT NOT NULL, -- SHA-256 of the resume, job description, prompt and model
+    embedding BLOB NOT NULL, -- L2-normalized float32 transcript embedding
+    response_text TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Indexes for better performance
 CREATE INDEX idx_interviews_session_id ON interviews(session_id);
 CREATE INDEX idx_interviews_status ON interviews(status);
@@ -199,6 +220,20 @@ CREATE INDEX idx_final_scores_decision ON final_scores(final_decision);
 CREATE INDEX idx_system_events_type ON system_events(event_type);
 CREATE INDEX idx_system_events_entity ON system_events(entity_type, entity_id);
 
+-- Indexes for per-interview result lookups, recent activity and candidate search
+-- (also applied to existing databases by DatabaseManager.ensure_indexes)
+CREATE INDEX IF NOT EXISTS idx_scoring_analysis_interview ON scoring_analysis(interview_id);
+CREATE INDEX IF NOT EXISTS idx_final_scores_interview ON final_scores(interview_id);
+CREATE INDEX IF NOT EXISTS idx_feedback_interview_created ON interview_feedback(interview_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_recordings_interview ON interview_recordings(interview_id);
+CREATE INDEX IF NOT EXISTS idx_resumes_name_email ON resumes(candidate_name, email) WHERE is_active = 1;
+CREATE INDEX IF NOT EXISTS idx_interview_started ON interviews(started_at);
+CREATE INDEX IF NOT EXISTS idx_interviews_resume_created ON interviews(resume_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_interviews_created_id ON interviews(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_resumes_created_id ON resumes(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_job_descriptions_created_id ON job_descriptions(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_scoring_embeddings_interview ON scoring_embeddings(interview_id, context_key);
+
 -- Views for common queries
 CREATE VIEW interview_summary AS
 SELECT 
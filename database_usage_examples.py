@@ -5,7 +5,9 @@ Demonstrates how to integrate the database with your interview application
 """
 
 import json
-from datetime import datetime
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from database_operations import (
@@ -93,13 +95,15 @@ def example_complete_interview_workflow():
     # 4. Schedule Interview
     print("\n4. Creating interview session...")
     
+    # One clock read for both the session ID and the scheduled time
+    now = time.localtime()
     interview = Interview(
-        session_id="session_" + datetime.now().strftime("%Y%m%d_%H%M%S"),
+        session_id=time.strftime("session_%Y%m%d_%H%M%S", now),
         job_description_id=job_id,
         resume_id=resume_id,
         interview_link="https://meet.google.com/generated-link",
         status="scheduled",
-        scheduled_at=datetime.now().isoformat()
+        scheduled_at=time.strftime("%Y-%m-%dT%H:%M:%S", now)
     )
     
     interview_id = db_ops.create_interview(interview)
@@ -208,8 +212,21 @@ def example_integration_with_existing_files():
     # Process existing recording files
     recordings_dir = Path("recordings")
     
+    # Read the directory once and bucket its files by suffix
+    transcript_files, score_files = [], []
     if recordings_dir.exists():
-        for transcript_file in recordings_dir.glob("*formatted_transcript.txt"):
+        with os.scandir(recordings_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith("formatted_transcript.txt"):
+                    transcript_files.append(Path(entry.path))
+                elif entry.name.endswith("score.txt"):
+                    score_files.append(Path(entry.path))
+    
+    if transcript_files:
+        # Find interviews still missing a transcript, read those files in
+        # parallel, then insert them in one transaction
+        pending = []
+        for transcript_file in transcript_files:
             print(f"Processing: {transcript_file}")
             
             # Extract session ID from filename
@@ -226,22 +243,29 @@ def example_integration_with_existing_files():
                 transcript_exists = any(r["recording_type"] == "transcript" for r in recordings)
                 
                 if not transcript_exists:
-                    with open(transcript_file, 'r', encoding='utf-8') as f:
-                        transcript_text = f.read()
-                    
-                    db_ops.add_interview_recording(
-                        interview["id"], "transcript",
-                        transcript_text=transcript_text,
-                        formatted_transcript_path=str(transcript_file)
-                    )
-                    print(f"✅ Added transcript to interview")
+                    pending.append((interview["id"], transcript_file))
                 else:
                     print(f"ℹ️  Transcript already exists for this interview")
             else:
                 print(f"⚠️  No interview found for session: {session_id}")
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                texts = pool.map(
+                    lambda item: item[1].read_text(encoding='utf-8'), pending
+                )
+                new_recordings = [
+                    (interview_id, "transcript", None, transcript_text,
+                     None, str(transcript_file), None, None, None)
+                    for (interview_id, transcript_file), transcript_text in zip(pending, texts)
+                ]
+            
+            with db_ops.bulk_load():
+                added = db_ops.add_interview_recordings_bulk(new_recordings)
+            print(f"✅ Added {added} transcripts to interviews")
     
     # Process scoring files
-    for score_file in recordings_dir.glob("*score.txt"):
+    for score_file in score_files:
         print(f"\nProcessing score file: {score_file}")
         
         session_id = score_file.stem.replace("_score", "")
@@ -267,12 +291,12 @@ def example_database_queries():
     
     # Get recent interview statistics
     print("1. Recent Interview Statistics:")
-    recent_interviews = db_ops.get_recent_interviews(30)  # Last 30 days
+    recent_stats = db_ops.get_recent_interview_stats(30)  # Last 30 days
     
-    if recent_interviews:
-        total = len(recent_interviews)
-        hired = len([i for i in recent_interviews if i.get('final_decision') == 'hire'])
-        rejected = len([i for i in recent_interviews if i.get('final_decision') == 'reject'])
+    if recent_stats["total"]:
+        total = recent_stats["total"]
+        hired = recent_stats["hired"]
+        rejected = recent_stats["rejected"]
         
         print(f"   Total interviews: {total}")
         print(f"   Hired: {hired}")
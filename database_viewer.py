@@ -4,233 +4,397 @@ Simple database viewer for the Live Interview App
 Provides a command-line interface to explore database contents
 """
 
+import argparse
 import json
+import sqlite3
+import sys
+import time
 from datetime import datetime
+from functools import lru_cache
+from itertools import groupby, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any
-
-from database_operations import get_db_ops
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sized, Tuple
+
+from database_operations import InterviewDatabaseOps, get_db_ops
+from init_database import READ_CONNECTION_PRAGMAS
+
+try:
+    import orjson
+except ImportError:  # optional speedup for --format ndjson
+    orjson = None
+
+SEPARATOR = "=" * 60
+TITLE_RULE = "=" * 20
+TABLE_RULE = "-" * 80
+INTERVIEW_RULE = "-" * 100
+
+# The viewer only reads (apart from custom update queries, which go through
+# the writer), so its readers get a larger memory map than the default
+VIEWER_READ_PRAGMAS = READ_CONNECTION_PRAGMAS + ("PRAGMA mmap_size = 536870912",)  # 512 MiB
+
+# Seconds the overview reuses its statistics and file info before refreshing
+STATS_TTL = 5.0
+
+_overview_cache = {"ts": 0.0, "value": None}
+
+# interview_summary columns shown by view_interviews
+INTERVIEW_COLUMNS = (
+    "interview_id", "session_id", "candidate_name", "job_title", "company", "status",
+    "overall_match_score", "final_score", "final_decision", "duration_minutes", "started_at",
+)
+
+# NDJSON output is flushed every this many rows
+NDJSON_FLUSH_ROWS = 100
+
+# (heading, results key, (label, column, suffix) fields) printed in order by
+# view_detailed_interview
+DETAIL_SECTIONS = (
+    ("BASIC INFORMATION:", "interview", (
+        ("Session ID", "session_id", ""),
+        ("Status", "status", ""),
+        ("Duration", "duration_minutes", " minutes"),
+        ("Started", "started_at", ""),
+        ("Ended", "ended_at", ""),
+    )),
+    ("\nCANDIDATE:", "resume", (
+        ("Name", "candidate_name", ""),
+        ("Email", "email", ""),
+        ("Experience", "experience_years", " years"),
+        ("Education", "education", ""),
+    )),
+    ("\nPOSITION:", "job_description", (
+        ("Title", "title", ""),
+        ("Company", "company", ""),
+        ("Location", "location", ""),
+        ("Salary Range", "salary_range", ""),
+    )),
+    ("\nMATCH RATING:", "match_rating", (
+        ("Overall Match", "overall_match_score", "%"),
+        ("Reasoning", "match_reasoning", ""),
+    )),
+    ("\nSCORING ANALYSIS:", "scoring_analysis", (
+        ("Technical Skills", "technical_skills_score", "/10"),
+        ("Problem Solving", "problem_solving_score", "/10"),
+        ("Communication", "communication_score", "/10"),
+        ("Cultural Fit", "cultural_fit_score", "/10"),
+        ("Resume Match", "resume_match_score", "/10"),
+        ("Interview Performance", "interview_performance_score", "/10"),
+        ("Recommendation", "recommendation", ""),
+    )),
+    ("\nFINAL DECISION:", "final_score", (
+        ("Final Score", "final_score", "/10"),
+        ("Decision", "final_decision", ""),
+        ("Pass/Fail", "pass_fail_status", ""),
+        ("Confidence", "confidence_level", ""),
+        ("Reasoning", "decision_reasoning", ""),
+    )),
+)
+
+# Sections skipped entirely when the interview has no such row
+OPTIONAL_DETAIL_SECTIONS = {"scoring_analysis", "final_score"}
+
+# Columns shown upper-cased in the detail view
+UPPERCASE_DETAIL_COLUMNS = {"final_decision"}
+
+
+@lru_cache(maxsize=1024)
+def _first_json_list_items(text: str, count: int) -> str:
+    """Decode a JSON list once per stored string and join its first items"""
+    return ", ".join(json.loads(text)[:count])
+
+
+def first_list_items(value, count: int = 3) -> str:
+    """First items of a list, or of a JSON-encoded list as stored in the DB"""
+    if isinstance(value, str):
+        return _first_json_list_items(value, count)
+    return ", ".join(value[:count])
 
 
 def print_separator(title: str = ""):
     """Print a formatted separator"""
     if title:
-        print(f"\n{'='*20} {title} {'='*20}")
+        print(f"\n{TITLE_RULE} {title} {TITLE_RULE}")
     else:
-        print("=" * 60)
-
-
-def print_table_data(data: List[Dict], title: str, max_rows: int = 10):
-    """Print table data in a formatted way"""
-    if not data:
+        print(SEPARATOR)
+
+
+def format_resume_row(item: Mapping) -> List[str]:
+    """Resume fields for print_table_data"""
+    return [
+        f"   Name: {item.get('candidate_name', 'N/A')}",
+        f"   Email: {item.get('email', 'N/A')}",
+        f"   Experience: {item.get('experience_years', 'N/A')} years",
+    ]
+
+
+def format_job_row(item: Mapping) -> List[str]:
+    """Job description fields for print_table_data"""
+    return [
+        f"   Title: {item.get('title', 'N/A')}",
+        f"   Company: {item.get('company', 'N/A')}",
+        f"   Location: {item.get('location', 'N/A')}",
+    ]
+
+
+def format_interview_row(item: Mapping) -> List[str]:
+    """Interview fields for print_table_data"""
+    return [
+        f"   Session: {item.get('session_id', 'N/A')}",
+        f"   Status: {item.get('status', 'N/A')}",
+        f"   Duration: {item.get('duration_minutes', 'N/A')} minutes",
+    ]
+
+
+def format_match_row(item: Mapping) -> List[str]:
+    """Match rating fields for print_table_data"""
+    return [
+        f"   Match Score: {item.get('overall_match_score', 'N/A')}%",
+        f"   Reasoning: {item.get('match_reasoning', 'N/A')[:100]}...",
+    ]
+
+
+def format_score_row(item: Mapping) -> List[str]:
+    """Final score fields for print_table_data"""
+    return [
+        f"   Final Score: {item.get('final_score', 'N/A')}/10",
+        f"   Decision: {item.get('final_decision', 'N/A')}",
+        f"   Confidence: {item.get('confidence_level', 'N/A')}",
+    ]
+
+
+# (identifying columns, field formatter) for print_table_data, checked in order
+ROW_FORMATTERS = (
+    (frozenset({"candidate_name"}), format_resume_row),
+    (frozenset({"title", "company"}), format_job_row),
+    (frozenset({"session_id"}), format_interview_row),
+    (frozenset({"overall_match_score"}), format_match_row),
+    (frozenset({"final_score"}), format_score_row),
+)
+
+
+def print_table_data(
+    data: Iterable[Mapping], title: str, max_rows: int = 10, total: Optional[int] = None
+):
+    """Print table data in a formatted way
+
+    Only the first max_rows items are read from data, so cursors can be
+    passed directly. total is the full row count shown in the header; it
+    defaults to len(data) for sized collections.
+    """
+    rows = [dict(row) for row in islice(data, max_rows)]
+    if not rows:
         print(f"No {title.lower()} found.")
         return
 
-    print(f"\n{title} ({len(data)} total, showing first {min(len(data), max_rows)}):")
-    print("-" * 80)
-
-    for i, item in enumerate(data[:max_rows]):
-        print(f"{i+1}. ID: {item.get('id', 'N/A')}")
-
-        # Show relevant fields based on data type
-        if "candidate_name" in item:
-            print(f"   Name: {item.get('candidate_name', 'N/A')}")
-            print(f"   Email: {item.get('email', 'N/A')}")
-            print(f"   Experience: {item.get('experience_years', 'N/A')} years")
+    if total is None:
+        total = len(data) if isinstance(data, Sized) else len(rows)
+    out = [f"\n{title} ({total} total, showing first {len(rows)}):", TABLE_RULE]
 
-        elif "title" in item and "company" in item:
-            print(f"   Title: {item.get('title', 'N/A')}")
-            print(f"   Company: {item.get('company', 'N/A')}")
-            print(f"   Location: {item.get('location', 'N/A')}")
+    # All rows share one schema, so pick the field formatter once
+    first_keys = rows[0].keys()
+    format_fields = next(
+        (formatter for keys, formatter in ROW_FORMATTERS if keys <= first_keys),
+        lambda item: [],
+    )
 
-        elif "session_id" in item:
-            print(f"   Session: {item.get('session_id', 'N/A')}")
-            print(f"   Status: {item.get('status', 'N/A')}")
-            print(f"   Duration: {item.get('duration_minutes', 'N/A')} minutes")
+    for i, item in enumerate(rows):
+        out.append(f"{i+1}. ID: {item.get('id', 'N/A')}")
+        out.extend(format_fields(item))
+        out.append(f"   Created: {item.get('created_at', 'N/A')}")
+        out.append("")
 
-        elif "overall_match_score" in item:
-            print(f"   Match Score: {item.get('overall_match_score', 'N/A')}%")
-            print(f"   Reasoning: {item.get('match_reasoning', 'N/A')[:100]}...")
+    sys.stdout.write("\n".join(out) + "\n")
 
-        elif "final_score" in item:
-            print(f"   Final Score: {item.get('final_score', 'N/A')}/10")
-            print(f"   Decision: {item.get('final_decision', 'N/A')}")
-            print(f"   Confidence: {item.get('confidence_level', 'N/A')}")
 
-        print(f"   Created: {item.get('created_at', 'N/A')}")
-        print()
-
-
-def view_database_overview():
+def view_database_overview(db_ops: Optional[InterviewDatabaseOps] = None):
     """Show database overview and statistics"""
     print_separator("DATABASE OVERVIEW")
 
-    db_ops = get_db_ops()
-
-    # Get statistics
-    stats = db_ops.db_manager.get_database_stats()
-
-    print("Database Statistics:")
+    # Statistics and file info, refreshed at most every STATS_TTL seconds
+    now = time.monotonic()
+    if _overview_cache["value"] is None or now - _overview_cache["ts"] >= STATS_TTL:
+        db_ops = db_ops or get_db_ops()
+        stats = db_ops.db_manager.get_database_stats()
+        db_path = Path("db/interview_database.db")
+        file_stat = db_path.stat() if db_path.exists() else None
+        _overview_cache.update(ts=now, value=(stats, file_stat))
+    stats, file_stat = _overview_cache["value"]
+
+    out = ["Database Statistics:"]
     for key, value in stats.items():
         formatted_key = key.replace("_", " ").title()
-        print(f"  {formatted_key}: {value}")
+        out.append(f"  {formatted_key}: {value}")
 
     # Check database file
-    db_path = Path("db/interview_database.db")
-    if db_path.exists():
-        size_mb = db_path.stat().st_size / (1024 * 1024)
-        print(f"  Database File Size: {size_mb:.2f} MB")
-        print(f"  Last Modified: {datetime.fromtimestamp(db_path.stat().st_mtime)}")
+    if file_stat is not None:
+        size_mb = file_stat.st_size / (1024 * 1024)
+        out.append(f"  Database File Size: {size_mb:.2f} MB")
+        out.append(f"  Last Modified: {datetime.fromtimestamp(file_stat.st_mtime)}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def view_job_descriptions():
+def print_active_rows(db_ops: InterviewDatabaseOps, table: str, title: str, max_rows: int = 10):
+    """Print the newest active rows of a table; the total comes from the same query"""
+    query = f"""
+    SELECT *, COUNT(*) OVER () AS total_rows
+    FROM {table}
+    WHERE is_active = 1
+    ORDER BY created_at DESC
+    LIMIT ?
+    """
+    rows = db_ops.db_manager.execute_query(query, (max_rows,))
+    print_table_data(rows, title, max_rows, total=rows[0]["total_rows"] if rows else 0)
+
+
+def view_job_descriptions(db_ops: Optional[InterviewDatabaseOps] = None):
     """View all job descriptions"""
     print_separator("JOB DESCRIPTIONS")
 
-    db_ops = get_db_ops()
-    jobs = db_ops.list_job_descriptions()
-    print_table_data(jobs, "Job Descriptions")
+    db_ops = db_ops or get_db_ops()
+    print_active_rows(db_ops, "job_descriptions", "Job Descriptions")
 
 
-def view_resumes():
+def view_resumes(db_ops: Optional[InterviewDatabaseOps] = None):
     """View all resumes"""
     print_separator("CANDIDATE RESUMES")
 
-    db_ops = get_db_ops()
-    resumes = db_ops.list_resumes()
-    print_table_data(resumes, "Resumes")
+    db_ops = db_ops or get_db_ops()
+    print_active_rows(db_ops, "resumes", "Resumes")
 
 
-def view_interviews():
-    """View all interviews"""
-    print_separator("INTERVIEWS")
+def write_ndjson(rows, columns):
+    """Write a schema line, then one JSON object per row, flushing as we go"""
+    dumps = (lambda obj: orjson.dumps(obj).decode()) if orjson else json.dumps
+    write = sys.stdout.write
+    write(dumps({"schema": list(columns)}) + "\n")
+    for n, row in enumerate(rows, start=1):
+        write(dumps(dict(zip(columns, row))) + "\n")
+        if n % NDJSON_FLUSH_ROWS == 0:
+            sys.stdout.flush()
+    sys.stdout.flush()
 
-    db_ops = get_db_ops()
-    query = "SELECT * FROM interview_summary ORDER BY created_at DESC"
-    interviews = [dict(row) for row in db_ops.db_manager.execute_query(query)]
 
-    if not interviews:
-        print("No interviews found.")
-        return
+def iter_interviews(
+    db_ops: InterviewDatabaseOps, page_size: int, after: Optional[Tuple[str, int]] = None
+) -> Iterator[sqlite3.Row]:
+    """Yield interview_summary rows newest first, starting after a keyset cursor
 
-    print(f"Interviews ({len(interviews)} total):")
-    print("-" * 100)
-
-    for i, interview in enumerate(interviews[:10]):
-        print(f"{i+1}. Interview ID: {interview.get('interview_id', 'N/A')}")
-        print(f"   Session: {interview.get('session_id', 'N/A')}")
-        print(f"   Candidate: {interview.get('candidate_name', 'N/A')}")
-        print(
-            f"   Job: {interview.get('job_title', 'N/A')} at {interview.get('company', 'N/A')}"
-        )
-        print(f"   Status: {interview.get('status', 'N/A')}")
-        print(f"   Match Score: {interview.get('overall_match_score', 'N/A')}%")
-        print(f"   Final Score: {interview.get('final_score', 'N/A')}/10")
-        print(f"   Decision: {interview.get('final_decision', 'N/A')}")
-        print(f"   Duration: {interview.get('duration_minutes', 'N/A')} minutes")
-        print(
-            f"   Date: {interview.get('started_at', interview.get('created_at', 'N/A'))}"
-        )
-        print()
+    Rows are fetched page_size at a time with WHERE (created_at, interview_id)
+    < cursor, so each page is an index seek rather than an OFFSET scan. Each
+    row carries INTERVIEW_COLUMNS followed by created_at.
+    """
+    while True:
+        condition = "WHERE (created_at, interview_id) < (?, ?)" if after else ""
+        query = f"""
+        SELECT {", ".join(INTERVIEW_COLUMNS)}, created_at
+        FROM interview_summary
+        {condition}
+        ORDER BY created_at DESC, interview_id DESC
+        LIMIT ?
+        """
+        params = (*after, page_size) if after else (page_size,)
+        count = 0
+        for row in db_ops.db_manager.iter_query(query, params):
+            count += 1
+            after = (row["created_at"], row["interview_id"])
+            yield row
+        if count < page_size:
+            return
+
+
+def view_interviews(
+    page_size: int = 10,
+    after: Optional[Tuple[str, int]] = None,
+    first_number: int = 1,
+    db_ops: Optional[InterviewDatabaseOps] = None,
+) -> Optional[Tuple[str, int]]:
+    """View one page of interviews, newest first
+
+    One row past the page is fetched, so a next page is only offered when it
+    has rows. The total comes from DatabaseManager.count_rows().
+
+    Returns:
+        The keyset cursor for the next page, or None after the last page
+    """
+    db_ops = db_ops or get_db_ops()
+    rows = list(islice(iter_interviews(db_ops, page_size + 1, after), page_size + 1))
+    has_more = len(rows) > page_size
 
+    print_separator("INTERVIEWS")
 
-def view_detailed_interview(interview_id: int):
+    out = []
+    cursor = None
+    if rows:
+        out.append(f"Interviews ({db_ops.db_manager.count_rows('interviews')} total):")
+        out.append(INTERVIEW_RULE)
+    for i, interview in enumerate(rows[:page_size], start=first_number):
+        cursor = (interview["created_at"], interview["interview_id"])
+        out.append(f"{i}. Interview ID: {interview['interview_id']}")
+        out.append(f"   Session: {interview['session_id']}")
+        out.append(f"   Candidate: {interview['candidate_name']}")
+        out.append(f"   Job: {interview['job_title']} at {interview['company']}")
+        out.append(f"   Status: {interview['status']}")
+        out.append(f"   Match Score: {interview['overall_match_score']}%")
+        out.append(f"   Final Score: {interview['final_score']}/10")
+        out.append(f"   Decision: {interview['final_decision']}")
+        out.append(f"   Duration: {interview['duration_minutes']} minutes")
+        out.append(f"   Date: {interview['started_at']}")
+        out.append("")
+
+    if not rows:
+        out.append("No interviews found.")
+    sys.stdout.write("\n".join(out) + "\n")
+    return cursor if has_more else None
+
+
+def view_detailed_interview(interview_id: int, db_ops: Optional[InterviewDatabaseOps] = None):
     """View detailed interview results"""
     print_separator(f"INTERVIEW DETAILS - ID: {interview_id}")
 
-    db_ops = get_db_ops()
+    db_ops = db_ops or get_db_ops()
     results = db_ops.get_interview_full_results(interview_id)
 
     if not results:
         print(f"No interview found with ID: {interview_id}")
         return
 
-    # Basic interview info
-    interview = results.get("interview", {})
-    job = results.get("job_description", {})
-    resume = results.get("resume", {})
-    match_rating = results.get("match_rating", {})
-    scoring = results.get("scoring_analysis", {})
-    final_score = results.get("final_score", {})
-
-    print("BASIC INFORMATION:")
-    print(f"  Session ID: {interview.get('session_id', 'N/A')}")
-    print(f"  Status: {interview.get('status', 'N/A')}")
-    print(f"  Duration: {interview.get('duration_minutes', 'N/A')} minutes")
-    print(f"  Started: {interview.get('started_at', 'N/A')}")
-    print(f"  Ended: {interview.get('ended_at', 'N/A')}")
-
-    print("\nCANDIDATE:")
-    print(f"  Name: {resume.get('candidate_name', 'N/A')}")
-    print(f"  Email: {resume.get('email', 'N/A')}")
-    print(f"  Experience: {resume.get('experience_years', 'N/A')} years")
-    print(f"  Education: {resume.get('education', 'N/A')}")
-
-    print("\nPOSITION:")
-    print(f"  Title: {job.get('title', 'N/A')}")
-    print(f"  Company: {job.get('company', 'N/A')}")
-    print(f"  Location: {job.get('location', 'N/A')}")
-    print(f"  Salary Range: {job.get('salary_range', 'N/A')}")
-
-    print("\nMATCH RATING:")
-    print(f"  Overall Match: {match_rating.get('overall_match_score', 'N/A')}%")
-    print(f"  Reasoning: {match_rating.get('match_reasoning', 'N/A')}")
-
-    if scoring:
-        print("\nSCORING ANALYSIS:")
-        print(f"  Technical Skills: {scoring.get('technical_skills_score', 'N/A')}/10")
-        print(f"  Problem Solving: {scoring.get('problem_solving_score', 'N/A')}/10")
-        print(f"  Communication: {scoring.get('communication_score', 'N/A')}/10")
-        print(f"  Cultural Fit: {scoring.get('cultural_fit_score', 'N/A')}/10")
-        print(f"  Resume Match: {scoring.get('resume_match_score', 'N/A')}/10")
-        print(
-            f"  Interview Performance: {scoring.get('interview_performance_score', 'N/A')}/10"
-        )
-        print(f"  Recommendation: {scoring.get('recommendation', 'N/A')}")
-
-        # Key strengths
-        strengths = scoring.get("key_strengths")
-        if strengths:
-            try:
-                strengths_list = (
-                    json.loads(strengths) if isinstance(strengths, str) else strengths
-                )
-                print(f"  Key Strengths: {', '.join(strengths_list[:3])}")
-            except:
-                print(f"  Key Strengths: {strengths}")
-
-        # Areas for improvement
-        improvements = scoring.get("areas_for_improvement")
-        if improvements:
-            try:
-                improvements_list = (
-                    json.loads(improvements)
-                    if isinstance(improvements, str)
-                    else improvements
-                )
-                print(f"  Areas for Improvement: {', '.join(improvements_list[:3])}")
-            except:
-                print(f"  Areas for Improvement: {improvements}")
-
-    if final_score:
-        print("\nFINAL DECISION:")
-        print(f"  Final Score: {final_score.get('final_score', 'N/A')}/10")
-        print(f"  Decision: {final_score.get('final_decision', 'N/A').upper()}")
-        print(f"  Pass/Fail: {final_score.get('pass_fail_status', 'N/A')}")
-        print(f"  Confidence: {final_score.get('confidence_level', 'N/A')}")
-        print(f"  Reasoning: {final_score.get('decision_reasoning', 'N/A')}")
+    lines = []
+    for heading, key, fields in DETAIL_SECTIONS:
+        record = results.get(key) or {}
+        if key in OPTIONAL_DETAIL_SECTIONS and not record:
+            continue
+        lines.append(heading)
+        for label, column, suffix in fields:
+            value = record.get(column, "N/A")
+            if column in UPPERCASE_DETAIL_COLUMNS:
+                value = str(value).upper()
+            lines.append(f"  {label}: {value}{suffix}")
+
+        if key == "scoring_analysis":
+            for label, column in (
+                ("Key Strengths", "key_strengths"),
+                ("Areas for Improvement", "areas_for_improvement"),
+            ):
+                value = record.get(column)
+                if value:
+                    try:
+                        lines.append(f"  {label}: {first_list_items(value)}")
+                    except (ValueError, TypeError):
+                        lines.append(f"  {label}: {value}")
 
     # Show recordings
     recordings = results.get("recordings", [])
     if recordings:
-        print(f"\nRECORDINGS ({len(recordings)}):")
+        lines.append(f"\nRECORDINGS ({len(recordings)}):")
         for rec in recordings:
-            print(
-                f"  - {rec.get('recording_type', 'N/A')}: {rec.get('file_path', 'N/A')}"
-            )
+            lines.append(f"  - {rec.get('recording_type', 'N/A')}: {rec.get('file_path', 'N/A')}")
 
+    print("\n".join(lines))
 
-def search_interviews():
+
+def search_interviews(db_ops: Optional[InterviewDatabaseOps] = None):
     """Search interviews by candidate name"""
     candidate_name = input("Enter candidate name to search: ").strip()
     if not candidate_name:
@@ -238,36 +402,31 @@ def search_interviews():
 
     print_separator(f"SEARCH RESULTS: '{candidate_name}'")
 
-    db_ops = get_db_ops()
-    candidates = db_ops.search_candidates(candidate_name)
+    # Candidates and their interviews in one query, grouped per candidate below
+    db_ops = db_ops or get_db_ops()
+    rows = db_ops.search_candidate_interviews(candidate_name)
 
-    if not candidates:
+    if not rows:
         print(f"No candidates found matching '{candidate_name}'")
         return
 
+    candidates = [
+        (candidate, list(group))
+        for candidate, group in groupby(rows, key=itemgetter("resume_id"))
+    ]
     print(f"Found {len(candidates)} candidates:")
-    for candidate in candidates:
-        print(
-            f"  - {candidate.get('candidate_name', 'N/A')} ({candidate.get('email', 'N/A')})"
-        )
-
-        # Find interviews for this candidate
-        query = """
-        SELECT i.id, i.session_id, i.status, fs.final_score, fs.final_decision
-        FROM interviews i
-        LEFT JOIN final_scores fs ON i.id = fs.interview_id
-        WHERE i.resume_id = ?
-        ORDER BY i.created_at DESC
-        """
-        interviews = db_ops.db_manager.execute_query(query, (candidate["id"],))
+    for _, group in candidates:
+        first = group[0]
+        print(f"  - {first['candidate_name'] or 'N/A'} ({first['email'] or 'N/A'})")
 
+        interviews = [row for row in group if row["id"] is not None]
         if interviews:
             print(f"    Interviews ({len(interviews)}):")
             for interview in interviews:
-                score = interview[3] if interview[3] else "N/A"
-                decision = interview[4] if interview[4] else "N/A"
+                score = interview["final_score"] if interview["final_score"] else "N/A"
+                decision = interview["final_decision"] if interview["final_decision"] else "N/A"
                 print(
-                    f"      • ID {interview[0]}: {interview[2]} - Score: {score}/10 - Decision: {decision}"
+                    f"      • ID {interview['id']}: {interview['status']} - Score: {score}/10 - Decision: {decision}"
                 )
         else:
             print("    No interviews found")
@@ -276,6 +435,9 @@ def search_interviews():
 
 def main_menu():
     """Display main menu and handle user choices"""
+    # One shared instance (and its open connections) for the whole session
+    db_ops = get_db_ops()
+    db_ops.db_manager.set_read_pragmas(VIEWER_READ_PRAGMAS)
     while True:
         print_separator("LIVE INTERVIEW DATABASE VIEWER")
         print("1. Database Overview")
@@ -291,30 +453,33 @@ def main_menu():
 
         try:
             if choice == "1":
-                view_database_overview()
+                view_database_overview(db_ops)
             elif choice == "2":
-                view_job_descriptions()
+                view_job_descriptions(db_ops)
             elif choice == "3":
-                view_resumes()
+                view_resumes(db_ops)
             elif choice == "4":
-                view_interviews()
+                cursor, shown = None, 0
+                while True:
+                    cursor = view_interviews(after=cursor, first_number=shown + 1, db_ops=db_ops)
+                    shown += 10
+                    if cursor is None or input("Show more? (y/N): ").strip().lower() != "y":
+                        break
             elif choice == "5":
                 interview_id = input("Enter interview ID: ").strip()
                 if interview_id.isdigit():
-                    view_detailed_interview(int(interview_id))
+                    view_detailed_interview(int(interview_id), db_ops)
                 else:
                     print("Invalid interview ID")
             elif choice == "6":
-                search_interviews()
+                search_interviews(db_ops)
             elif choice == "7":
                 query = input("Enter custom SQL query: ").strip()
                 if query.lower().startswith("select"):
-                    db_ops = get_db_ops()
                     results = db_ops.db_manager.execute_query(query)
                     for row in results:
                         print(dict(row))
                 else:
-                    db_ops = get_db_ops()
                     db_ops.db_manager.execute_update(query)
                     print("Query executed successfully.")
             elif choice == "8":
@@ -333,6 +498,21 @@ def main_menu():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Explore the Live Interview database")
+    parser.add_argument(
+        "--format",
+        choices=("text", "ndjson"),
+        default="text",
+        help="text opens the interactive menu; ndjson prints interviews as JSON lines",
+    )
+    parser.add_argument(
+        "--page", type=int, help="Print only this page (1-based) of --format ndjson output"
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=100, help="Rows fetched per query for --format ndjson"
+    )
+    args = parser.parse_args()
+
     # Check if database exists
     db_path = Path("db/interview_database.db")
     if not db_path.exists():
@@ -340,5 +520,18 @@ if __name__ == "__main__":
         print("Please run 'python init_database.py' first to create the database.")
         exit(1)
 
+    if args.format == "ndjson":
+        db_ops = get_db_ops()
+        db_ops.db_manager.set_read_pragmas(VIEWER_READ_PRAGMAS)
+        rows = iter_interviews(db_ops, args.page_size)
+        if args.page is not None:
+            start = (max(args.page, 1) - 1) * args.page_size
+            rows = islice(rows, start, start + args.page_size)
+        write_ndjson(rows, INTERVIEW_COLUMNS)
+        exit(0)
+
+    # Block-buffer output even on a terminal; input() flushes before each prompt
+    sys.stdout.reconfigure(line_buffering=False)
+
     print("Welcome to the Live Interview Database Viewer!")
     main_menu()
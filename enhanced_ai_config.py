@@ -4,6 +4,9 @@ Enhanced AI Interview Configuration
 Provides improved prompts and context management for more intelligent interviews
 """
 
+from functools import lru_cache
+from typing import Optional, Tuple
+
 ENHANCED_SYSTEM_PROMPT = """
 You are ALEX, a Senior Technical Interviewer with 10+ years of experience conducting interviews at top tech companies. You are known for your professionalism, empathy, and ability to assess candidates fairly while creating a positive interview experience.
 
@@ -92,6 +95,20 @@ def get_enhanced_ai_config(
     """
     Generate enhanced AI configuration with specific job and candidate context
     """
+    session_info = None
+    if session_context:
+        session_info = (
+            session_context.get("session_id", "Unknown"),
+            session_context.get("interview_type", "Technical Screen"),
+        )
+    return _build_enhanced_prompt(job_description, resume, session_info)
+
+
+@lru_cache(maxsize=256)
+def _build_enhanced_prompt(
+    job_description: str, resume: str, session_info: Optional[Tuple[str, str]]
+) -> str:
+    """Assemble the prompt; cached on the only session fields it uses"""
     context_section = f"""
 📄 INTERVIEW CONTEXT:
 
@@ -102,11 +119,12 @@ CANDIDATE BACKGROUND:
 {resume}
 """
 
-    if session_context:
+    if session_info:
+        session_id, interview_type = session_info
         additional_context = f"""
 SESSION INFORMATION:
-- Session ID: {session_context.get('session_id', 'Unknown')}
-- Interview Type: {session_context.get('interview_type', 'Technical Screen')}
+- Session ID: {session_id}
+- Interview Type: {interview_type}
 - Estimated Duration: 15 minutes
 - Assessment Focus: Technical competency and cultural fit
 """
@@ -1,37 +1,71 @@
 import json
+import mmap
+import os
+import re
 
-with open("transcriptions.txt", "r", encoding="utf-8") as f:
-    lines = f.readlines()
-
-    final_transcription = ""
-
-    is_output = False
-    is_input = False
-
-    for line in lines:
-        if "OUTPUT: " in line:
-            if not is_output:
-                is_output = True
-                is_input = False
-                final_transcription += "\n[Interviewer]: "
-            json_str = line.split("OUTPUT: ")[1].strip()
-            try:
-                data = json.loads(json_str)
-                final_transcription += data.get("text")
-            except json.JSONDecodeError as e:
-                print(f"Error decoding JSON: {e}")
-                print(f"Original string: {json_str}")
-        if "INPUT: " in line:
-            if not is_input:
-                is_output = False
-                is_input = True
-                final_transcription += "\n[Interviewee]: "
-            json_str = line.split("INPUT: ")[1].strip()
-            try:
-                data = json.loads(json_str)
-                final_transcription += data.get("text")
-            except json.JSONDecodeError as e:
-                print(f"Error decoding JSON: {e}")
-                print(f"Original string: {json_str}")
-    with open("final_transcription.txt", "w", encoding="utf-8") as out_f:
-        out_f.write(final_transcription.strip())
+try:
+    from orjson import loads as json_loads
+except ImportError:  # optional speedup; orjson errors subclass json.JSONDecodeError
+    json_loads = json.loads
+
+# Speaker marker and JSON payload; one finditer pass over the mapped file
+# replaces Python-level line iteration
+LINE_PATTERN = re.compile(rb"(?P<kind>OUTPUT|INPUT): (?P<payload>[^\n]*)")
+
+HEADERS = {b"OUTPUT": "\n[Interviewer]: ", b"INPUT": "\n[Interviewee]: "}
+
+
+def format_transcription(input_path="transcriptions.txt", output_path="final_transcription.txt"):
+    """Scan transcription log lines into a speaker-labelled transcript.
+
+    Each speaker turn is buffered and written in one call when the speaker
+    changes. The output matches stripping the whole transcript: the leading
+    newline is dropped, and trailing whitespace is held back until more text
+    follows.
+    """
+    with open(input_path, "rb") as f, open(
+        output_path, "w", encoding="utf-8"
+    ) as out_f:
+        turn = []
+        pending_space = ""
+        started = False
+
+        def write_turn():
+            nonlocal pending_space, started
+            chunk = "".join(turn)
+            turn.clear()
+            if not started:
+                chunk = chunk.lstrip()
+                started = True
+            body = chunk.rstrip()
+            if body:
+                out_f.write(pending_space + body)
+                pending_space = chunk[len(body):]
+            else:
+                pending_space += chunk
+
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            last_kind = None
+            for match in LINE_PATTERN.finditer(mm):
+                kind = match["kind"]
+                if last_kind != kind:
+                    if turn:
+                        write_turn()
+                    last_kind = kind
+                    turn.append(HEADERS[kind])
+                json_str = match["payload"].decode("utf-8").strip()
+                try:
+                    data = json_loads(json_str)
+                    turn.append(data.get("text"))
+                except json.JSONDecodeError as e:
+                    print(f"Error decoding JSON: {e}")
+                    print(f"Original string: {json_str}")
+
+        if turn:
+            write_turn()
+
+
+if __name__ == "__main__":
+    format_transcription()
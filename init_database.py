@@ -7,38 +7,789 @@ Creates SQLite database with all necessary tables and relationships
 import sqlite3
 import os
 import json
+import queue
+import re
+import threading
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of read-only connections DatabaseManager keeps for SELECT queries
+READ_POOL_SIZE = 4
+
+# Seconds a read waits for a pooled connection when all of them are borrowed
+READ_POOL_TIMEOUT = float(os.environ.get("INTERVIEW_DB_READ_POOL_TIMEOUT", "30"))
+
+# Rows pulled per fetchmany() call by DatabaseManager.iter_query()
+FETCH_BATCH_SIZE = 256
+
+# Per-connection prepared statement cache (sqlite3 defaults to 128); raise
+# INTERVIEW_DB_STATEMENT_CACHE for workloads with many distinct statements
+STATEMENT_CACHE_SIZE = int(os.environ.get("INTERVIEW_DB_STATEMENT_CACHE", "256"))
+
+# Schema file shipped next to this module, resolved once at import
+_BASE_DIR = Path(__file__).parent
+_SCHEMA_PATH = _BASE_DIR / "database_schema.sql"
+
+# Pages copied per step by backup_database before yielding to writers
+BACKUP_PAGES_PER_STEP = 1000
+
+# Set INTERVIEW_DB_TRACE=1 to log every SQL statement at DEBUG level and count
+# executions per statement in DatabaseManager.statement_counts
+TRACE_SQL = os.environ.get("INTERVIEW_DB_TRACE") == "1"
+
+# String and number literals, replaced by ? so traced statements group by shape
+_SQL_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+# Applied to every connection opened by DatabaseManager.
+# journal_mode=WAL is persistent in the database file, so it is set once per
+# database by DatabaseManager.prepare_database() instead.
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256 MiB
+    "PRAGMA cache_size = -65536",  # 64 MiB page cache
+    "PRAGMA wal_autocheckpoint = 1000",
+)
+
+# CONNECTION_PRAGMAS as one script, applied in a single call per connection
+_CONNECTION_SCRIPT = ";".join(CONNECTION_PRAGMAS)
+
+# Applied after CONNECTION_PRAGMAS to the pooled read-only connections;
+# DatabaseManager.set_read_pragmas() replaces them for read-heavy tools
+READ_CONNECTION_PRAGMAS = (
+    "PRAGMA query_only = ON",
+)
+
+# Indexes for the hot lookups in InterviewDatabaseOps. They are part of
+# database_schema.sql too; listed here so databases created before they existed
+# get them in prepare_database().
+PERFORMANCE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_scoring_analysis_interview ON scoring_analysis(interview_id)",
+    "CREATE INDEX IF NOT EXISTS idx_final_scores_interview ON final_scores(interview_id)",
+    "CREATE INDEX IF NOT EXISTS idx_feedback_interview_created ON interview_feedback(interview_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_recordings_interview ON interview_recordings(interview_id)",
+    "CREATE INDEX IF NOT EXISTS idx_resumes_name_email ON resumes(candidate_name, email) WHERE is_active = 1",
+    "CREATE INDEX IF NOT EXISTS idx_interview_started ON interviews(started_at)",
+    "CREATE INDEX IF NOT EXISTS idx_interviews_resume_created ON interviews(resume_id, created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_interviews_created_id ON interviews(created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_resumes_created_id ON resumes(created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_job_descriptions_created_id ON job_descriptions(created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_scoring_embeddings_interview ON scoring_embeddings(interview_id, context_key)",
+)
+
+# Tables DatabaseManager.validate_database() requires
+REQUIRED_TABLES = (
+    'job_descriptions', 'resumes', 'interviews', 'match_ratings',
+    'interview_recordings', 'scoring_analysis', 'final_scores',
+    'interview_feedback', 'system_events'
+)
+_REQUIRED_TABLES_SET = frozenset(REQUIRED_TABLES)
+_VALIDATE_QUERY = (
+    "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ("
+    + ", ".join("?" * len(REQUIRED_TABLES))
+    + ")"
+)
+
+# Tables counted by DatabaseManager.get_database_stats(), all in one query
+STATS_TABLES = REQUIRED_TABLES
+
+# Row counts for STATS_TABLES kept current by insert/delete triggers, so stats
+# don't scan every table; created (and back-filled) by ensure_row_counts()
+ROW_COUNTS_SCRIPT = """
+CREATE TABLE IF NOT EXISTS table_row_counts (
+    table_name TEXT PRIMARY KEY,
+    row_count INTEGER NOT NULL
+) WITHOUT ROWID;
+""" + "".join(
+    f"""
+CREATE TRIGGER IF NOT EXISTS {table}_row_count_ai AFTER INSERT ON {table} BEGIN
+    UPDATE table_row_counts SET row_count = row_count + 1 WHERE table_name = '{table}';
+END;
+CREATE TRIGGER IF NOT EXISTS {table}_row_count_ad AFTER DELETE ON {table} BEGIN
+    UPDATE table_row_counts SET row_count = row_count - 1 WHERE table_name = '{table}';
+END;"""
+    for table in STATS_TABLES
+)
+
+# Interviews created per day, kept current by triggers; recent_interviews sums
+# the whole days in its window instead of scanning a week of interviews
+DAILY_INTERVIEW_COUNTS_SCRIPT = """
+CREATE TABLE IF NOT EXISTS daily_interview_counts (
+    day TEXT PRIMARY KEY,
+    n INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS interviews_daily_count_ai AFTER INSERT ON interviews
+WHEN new.created_at IS NOT NULL BEGIN
+    INSERT INTO daily_interview_counts (day, n) VALUES (date(new.created_at), 1)
+    ON CONFLICT(day) DO UPDATE SET n = n + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS interviews_daily_count_ad AFTER DELETE ON interviews
+WHEN old.created_at IS NOT NULL BEGIN
+    UPDATE daily_interview_counts SET n = n - 1 WHERE day = date(old.created_at);
+END;
+CREATE TRIGGER IF NOT EXISTS interviews_daily_count_au AFTER UPDATE OF created_at ON interviews BEGIN
+    UPDATE daily_interview_counts SET n = n - 1
+    WHERE old.created_at IS NOT NULL AND day = date(old.created_at);
+    INSERT INTO daily_interview_counts (day, n)
+    SELECT date(new.created_at), 1 WHERE new.created_at IS NOT NULL
+    ON CONFLICT(day) DO UPDATE SET n = n + 1;
+END;
+"""
+
+
+def row_count_sql(table: str, tracked: bool = True) -> str:
+    """
+    A scalar subquery for the row count of one of STATS_TABLES
+
+    Reads the trigger-maintained table_row_counts when ``tracked``; otherwise
+    counts the rows, for databases where ensure_row_counts() hasn't run.
+    """
+    if tracked:
+        return f"(SELECT row_count FROM table_row_counts WHERE table_name = '{table}')"
+    return f"(SELECT COUNT(*) FROM {table})"
+
+
+# get_database_stats() queries, keyed by whether the row count tables exist
+_STATS_QUERIES = {
+    tracked: "SELECT " + ", ".join(
+        [f"{row_count_sql(table, tracked)} AS {table}_count" for table in STATS_TABLES]
+        + [
+            # Whole days from the daily counts, plus the part of the oldest day
+            # inside the window from idx_interviews_created_id
+            "(SELECT COALESCE(SUM(n), 0) FROM daily_interview_counts"
+            " WHERE day > date('now', '-7 days'))"
+            " + (SELECT COUNT(*) FROM interviews"
+            " WHERE created_at > datetime('now', '-7 days')"
+            " AND created_at < date('now', '-6 days')) AS recent_interviews"
+            if tracked else
+            "(SELECT COUNT(*) FROM interviews"
+            " WHERE created_at > datetime('now', '-7 days')) AS recent_interviews"
+        ]
+    )
+    for tracked in (True, False)
+}
+
+# Tables added to the schema after release; ensure_columns() creates them in
+# older databases
+ADDED_TABLES = (
+    """
+CREATE TABLE IF NOT EXISTS scoring_cache (
+    cache_key TEXT PRIMARY KEY, -- SHA-256 of the scoring inputs, prompt and model
+    response_text TEXT NOT NULL,
+    model_version VARCHAR(100),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+    """,
+    """
+CREATE TABLE IF NOT EXISTS scoring_embeddings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    interview_id INTEGER, -- Responses are only reused for the same interview
+    context_key TEXT NOT NULL, -- SHA-256 of the resume, job description, prompt and model
+    embedding BLOB NOT NULL, -- L2-normalized float32 transcript embedding
+    response_text TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+    """,
+)
+
+# Columns added to the schema after release; ensure_columns() adds them to
+# older databases. (table, column, type)
+ADDED_COLUMNS = (
+    ("interview_recordings", "transcript_text_zstd", "BLOB"),
+    ("scoring_embeddings", "interview_id", "INTEGER"),
+)
+
+# Full-text index over resume names and emails for candidate search. An
+# external-content FTS5 table kept in sync with resumes by triggers; created
+# (and back-filled) by DatabaseManager.ensure_search_index().
+RESUMES_FTS_SCRIPT = """
+CREATE VIRTUAL TABLE IF NOT EXISTS resumes_fts USING fts5(
+    candidate_name, email, content='resumes', content_rowid='id', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS resumes_fts_ai AFTER INSERT ON resumes BEGIN
+    INSERT INTO resumes_fts(rowid, candidate_name, email)
+    VALUES (new.id, new.candidate_name, new.email);
+END;
+CREATE TRIGGER IF NOT EXISTS resumes_fts_ad AFTER DELETE ON resumes BEGIN
+    INSERT INTO resumes_fts(resumes_fts, rowid, candidate_name, email)
+    VALUES ('delete', old.id, old.candidate_name, old.email);
+END;
+CREATE TRIGGER IF NOT EXISTS resumes_fts_au AFTER UPDATE OF candidate_name, email ON resumes BEGIN
+    INSERT INTO resumes_fts(resumes_fts, rowid, candidate_name, email)
+    VALUES ('delete', old.id, old.candidate_name, old.email);
+    INSERT INTO resumes_fts(rowid, candidate_name, email)
+    VALUES (new.id, new.candidate_name, new.email);
+END;
+"""
+
+# Pre-joined copy of the interview_summary columns used by the dashboard
+# queries, one row per interview (latest final score). Kept current by
+# triggers on the underlying tables; created and back-filled by
+# DatabaseManager.ensure_summary_table().
+_SUMMARY_REFRESH = """
+    INSERT OR REPLACE INTO interview_summary_mat (
+        interview_id, session_id, candidate_name, status,
+        final_score, final_decision, started_at
+    )
+    SELECT i.id, i.session_id, r.candidate_name, i.status,
+           fs.final_score, fs.final_decision, i.started_at
+    FROM interviews i
+    LEFT JOIN resumes r ON r.id = i.resume_id
+    LEFT JOIN final_scores fs
+        ON fs.id = (SELECT MAX(id) FROM final_scores WHERE interview_id = i.id)
+    WHERE {where};"""
+
+INTERVIEW_SUMMARY_SCRIPT = f"""
+CREATE TABLE IF NOT EXISTS interview_summary_mat (
+    interview_id INTEGER PRIMARY KEY,
+    session_id TEXT,
+    candidate_name TEXT,
+    status TEXT,
+    final_score REAL,
+    final_decision TEXT,
+    started_at TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_interview_summary_mat_started
+    ON interview_summary_mat(started_at);
+CREATE TRIGGER IF NOT EXISTS interview_summary_mat_interview_ai AFTER INSERT ON interviews BEGIN
+    {_SUMMARY_REFRESH.format(where="i.id = new.id")}
+END;
+CREATE TRIGGER IF NOT EXISTS interview_summary_mat_interview_au AFTER UPDATE ON interviews BEGIN
+    {_SUMMARY_REFRESH.format(where="i.id = new.id")}
+END;
+CREATE TRIGGER IF NOT EXISTS interview_summary_mat_interview_ad AFTER DELETE ON interviews BEGIN
+    DELETE FROM interview_summary_mat WHERE interview_id = old.id;
+END;
+CREATE TRIGGER IF NOT EXISTS interview_summary_mat_score_ai AFTER INSERT ON final_scores BEGIN
+    {_SUMMARY_REFRESH.format(where="i.id = new.interview_id")}
+END;
+CREATE TRIGGER IF NOT EXISTS interview_summary_mat_score_au AFTER UPDATE ON final_scores BEGIN
+    {_SUMMARY_REFRESH.format(where="i.id IN (old.interview_id, new.interview_id)")}
+END;
+CREATE TRIGGER IF NOT EXISTS interview_summary_mat_score_ad AFTER DELETE ON final_scores BEGIN
+    {_SUMMARY_REFRESH.format(where="i.id = old.interview_id")}
+END;
+CREATE TRIGGER IF NOT EXISTS interview_summary_mat_resume_au AFTER UPDATE OF candidate_name ON resumes BEGIN
+    {_SUMMARY_REFRESH.format(where="i.resume_id = new.id")}
+END;
+"""
+
+
+def tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """A cursor that returns plain tuples instead of sqlite3.Row objects
+
+    For reads that only index columns by position, e.g. ``row[0]``.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
+
+
+def execute_script(conn: sqlite3.Connection, script: str) -> None:
+    """Run a multi-statement SQL script inside the current transaction
+
+    Unlike ``Connection.executescript()``, which COMMITs any open transaction
+    first, the statements run one by one with ``execute()``, so a failure
+    later in the same ``get_connection()`` block rolls them back too.
+    SQLite's own tokenizer finds the statement ends, so semicolons in
+    comments, literals and trigger bodies are safe.
+    """
+    statement = ""
+    for part in re.split(r"(?<=;)", script):
+        statement += part
+        if sqlite3.complete_statement(statement):
+            conn.execute(statement)
+            statement = ""
+    if statement.strip():
+        conn.execute(statement)
+
+
 class DatabaseManager:
     """Manages SQLite database operations for the interview application"""
+
+    __slots__ = (
+        "db_path", "base_dir", "schema_path", "read_pool_size", "read_pragmas",
+        "statement_counts",
+        "_writer", "_write_lock", "_write_owner", "_readers", "_reader_count", "_pool_lock",
+        "_pool_generation", "_trace_lock",
+        "_probe", "_probe_inode", "_probe_generation", "_probe_lock",
+    )
+
+    # Database paths already prepared (WAL + indexes) in this process
+    _prepared_paths = set()
+    # Database paths whose first read has tried prepare_database(), see
+    # _prepare_for_reads()
+    _prepare_attempted_paths = set()
+    # Database paths whose resumes_fts search index is in place
+    _search_index_paths = set()
+    # Database paths whose interview_summary_mat table is in place
+    _summary_table_paths = set()
+    # Database paths whose table_row_counts and daily_interview_counts are in place
+    _row_count_paths = set()
+    # Database paths validate_database() found complete; the schema doesn't
+    # change while the process runs
+    _validated_paths = set()
     
-    def __init__(self, db_path: str = "db/interview_database.db"):
+    def __init__(self, db_path: str = "db/interview_database.db", read_pool_size: int = READ_POOL_SIZE):
         """
         Initialize database manager
         
         Args:
             db_path: Path to SQLite database file
+            read_pool_size: Maximum number of pooled read-only connections
         """
-        if not os.path.exists(os.path.dirname(db_path)):
-            os.makedirs(os.path.dirname(db_path))
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
         self.db_path = db_path
-        self.base_dir = Path(__file__).parent
-        self.schema_path = self.base_dir / "database_schema.sql"
-        
-    def get_connection(self) -> sqlite3.Connection:
-        """Get database connection with foreign key enforcement enabled"""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
+        self.base_dir = _BASE_DIR
+        self.schema_path = _SCHEMA_PATH
+
+        # One read-write connection shared behind a lock, plus a bounded pool of
+        # read-only connections. Both are opened lazily and reused until close().
+        self.read_pool_size = read_pool_size
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.RLock()
+        # Thread inside a get_connection() block; its reads use the writer
+        self._write_owner: Optional[int] = None
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._reader_count = 0
+        self._pool_lock = threading.Lock()
+        self._pool_generation = 0
+        self.read_pragmas = READ_CONNECTION_PRAGMAS
+
+        # Read-only connection that only runs PRAGMA data_version, see data_version()
+        self._probe: Optional[sqlite3.Connection] = None
+        self._probe_inode = None
+        self._probe_generation = 0
+        self._probe_lock = threading.Lock()
+
+        # Executions per statement shape, filled in when TRACE_SQL is set
+        self.statement_counts: Counter = Counter()
+        self._trace_lock = threading.Lock()
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a connection with foreign keys and performance pragmas enabled"""
+        if read_only:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(
+                uri, uri=True, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+            )
+        else:
+            # Autocommit at the driver level; get_connection() opens each write
+            # transaction explicitly with BEGIN IMMEDIATE
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE,
+                isolation_level=None,
+            )
+        conn.executescript(_CONNECTION_SCRIPT)
+        if read_only:
+            conn.executescript(";".join(self.read_pragmas))
         conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+        if TRACE_SQL:
+            conn.set_trace_callback(self._trace_statement)
         return conn
-    
+
+    def _trace_statement(self, statement: str) -> None:
+        """Trace callback: log a statement and count it by shape"""
+        logger.debug("SQL: %s", statement)
+        shape = " ".join(_SQL_LITERAL.sub("?", statement).split())
+        with self._trace_lock:
+            self.statement_counts[shape] += 1
+
+    @contextmanager
+    def get_connection(
+        self, transaction: bool = True, prepare: bool = True
+    ) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow the shared read-write connection
+
+        Writers are serialized by a lock. The block runs in a BEGIN IMMEDIATE
+        transaction, so the write lock is taken up front, which is committed
+        when the block exits normally and rolled back if it raises.
+
+        The lock is reentrant, so a block may nest inside another on the same
+        thread. A nested block runs in a SAVEPOINT: it is released on exit or
+        rolled back on its own if it raises, and only the outermost block
+        commits or rolls back the transaction.
+
+        Reads through get_read_connection() on the same thread inside the
+        block use this connection too, so they see the block's own
+        uncommitted rows.
+
+        The first write to a database not yet prepared runs
+        prepare_database() first, so writes never land in a half-migrated
+        database; if preparation fails, sqlite3.DatabaseError is raised.
+
+        Args:
+            transaction: Set to False for statements that cannot run inside a
+                transaction (e.g. PRAGMA journal_mode); they run in autocommit
+            prepare: Set to False for the setup statements themselves
+        """
+        with self._write_lock:
+            if prepare and not self.is_prepared and not self.prepare_database():
+                raise sqlite3.DatabaseError(f"Could not prepare database: {self.db_path}")
+            if self._writer is None:
+                self._writer = self._connect()
+            conn = self._writer
+            outer_owner = self._write_owner
+            self._write_owner = threading.get_ident()
+            try:
+                if conn.in_transaction:
+                    conn.execute("SAVEPOINT nested_write")
+                    try:
+                        yield conn
+                        conn.execute("RELEASE nested_write")
+                    except BaseException:
+                        conn.execute("ROLLBACK TO nested_write")
+                        conn.execute("RELEASE nested_write")
+                        raise
+                    return
+
+                try:
+                    if transaction:
+                        conn.execute("BEGIN IMMEDIATE")
+                    yield conn
+                    conn.commit()
+                except BaseException:
+                    # Also covers a failed COMMIT (e.g. deferred foreign keys),
+                    # which leaves the transaction open
+                    conn.rollback()
+                    raise
+            finally:
+                self._write_owner = outer_owner
+
+    def _prepare_for_reads(self) -> None:
+        """
+        Prepare an existing database before its first read in this process
+
+        Databases that are only read (the viewer, reports) then still get the
+        tables prepare_database() adds. Preparation is tried once per path; a
+        database that can't be prepared, e.g. a read-only file, is read as is.
+        """
+        path = os.path.abspath(self.db_path)
+        with self._write_lock:
+            if path in DatabaseManager._prepare_attempted_paths or not os.path.exists(self.db_path):
+                return
+            DatabaseManager._prepare_attempted_paths.add(path)
+            if not self.prepare_database():
+                logger.warning(f"Could not prepare database, reading it as is: {self.db_path}")
+
+    @property
+    def in_write_block(self) -> bool:
+        """Whether the current thread is inside a get_connection() block"""
+        return self._write_owner == threading.get_ident()
+
+    @contextmanager
+    def get_read_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a read-only connection from the pool for SELECT queries
+
+        Inside a get_connection() block on the same thread the writer is
+        borrowed instead, so reads see the block's uncommitted writes. When
+        every pooled connection stays borrowed for READ_POOL_TIMEOUT seconds,
+        sqlite3.OperationalError is raised.
+        """
+        if self.in_write_block:
+            with self._write_lock:
+                yield self._writer
+            return
+
+        if not self.is_prepared:
+            self._prepare_for_reads()
+        with self._pool_lock:
+            generation = self._pool_generation
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                conn = None
+                if self._reader_count < self.read_pool_size:
+                    self._reader_count += 1
+                    try:
+                        conn = self._connect(read_only=True)
+                    except Exception:
+                        self._reader_count -= 1
+                        raise
+        if conn is None:
+            try:
+                conn = self._readers.get(timeout=READ_POOL_TIMEOUT)
+            except queue.Empty:
+                raise sqlite3.OperationalError(
+                    f"No read connection free after {READ_POOL_TIMEOUT}s: {self.db_path}"
+                ) from None
+
+        try:
+            yield conn
+        finally:
+            with self._pool_lock:
+                if generation == self._pool_generation:
+                    self._readers.put(conn)
+                else:
+                    conn.close()
+
+    def close(self) -> None:
+        """Close the pooled connections; they are reopened on next use"""
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+        with self._probe_lock:
+            if self._probe is not None:
+                self._probe.close()
+                self._probe = None
+
+        self._reset_readers()
+
+    def data_version(self) -> Tuple[int, int]:
+        """
+        A token that changes whenever the database content may have changed
+
+        Covers commits from any connection: this manager's writer, other
+        DatabaseManagers and other processes (SQLite's PRAGMA data_version on
+        a connection that never writes), as well as the file being replaced,
+        e.g. by create_database(force_recreate=True). Use it to key caches of
+        query results.
+        """
+        with self._probe_lock:
+            inode = os.stat(self.db_path).st_ino
+            if self._probe is None or self._probe_inode != inode:
+                if self._probe is not None:
+                    self._probe.close()
+                self._probe = self._connect(read_only=True)
+                self._probe_inode = inode
+                self._probe_generation += 1
+            version = tuple_cursor(self._probe).execute("PRAGMA data_version").fetchone()[0]
+            return self._probe_generation, version
+
+    def _reset_readers(self) -> None:
+        """Close idle pooled readers; borrowed ones are closed when returned"""
+        with self._pool_lock:
+            self._pool_generation += 1
+            self._reader_count = 0
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+
+    def set_read_pragmas(self, pragmas: Iterable[str]) -> None:
+        """
+        Replace the pragmas applied to read-only connections
+
+        Pooled readers are reopened so every read picks up the new settings.
+        """
+        self.read_pragmas = tuple(pragmas)
+        self._reset_readers()
+
+    def enable_wal(self) -> bool:
+        """
+        Switch the database to write-ahead logging so readers don't block writers
+
+        Returns:
+            bool: True if the database is in WAL mode, False otherwise
+        """
+        try:
+            with self.get_connection(transaction=False, prepare=False) as conn:
+                mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            return mode.lower() == "wal"
+
+        except Exception as e:
+            logger.error(f"Error enabling WAL mode: {e}")
+            return False
+
+    def ensure_indexes(self) -> bool:
+        """
+        Create any missing PERFORMANCE_INDEXES and refresh planner statistics
+
+        Returns:
+            bool: True if the indexes are in place, False otherwise
+        """
+        try:
+            with self.get_connection(prepare=False) as conn:
+                for statement in PERFORMANCE_INDEXES:
+                    conn.execute(statement)
+                conn.execute("ANALYZE")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error creating indexes: {e}")
+            return False
+
+    def ensure_columns(self) -> bool:
+        """
+        Add any ADDED_TABLES and ADDED_COLUMNS missing from an older database
+
+        Returns:
+            bool: True if all tables and columns are present, False otherwise
+        """
+        try:
+            with self.get_connection(prepare=False) as conn:
+                for statement in ADDED_TABLES:
+                    conn.execute(statement)
+                for table, column, column_type in ADDED_COLUMNS:
+                    existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+                    if column not in existing:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+                        logger.info(f"Added column {table}.{column}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error adding columns: {e}")
+            return False
+
+    def ensure_search_index(self) -> bool:
+        """
+        Create the resumes_fts full-text index if missing and back-fill it
+
+        Returns:
+            bool: True if the index is available, False if FTS5 is unsupported
+        """
+        try:
+            with self.get_connection(prepare=False) as conn:
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'resumes_fts'"
+                ).fetchone()
+                execute_script(conn, RESUMES_FTS_SCRIPT)
+                if not exists:
+                    conn.execute("INSERT INTO resumes_fts(resumes_fts) VALUES ('rebuild')")
+                    logger.info(f"Built candidate search index for: {self.db_path}")
+
+            DatabaseManager._search_index_paths.add(os.path.abspath(self.db_path))
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"Full-text search unavailable, using LIKE search: {e}")
+            return False
+
+    def ensure_summary_table(self) -> bool:
+        """
+        Create the interview_summary_mat table and its triggers if missing and
+        back-fill it from the existing interviews
+
+        Returns:
+            bool: True if the table is in place, False otherwise
+        """
+        try:
+            with self.get_connection(prepare=False) as conn:
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'interview_summary_mat'"
+                ).fetchone()
+                execute_script(conn, INTERVIEW_SUMMARY_SCRIPT)
+                if not exists:
+                    conn.execute(_SUMMARY_REFRESH.format(where="1"))
+                    logger.info(f"Built interview summary table for: {self.db_path}")
+
+            DatabaseManager._summary_table_paths.add(os.path.abspath(self.db_path))
+            return True
+
+        except Exception as e:
+            logger.error(f"Error creating interview summary table: {e}")
+            return False
+
+    def ensure_row_counts(self) -> bool:
+        """
+        Create the table_row_counts and daily_interview_counts tables and their
+        triggers if missing and back-fill counts not tracked yet
+
+        Returns:
+            bool: True if the counts are in place, False otherwise
+        """
+        try:
+            with self.get_connection(prepare=False) as conn:
+                daily_exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'daily_interview_counts'"
+                ).fetchone()
+                execute_script(conn, ROW_COUNTS_SCRIPT + DAILY_INTERVIEW_COUNTS_SCRIPT)
+                if not daily_exists:
+                    conn.execute(
+                        "INSERT INTO daily_interview_counts (day, n) "
+                        "SELECT date(created_at), COUNT(*) FROM interviews "
+                        "WHERE created_at IS NOT NULL GROUP BY date(created_at)"
+                    )
+                cursor = tuple_cursor(conn).execute("SELECT table_name FROM table_row_counts")
+                tracked = {row[0] for row in cursor}
+                for table in STATS_TABLES:
+                    if table not in tracked:
+                        conn.execute(
+                            "INSERT INTO table_row_counts (table_name, row_count) "
+                            f"SELECT '{table}', COUNT(*) FROM {table}"
+                        )
+
+            DatabaseManager._row_count_paths.add(os.path.abspath(self.db_path))
+            return True
+
+        except Exception as e:
+            logger.error(f"Error creating table row counts: {e}")
+            return False
+
+    @property
+    def is_prepared(self) -> bool:
+        """Whether prepare_database() has completed for this path in this process"""
+        return os.path.abspath(self.db_path) in DatabaseManager._prepared_paths
+
+    @property
+    def has_search_index(self) -> bool:
+        """Whether resumes_fts can be used for candidate search"""
+        return os.path.abspath(self.db_path) in DatabaseManager._search_index_paths
+
+    @property
+    def has_summary_table(self) -> bool:
+        """Whether interview_summary_mat can be used for recent interviews"""
+        return os.path.abspath(self.db_path) in DatabaseManager._summary_table_paths
+
+    @property
+    def has_row_counts(self) -> bool:
+        """Whether table_row_counts and daily_interview_counts can be used for stats"""
+        return os.path.abspath(self.db_path) in DatabaseManager._row_count_paths
+
+    def count_rows(self, table: str) -> int:
+        """Row count of one of STATS_TABLES, from table_row_counts when in place"""
+        rows = self.execute_query(f"SELECT {row_count_sql(table, self.has_row_counts)} AS n")
+        return rows[0]["n"] if rows else 0
+
+    def prepare_database(self) -> bool:
+        """
+        One-time setup of an existing database: WAL mode, missing columns and
+        indexes, the interview summary and row count tables and the candidate
+        search index
+
+        Runs once per database path per process; later calls are no-ops.
+        Called by create_database() and at application startup; otherwise
+        the first read or write runs it.
+
+        Returns:
+            bool: True if the database is prepared, False otherwise
+        """
+        path = os.path.abspath(self.db_path)
+        if path in DatabaseManager._prepared_paths:
+            return True
+
+        if (
+            self.enable_wal()
+            and self.ensure_columns()
+            and self.ensure_indexes()
+            and self.ensure_summary_table()
+            and self.ensure_row_counts()
+        ):
+            self.ensure_search_index()
+            DatabaseManager._prepared_paths.add(path)
+            return True
+        return False
+
     def create_database(self, force_recreate: bool = False) -> bool:
         """
         Create the database and all tables from schema file
@@ -51,14 +802,27 @@ class DatabaseManager:
         """
         try:
             # Remove existing database if force_recreate is True
+            if force_recreate:
+                self.close()
             if force_recreate and os.path.exists(self.db_path):
                 os.remove(self.db_path)
                 logger.info(f"Removed existing database: {self.db_path}")
+            if force_recreate:
+                DatabaseManager._prepared_paths.discard(os.path.abspath(self.db_path))
+                DatabaseManager._prepare_attempted_paths.discard(os.path.abspath(self.db_path))
+                DatabaseManager._search_index_paths.discard(os.path.abspath(self.db_path))
+                DatabaseManager._summary_table_paths.discard(os.path.abspath(self.db_path))
+                DatabaseManager._row_count_paths.discard(os.path.abspath(self.db_path))
+                DatabaseManager._validated_paths.discard(os.path.abspath(self.db_path))
+                # Drop WAL sidecar files so they aren't replayed into the new database
+                for suffix in ("-wal", "-shm"):
+                    if os.path.exists(self.db_path + suffix):
+                        os.remove(self.db_path + suffix)
             
-            # Check if database already exists
+            # Check if database already exists; bring it up to date
             if os.path.exists(self.db_path) and not force_recreate:
                 logger.info(f"Database already exists: {self.db_path}")
-                return True
+                return self.prepare_database()
             
             # Read schema file
             if not self.schema_path.exists():
@@ -68,24 +832,17 @@ class DatabaseManager:
             with open(self.schema_path, 'r', encoding='utf-8') as f:
                 schema_sql = f.read()
             
-            # Create database and execute schema
-            with self.get_connection() as conn:
-                # Split schema into individual statements and execute
-                statements = [stmt.strip() for stmt in schema_sql.split(';') if stmt.strip()]
-                
-                for statement in statements:
-                    if statement:
-                        try:
-                            conn.execute(statement)
-                            logger.debug(f"Executed: {statement[:50]}...")
-                        except sqlite3.Error as e:
-                            logger.error(f"Error executing statement: {e}")
-                            logger.error(f"Statement: {statement}")
-                            return False
-                
-                conn.commit()
+            # Create database and execute schema; SQLite's own tokenizer splits
+            # the statements, so semicolons in literals and triggers are safe
+            with self.get_connection(prepare=False) as conn:
+                try:
+                    execute_script(conn, schema_sql)
+                except sqlite3.Error as e:
+                    logger.error(f"Error executing schema: {e}")
+                    return False
                 logger.info(f"Database created successfully: {self.db_path}")
-                return True
+
+            return self.prepare_database()
                 
         except Exception as e:
             logger.error(f"Error creating database: {e}")
@@ -98,24 +855,19 @@ class DatabaseManager:
         Returns:
             bool: True if database is valid, False otherwise
         """
-        required_tables = [
-            'job_descriptions', 'resumes', 'interviews', 'match_ratings',
-            'interview_recordings', 'scoring_analysis', 'final_scores',
-            'interview_feedback', 'system_events'
-        ]
-        
+        path = os.path.abspath(self.db_path)
+        if path in DatabaseManager._validated_paths:
+            return True
+
         try:
-            with self.get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table'"
-                )
-                existing_tables = [row[0] for row in cursor.fetchall()]
-                
-                missing_tables = set(required_tables) - set(existing_tables)
+            with self.get_read_connection() as conn:
+                cursor = tuple_cursor(conn).execute(_VALIDATE_QUERY, REQUIRED_TABLES)
+                missing_tables = _REQUIRED_TABLES_SET.difference(row[0] for row in cursor)
                 if missing_tables:
                     logger.error(f"Missing tables: {missing_tables}")
                     return False
                 
+                DatabaseManager._validated_paths.add(path)
                 logger.info("Database validation successful")
                 return True
                 
@@ -130,29 +882,10 @@ class DatabaseManager:
         Returns:
             dict: Statistics including table counts and recent activity
         """
-        stats = {}
-        
         try:
-            with self.get_connection() as conn:
-                # Get table counts
-                tables = [
-                    'job_descriptions', 'resumes', 'interviews', 'match_ratings',
-                    'interview_recordings', 'scoring_analysis', 'final_scores',
-                    'interview_feedback', 'system_events'
-                ]
-                
-                for table in tables:
-                    cursor = conn.execute(f"SELECT COUNT(*) FROM {table}")
-                    count = cursor.fetchone()[0]
-                    stats[f"{table}_count"] = count
-                
-                # Get recent activity
-                cursor = conn.execute("""
-                    SELECT COUNT(*) as recent_interviews 
-                    FROM interviews 
-                    WHERE created_at > datetime('now', '-7 days')
-                """)
-                stats['recent_interviews'] = cursor.fetchone()[0]
+            with self.get_read_connection() as conn:
+                # Table counts and recent activity in a single statement
+                stats = dict(conn.execute(_STATS_QUERIES[self.has_row_counts]).fetchone())
                 
                 # Database file size
                 stats['database_size_mb'] = round(os.path.getsize(self.db_path) / (1024 * 1024), 2)
@@ -163,12 +896,18 @@ class DatabaseManager:
             logger.error(f"Error getting database stats: {e}")
             return {}
     
-    def backup_database(self, backup_path: Optional[str] = None) -> bool:
+    def backup_database(self, backup_path: Optional[str] = None,
+                        pages: int = BACKUP_PAGES_PER_STEP) -> bool:
         """
         Create a backup of the database
         
+        Uses SQLite's online backup API, so the snapshot is consistent and
+        includes pages still in the WAL. Pages are copied in steps of
+        ``pages`` and the copy yields between steps to concurrent writers.
+        
         Args:
             backup_path: Path for backup file (optional)
+            pages: Pages copied per backup step (-1 copies everything at once)
             
         Returns:
             bool: True if backup successful, False otherwise
@@ -178,8 +917,12 @@ class DatabaseManager:
             backup_path = f"db/interview_database_backup_{timestamp}.db"
         
         try:
-            import shutil
-            shutil.copy2(self.db_path, backup_path)
+            dst = sqlite3.connect(backup_path)
+            try:
+                with self.get_read_connection() as src:
+                    src.backup(dst, pages=pages, sleep=0)
+            finally:
+                dst.close()
             logger.info(f"Database backed up to: {backup_path}")
             return True
             
@@ -198,15 +941,36 @@ class DatabaseManager:
         Returns:
             List of rows as sqlite3.Row objects
         """
+        return list(self.iter_query(query, params))
+    
+    def iter_query(self, query: str, params: tuple = None,
+                   arraysize: int = FETCH_BATCH_SIZE) -> Iterator[sqlite3.Row]:
+        """
+        Execute a SELECT query and yield rows as they are read
+
+        Rows are fetched ``arraysize`` at a time. The pooled read connection is
+        held until the iterator is exhausted or closed. Prefer this over
+        execute_query() for large result sets that can be consumed row by row.
+
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+            arraysize: Rows fetched per batch
+
+        Yields:
+            Rows as sqlite3.Row objects
+        """
         try:
-            with self.get_connection() as conn:
-                cursor = conn.execute(query, params or ())
-                return cursor.fetchall()
-                
+            with self.get_read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.arraysize = arraysize
+                cursor.execute(query, params or ())
+                while batch := cursor.fetchmany():
+                    yield from batch
+
         except Exception as e:
             logger.error(f"Error executing query: {e}")
-            return []
-    
+
     def execute_update(self, query: str, params: tuple = None) -> bool:
         """
         Execute an INSERT, UPDATE, or DELETE query
@@ -221,13 +985,72 @@ class DatabaseManager:
         try:
             with self.get_connection() as conn:
                 conn.execute(query, params or ())
-                conn.commit()
                 return True
                 
         except Exception as e:
             logger.error(f"Error executing update: {e}")
             return False
 
+    def execute_many(self, query: str, seq_of_params: Iterable[tuple]) -> bool:
+        """
+        Execute one INSERT, UPDATE, or DELETE for many parameter sets
+
+        All rows are written in a single transaction, so a failure leaves the
+        database unchanged.
+
+        Args:
+            query: SQL query string
+            seq_of_params: Parameters for each execution
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            with self.get_connection() as conn:
+                conn.executemany(query, seq_of_params)
+                return True
+
+        except Exception as e:
+            logger.error(f"Error executing batch update: {e}")
+            return False
+
+    def bulk_insert(self, table: str, columns: List[str], rows: Iterable[tuple]) -> int:
+        """
+        Insert rows with multi-row INSERT statements in a single transaction
+
+        Rows are chunked so each statement stays under the connection's bound
+        parameter limit. Foreign key checks are deferred to the commit.
+
+        Args:
+            table: Table name
+            columns: Column names, in the order of each row's values
+            rows: Row value tuples
+
+        Returns:
+            int: Number of rows inserted (0 if the batch failed)
+        """
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        placeholders = "(" + ", ".join("?" * len(columns)) + ")"
+        inserted = 0
+        try:
+            with self.get_connection() as conn:
+                conn.execute("PRAGMA defer_foreign_keys = ON")
+                limit = conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+                chunk_rows = max(1, limit // len(columns))
+                rows = iter(rows)
+                while chunk := list(islice(rows, chunk_rows)):
+                    values = ", ".join([placeholders] * len(chunk))
+                    conn.execute(
+                        f'INSERT INTO "{table}" ({column_list}) VALUES {values}',
+                        [value for row in chunk for value in row],
+                    )
+                    inserted += len(chunk)
+            return inserted
+
+        except Exception as e:
+            logger.error(f"Error bulk inserting into {table}: {e}")
+            return 0
+
 
 def main():
     """Main function to initialize the database"""
@@ -1,6 +1,8 @@
 import os
 import pathlib
-from copy import deepcopy
+import string
+from copy import copy
+from functools import lru_cache
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -18,11 +20,17 @@ RECEIVE_SAMPLE_RATE = 24000
 MODEL = "models/gemini-2.5-flash-native-audio-preview-09-2025"
 
 
+def _read_bytes(filename: str) -> bytes:
+    try:
+        return (BASE_DIR / filename).read_bytes()
+    except FileNotFoundError:
+        return b""
+
+
+@lru_cache(maxsize=None)
 def _read_text(filename: str) -> str:
-    path = BASE_DIR / filename
-    if not path.exists():
-        return ""
-    return path.read_text(encoding="utf-8")
+    """Decode a bundled text file once per process; the files never change at runtime."""
+    return _read_bytes(filename).decode("utf-8")
 
 
 DEFAULT_RESUME_TEXT = _read_text("himanshu-resume.txt")
@@ -99,6 +107,20 @@ Begin the interview with a warm welcome and proceed through the structured phase
 All communication should be in English even transcriptions.
 """
 
+# Template fields in the argument order of _format_system_instruction()
+_TEMPLATE_FIELDS = ("resume", "job_description", "interview_type", "session_id", "timestamp")
+
+# SYSTEM_PROMPT_TEMPLATE split once into (literal, field position) pairs, so
+# filling it is a join instead of a str.format re-parse; the position is None
+# after the last literal. The template uses no format specs or conversions.
+_TEMPLATE_PARTS = tuple(
+    (literal, None if field is None else _TEMPLATE_FIELDS.index(field))
+    for literal, field, _, _ in string.Formatter().parse(SYSTEM_PROMPT_TEMPLATE)
+)
+
+_DEFAULT_RESUME_STRIPPED = DEFAULT_RESUME_TEXT.strip()
+_DEFAULT_JOB_DESCRIPTION_STRIPPED = DEFAULT_JOB_DESCRIPTION_TEXT.strip()
+
 
 def _build_system_instruction(
     resume_text: Optional[str] = None,
@@ -106,39 +128,73 @@ def _build_system_instruction(
     session_context: Optional[dict] = None,
 ) -> str:
     context = session_context or {}
-    return SYSTEM_PROMPT_TEMPLATE.format(
-        job_description=(job_description_text or DEFAULT_JOB_DESCRIPTION_TEXT).strip(),
-        resume=(resume_text or DEFAULT_RESUME_TEXT).strip(),
-        interview_type=context.get('interview_type', 'Technical Screen'),
-        session_id=context.get('session_id', 'N/A'),
-        timestamp=context.get('timestamp', 'N/A'),
+    return _format_system_instruction(
+        resume_text.strip() if resume_text else _DEFAULT_RESUME_STRIPPED,
+        job_description_text.strip() if job_description_text else _DEFAULT_JOB_DESCRIPTION_STRIPPED,
+        context.get('interview_type', 'Technical Screen'),
+        context.get('session_id', 'N/A'),
+        context.get('timestamp', 'N/A'),
     )
 
 
-client = genai.Client(
-    http_options={"api_version": "v1beta"},
-    api_key=os.environ.get("GEMINI_API_KEY", "<Enter your API key here>"),
-)
+@lru_cache(maxsize=64)
+def _format_system_instruction(
+    resume_text: str,
+    job_description_text: str,
+    interview_type: str,
+    session_id: str,
+    timestamp: str,
+) -> str:
+    """Fill the prompt template; reconnects of a session reuse the same prompt."""
+    values = (resume_text, job_description_text, interview_type, session_id, timestamp)
+    pieces = []
+    for literal, position in _TEMPLATE_PARTS:
+        pieces.append(literal)
+        if position is not None:
+            pieces.append(str(values[position]))
+    return "".join(pieces)
+
+
+@lru_cache(maxsize=None)
+def get_client() -> genai.Client:
+    """The shared Gemini client, created on first use rather than at import."""
+    return genai.Client(
+        http_options={"api_version": "v1beta"},
+        api_key=os.environ.get("GEMINI_API_KEY", "<Enter your API key here>"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _base_config() -> types.LiveConnectConfig:
+    """The default live session config (CONFIG), built on first use."""
+    return types.LiveConnectConfig(
+        system_instruction=_build_system_instruction(),
+        response_modalities=[
+            "AUDIO",
+        ],
+        media_resolution="MEDIA_RESOLUTION_MEDIUM",
+        speech_config=types.SpeechConfig(
+            voice_config=types.VoiceConfig(
+                prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name="Zephyr")
+            )
+        ),
+        context_window_compression=types.ContextWindowCompressionConfig(
+            trigger_tokens=25600,
+            sliding_window=types.SlidingWindow(target_tokens=12800),
+        ),
+        input_audio_transcription={},
+        output_audio_transcription={},
+        session_resumption=types.SessionResumptionConfig(handle=None),
+    )
 
-CONFIG = types.LiveConnectConfig(
-    system_instruction=_build_system_instruction(),
-    response_modalities=[
-        "AUDIO",
-    ],
-    media_resolution="MEDIA_RESOLUTION_MEDIUM",
-    speech_config=types.SpeechConfig(
-        voice_config=types.VoiceConfig(
-            prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name="Zephyr")
-        )
-    ),
-    context_window_compression=types.ContextWindowCompressionConfig(
-        trigger_tokens=25600,
-        sliding_window=types.SlidingWindow(target_tokens=12800),
-    ),
-    input_audio_transcription={},
-    output_audio_transcription={},
-    session_resumption=types.SessionResumptionConfig(handle=None),
-)
+
+def __getattr__(name: str):
+    # Keep ``client`` and ``CONFIG`` importable while building them lazily
+    if name == "client":
+        return get_client()
+    if name == "CONFIG":
+        return _base_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def build_live_config(
@@ -148,14 +204,14 @@ def build_live_config(
     job_description_text: Optional[str] = None,
     session_context: Optional[dict] = None,
 ) -> types.LiveConnectConfig:
-    """Return a deep-copied LiveConnectConfig optionally seeded with a resume handle and context."""
+    """Return a copy of CONFIG seeded with a resume handle and context.
 
-    if hasattr(CONFIG, "model_copy"):
-        config = CONFIG.model_copy(deep=True)
-    else:
-        config = deepcopy(CONFIG)
+    The copy is shallow: nested sub-configs (speech, compression) are shared
+    with CONFIG and must not be mutated. Only the system instruction and the
+    session resumption config are per-call.
+    """
 
-    config.system_instruction = _build_system_instruction(
+    system_instruction = _build_system_instruction(
         resume_text=resume_text,
         job_description_text=job_description_text,
         session_context=session_context,
@@ -164,10 +220,18 @@ def build_live_config(
     # Only set session handle if it's a valid, non-empty string
     # Empty or invalid session handles cause "Invalid session handle" errors
     valid_session_handle = session_handle if session_handle and session_handle.strip() else None
-    
-    if config.session_resumption is None:
-        config.session_resumption = types.SessionResumptionConfig(handle=valid_session_handle)
-    else:
-        config.session_resumption.handle = valid_session_handle
+    session_resumption = types.SessionResumptionConfig(handle=valid_session_handle)
+
+    base = _base_config()
+    if hasattr(base, "model_copy"):
+        return base.model_copy(
+            update={
+                "system_instruction": system_instruction,
+                "session_resumption": session_resumption,
+            }
+        )
 
+    config = copy(base)
+    config.system_instruction = system_instruction
+    config.session_resumption = session_resumption
     return config
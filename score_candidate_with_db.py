@@ -4,30 +4,115 @@ Updated score_candidate.py with database integration
 This version saves scoring results to the SQLite database
 """
 
-from google import genai
+from __future__ import annotations
+
+import bisect
+import hashlib
 import os
 import json
+import math
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, Optional
-
-from google.genai import types
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
 from database_operations import get_db_ops, JobDescription, Resume, Interview
+from scoring_core import (
+    JD_FILE, RESUME_FILE, SCORING_MODEL, SCORING_PROMPT, SCORING_SCHEMA,
+    call_gemini_scorer, format_evaluation, get_client, read_bytes_mmap, read_scoring_inputs,
+    scoring_config, scoring_contents,
+)
+
+# google.genai is imported on first use (see scoring_core)
+if TYPE_CHECKING:
+    from google.genai import types
+
+# Set SCORE_SIMILARITY_CACHE=1 to let a re-scored interview reuse its earlier
+# response when the transcript only changed trivially (same resume, JD and
+# prompt, embeddings' cosine similarity at or above the threshold). Off by
+# default; responses are never reused across interviews
+SIMILARITY_CACHE = os.environ.get("SCORE_SIMILARITY_CACHE") == "1"
+EMBEDDING_MODEL = "text-embedding-004"
+SIMILARITY_THRESHOLD = 0.97
+TIMESTAMP_PATTERN = re.compile(r"\[?\b\d{1,2}:\d{2}(?::\d{2})?(?:\.\d+)?\]?")
+
+# Set SCORE_BATCH_MODE=1 to score every transcript in recordings/ as one
+# Gemini Batch API job (discounted, asynchronous) instead of one call per file
+BATCH_MODE = os.environ.get("SCORE_BATCH_MODE") == "1"
+BATCH_POLL_SECONDS = 30
+BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"
+}
+# Batch jobs pin the job description and prompt as cached context; the TTL
+# covers the 24 hour batch window and the cache is deleted once the job ends
+CONTEXT_CACHE_TTL = "86400s"
 
-load_dotenv()
+# score_candidates_concurrently() keeps at most this many scoring requests in flight
+SCORE_CONCURRENCY = int(os.environ.get("SCORE_CONCURRENCY", "8"))
 
-client = genai.Client(
-    api_key=os.environ.get("GEMINI_API_KEY", "<Enter your API key here>"),
+# score_candidates_bulk() limits per request: candidates, and transcript bytes
+# (kept well under the 4 MiB request payload limit)
+BULK_MAX_CANDIDATES = 20
+BULK_MAX_TRANSCRIPT_BYTES = 3 * 1024 * 1024
+
+BULK_SCORING_PROMPT = """
+The job description and the resume are attached once; each candidate section
+below holds one interview transcript, headed by its session ID.
+
+Score every candidate based on the following criteria:
+1. Technical Skills: Evaluate the candidate's proficiency in relevant technical skills and knowledge.
+2. Problem-Solving Ability: Assess the candidate's ability to analyze and solve problems effectively
+3. Communication Skills: Rate the candidate's ability to communicate ideas clearly and effectively.
+4. Cultural Fit: Determine how well the candidate aligns with the company's values and culture.
+5. Overall Impression: Provide an overall score based on the candidate's performance during the interview.
+
+Score resume match and interview performance separately; the final score out of 10 is their average.
+
+Return one object per candidate, in the order given, with its session_id.
+Scores are numbers out of 10. Put the full evaluation with key takeaways in detailed_feedback,
+and recommend one of "hire", "reject" or "second_interview".
+"""
+BULK_SCORING_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        **SCORING_SCHEMA,
+        "properties": {"session_id": {"type": "STRING"}, **SCORING_SCHEMA["properties"]},
+        "required": ["session_id", *SCORING_SCHEMA["required"]],
+    },
+}
+
+# parse_scoring_response() patterns, compiled once rather than per response.
+# Each score is "<keyword> ... [<second keyword> ...] N/10". The N/10 tokens
+# are scanned once and shared, and each score is resolved from its keyword's
+# position instead of a lazy ".*?" scan from every keyword to the next score
+_SCORE_TOKEN_RE = re.compile(r"(\d+(?:\.\d+)?)/10")
+_SCORE_KEYWORDS = {
+    "technical_skills_score": (re.compile("technical"), None),
+    "problem_solving_score": (re.compile(r"problem[\s\-]*solving"), None),
+    "communication_score": (re.compile("communication"), None),
+    "cultural_fit_score": (re.compile("cultural"), re.compile("fit")),
+    "resume_match_score": (re.compile("resume"), re.compile("match")),
+    "interview_performance_score": (re.compile("interview"), re.compile("performance")),
+    "overall_impression_score": (re.compile("overall"), None),
+}
+# The section patterns run case-sensitively on the lower-cased text; their
+# spans then slice the original text, so extracted items keep their case
+_STRENGTHS_RE = re.compile(
+    r"strengths?[:\-\s]*(.*?)(?=areas?\s+for\s+improvement|weaknesses?|cons?:|$)",
+    re.DOTALL,
+)
+_IMPROVEMENTS_RE = re.compile(
+    r"(?:areas?\s+for\s+improvement|weaknesses?|cons?:)[:\-\s]*(.*?)(?=\n\n|$)",
+    re.DOTALL,
 )
+# One item per line, without its "•", "-", "*" or "1." marker. Lines without
+# a marker count too, as the first item's marker is consumed with the heading
+_BULLET_RE = re.compile(r"^[ \t]*(?:(?:[•\-\*]|\d+\.)[ \t]+)?(.+?)[ \t]*$", re.MULTILINE)
 
-def parse_scoring_response(response_text: str) -> Dict[str, Any]:
-    """
-    Parse AI response and extract structured scoring data
-    """
-    scoring_data = {
+def empty_scoring_data(detailed_feedback: str = "") -> Dict[str, Any]:
+    """Scoring fields with nothing scored yet"""
+    return {
         "technical_skills_score": None,
         "technical_skills_reasoning": "",
         "problem_solving_score": None,
@@ -40,43 +125,75 @@ def parse_scoring_response(response_text: str) -> Dict[str, Any]:
         "interview_performance_score": None,
         "overall_impression_score": None,
         "overall_impression_reasoning": "",
-        "detailed_feedback": response_text,
+        "detailed_feedback": detailed_feedback,
         "recommendation": "pending",
         "recommendation_reasoning": "",
         "key_strengths": [],
         "areas_for_improvement": []
     }
-    
-    # Extract numerical scores using regex patterns
-    score_patterns = {
-        "technical_skills_score": r"technical.*?(\d+(?:\.\d+)?)/10",
-        "problem_solving_score": r"problem[\s\-]*solving.*?(\d+(?:\.\d+)?)/10",
-        "communication_score": r"communication.*?(\d+(?:\.\d+)?)/10",
-        "cultural_fit_score": r"cultural.*?fit.*?(\d+(?:\.\d+)?)/10",
-        "overall_impression_score": r"overall.*?(\d+(?:\.\d+)?)/10",
-        "resume_match_score": r"resume.*?match.*?(\d+(?:\.\d+)?)/10",
-        "interview_performance_score": r"interview.*?performance.*?(\d+(?:\.\d+)?)/10"
-    }
+
+def parse_scoring_response(response_text: str) -> Dict[str, Any]:
+    """
+    Parse AI response and extract structured scoring data
+    """
+    scoring_data = empty_scoring_data(response_text)
     
     text_lower = response_text.lower()
     
-    for key, pattern in score_patterns.items():
-        match = re.search(pattern, text_lower, re.IGNORECASE | re.DOTALL)
+    # N/10 tokens in text order, scanned only as far as a lookup needs
+    token_iter = _SCORE_TOKEN_RE.finditer(text_lower)
+    tokens, token_starts = [], []
+    
+    def first_token(pos: int):
+        """The first N/10 token starting at or after pos"""
+        while not token_starts or token_starts[-1] < pos:
+            token = next(token_iter, None)
+            if token is None:
+                break
+            tokens.append(token)
+            token_starts.append(token.start())
+        i = bisect.bisect_left(token_starts, pos)
+        if i < len(tokens):
+            return tokens[i]
+        return None
+    
+    # Extract numerical scores: the first keyword occurrence decides, taking
+    # the first score after it (and after its second keyword). The sum feeds
+    # the fallback final score, in empty_scoring_data() key order
+    score_sum, score_count = 0.0, 0
+    for key, (keyword, second_keyword) in _SCORE_KEYWORDS.items():
+        match = keyword.search(text_lower)
+        if match and second_keyword:
+            match = second_keyword.search(text_lower, match.end())
+        match = match and first_token(match.end())
         if match:
             try:
                 scoring_data[key] = float(match.group(1))
             except (ValueError, AttributeError):
-                pass
+                continue
+            score_sum += scoring_data[key]
+            score_count += 1
     
-    # Extract final score
-    final_score_match = re.search(r"final.*?score.*?(\d+(?:\.\d+)?)/10", text_lower)
+    # Extract final score: "final", "score" and the score on one line
+    final_score_match = None
+    final_pos = text_lower.find("final")
+    while final_pos != -1 and final_score_match is None:
+        line_end = text_lower.find("\n", final_pos)
+        if line_end == -1:
+            line_end = len(text_lower)
+        score_pos = text_lower.find("score", final_pos + len("final"), line_end)
+        if score_pos != -1:
+            final_score_match = _SCORE_TOKEN_RE.search(
+                text_lower, score_pos + len("score"), line_end
+            )
+        # A later "final" on the same line has no more text to match
+        final_pos = text_lower.find("final", line_end)
     if final_score_match:
         scoring_data["final_score"] = float(final_score_match.group(1))
     else:
-        # Calculate weighted average if final score not found
-        scores = [v for k, v in scoring_data.items() if k.endswith("_score") and v is not None]
-        if scores:
-            scoring_data["final_score"] = sum(scores) / len(scores)
+        # Average the extracted scores if final score not found
+        if score_count:
+            scoring_data["final_score"] = score_sum / score_count
     
     # Extract recommendation
     if any(word in text_lower for word in ["recommend", "hire", "accept"]):
@@ -87,24 +204,54 @@ def parse_scoring_response(response_text: str) -> Dict[str, Any]:
     elif any(word in text_lower for word in ["maybe", "second interview", "further"]):
         scoring_data["recommendation"] = "second_interview"
     
-    # Extract key strengths and areas for improvement
-    strengths_section = re.search(r"strengths?[:\-\s]*(.*?)(?=areas?\s+for\s+improvement|weaknesses?|cons?:|$)", 
-                                 response_text, re.IGNORECASE | re.DOTALL)
+    # Extract key strengths and areas for improvement. Sections are found in
+    # lower-cased text whose offsets match response_text; lower() only changes
+    # the length for a few characters (e.g. "İ"), which are then left as is
+    if len(text_lower) == len(response_text):
+        sections_lower = text_lower
+    else:
+        sections_lower = "".join(c if len(c.lower()) != 1 else c.lower() for c in response_text)
+    
+    strengths_section = _STRENGTHS_RE.search(sections_lower)
     if strengths_section:
-        strengths_text = strengths_section.group(1)
+        strengths_text = response_text[strengths_section.start(1):strengths_section.end(1)]
         # Extract bullet points or numbered items
-        strengths = re.findall(r"[•\-\*\d+\.\s]*([^•\-\*\n]+)", strengths_text)
+        strengths = _BULLET_RE.findall(strengths_text)
         scoring_data["key_strengths"] = [s.strip() for s in strengths if s.strip()][:5]
     
-    improvements_section = re.search(r"(?:areas?\s+for\s+improvement|weaknesses?|cons?:)[:\-\s]*(.*?)(?=\n\n|$)", 
-                                   response_text, re.IGNORECASE | re.DOTALL)
+    improvements_section = _IMPROVEMENTS_RE.search(sections_lower)
     if improvements_section:
-        improvements_text = improvements_section.group(1)
-        improvements = re.findall(r"[•\-\*\d+\.\s]*([^•\-\*\n]+)", improvements_text)
+        improvements_text = response_text[improvements_section.start(1):improvements_section.end(1)]
+        improvements = _BULLET_RE.findall(improvements_text)
         scoring_data["areas_for_improvement"] = [i.strip() for i in improvements if i.strip()][:5]
     
     return scoring_data
 
+def scoring_data_from_document(document: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Scoring data from a JSON scoring document, with the final score averaged
+    from the section scores, as parse_scoring_response() does, when it is missing
+    """
+    scoring_data = {**empty_scoring_data(), **document}
+    if scoring_data.get("final_score") is None:
+        scores = [scoring_data[key] for key in _SCORE_KEYWORDS if scoring_data[key] is not None]
+        if scores:
+            scoring_data["final_score"] = sum(scores) / len(scores)
+    return scoring_data
+
+def scoring_data_from_response(response_text: str) -> Dict[str, Any]:
+    """
+    Structured scoring data from a response: the JSON document requested with
+    SCORING_SCHEMA, or parsed from the free-text format of older responses
+    """
+    try:
+        document = json.loads(response_text)
+    except ValueError:
+        document = None
+    if not isinstance(document, dict):
+        return parse_scoring_response(response_text)
+    return scoring_data_from_document(document)
+
 def get_or_create_interview_data(session_id: str) -> Optional[int]:
     """
     Get existing interview data or create if needed
@@ -171,103 +318,421 @@ def get_or_create_interview_data(session_id: str) -> Optional[int]:
     
     return interview_id
 
-def score_candidate_with_database(session_id: Optional[str] = None, 
-                                transcript_file: str = "final_transcription.txt") -> bool:
+def prepare_scoring_session(session_id: Optional[str],
+                            transcript_file: str) -> Optional[Tuple[str, int]]:
     """
-    Score candidate and save results to database
-    
-    Args:
-        session_id: Interview session ID (optional, will be extracted from files)
-        transcript_file: Name of transcript file
-        
+    Resolve the session ID and interview record for a transcript
+
     Returns:
-        bool: True if successful, False otherwise
+        (session_id, interview_id), or None if files or the interview are missing
     """
-    
     # Extract session_id from transcript filename if not provided
     if not session_id:
         transcript_path = Path(transcript_file)
         if "session_" in transcript_path.stem:
             session_id = transcript_path.stem.split("_")[0] + "_" + transcript_path.stem.split("_")[1] + "_" + transcript_path.stem.split("_")[2]
         else:
-            session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            session_id = time.strftime("session_%Y%m%d_%H%M%S")
     
     print(f"Scoring interview session: {session_id}")
     
     # Check if required files exist
-    required_files = [transcript_file, "himanshu-resume.txt", "SDE_JD.txt"]
+    required_files = [transcript_file, RESUME_FILE, JD_FILE]
     missing_files = [f for f in required_files if not Path(f).exists()]
     
     if missing_files:
         print(f"❌ Missing required files: {missing_files}")
-        return False
+        return None
+    
+    # Get or create interview record
+    interview_id = get_or_create_interview_data(session_id)
+    if not interview_id:
+        print("❌ Failed to get or create interview data")
+        return None
     
+    print(f"Using interview ID: {interview_id}")
+    return session_id, interview_id
+
+def scoring_cache_key(inputs: Tuple[bytes, bytes, bytes]) -> str:
+    """SHA-256 over the scoring inputs, prompt and model: equal keys, equal request"""
+    digest = hashlib.sha256()
+    for part in (*inputs, SCORING_PROMPT.encode("utf-8"), SCORING_MODEL.encode("utf-8")):
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+def scoring_context_key(inputs: Tuple[bytes, bytes, bytes]) -> str:
+    """SHA-256 over everything but the transcript, for grouping similar transcripts"""
+    return scoring_cache_key((b"", *inputs[1:]))
+
+def normalize_transcript(transcript: bytes) -> str:
+    """Transcript text without timestamps, lower-cased, whitespace collapsed"""
+    text = TIMESTAMP_PATTERN.sub(" ", transcript.decode("utf-8", errors="replace"))
+    return " ".join(text.lower().split())
+
+def embed_transcript(transcript: bytes) -> Optional[List[float]]:
+    """L2-normalized embedding of the normalized transcript, or None on failure"""
     try:
-        # Initialize database operations
-        db_ops = get_db_ops()
+        result = get_client().models.embed_content(
+            model=EMBEDDING_MODEL, contents=normalize_transcript(transcript)
+        )
+        values = result.embeddings[0].values
+        norm = math.sqrt(math.fsum(v * v for v in values))
+        return [v / norm for v in values] if norm else None
+    except Exception as e:
+        print(f"⚠️ Could not embed transcript, skipping similarity cache: {e}")
+        return None
+
+def upload_shared_files() -> Tuple[types.Part, types.Part]:
+    """
+    Upload the resume and job description once through the Files API
+
+    Requests for several candidates then reference the uploads by URI instead
+    of re-sending both files each time. Uploads expire after 48 hours, so the
+    parts are meant for one scoring run.
+
+    Returns:
+        tuple: (resume part, job description part)
+    """
+    from google.genai import types
+
+    uploads = [
+        get_client().files.upload(file=path, config={"mime_type": "text/plain"})
+        for path in (RESUME_FILE, JD_FILE)
+    ]
+    resume, jd = (types.Part.from_uri(file_uri=f.uri, mime_type=f.mime_type) for f in uploads)
+    return resume, jd
+
+def create_context_cache(jd_part: types.Part) -> Optional[str]:
+    """
+    Cache the job description and scoring prompt server-side for CONTEXT_CACHE_TTL
+
+    Requests that pass the cache name in their config send only the
+    transcript and resume, and the cached tokens are billed at a lower rate.
+
+    Returns:
+        str: Cache name, or None if caching isn't available (e.g. the context
+        is under the model's minimum cacheable size)
+    """
+    from google.genai import types
+
+    try:
+        cache = get_client().caches.create(
+            model=SCORING_MODEL,
+            config=types.CreateCachedContentConfig(
+                contents=[{
+                    "role": "user",
+                    "parts": [jd_part, types.Part.from_text(text=SCORING_PROMPT)]
+                }],
+                ttl=CONTEXT_CACHE_TTL,
+            ),
+        )
+        return cache.name
+    except Exception as e:
+        print(f"⚠️ Could not cache scoring context, sending it with each request: {e}")
+        return None
+
+def score_candidate_with_database(session_id: Optional[str] = None, 
+                                transcript_file: str = "final_transcription.txt",
+                                force_refresh: bool = False,
+                                shared_parts: Optional[Tuple[types.Part, types.Part]] = None) -> bool:
+    """
+    Score candidate and save results to database
+    
+    Responses are cached in the scoring_cache table by a hash of the inputs,
+    so re-scoring unchanged files doesn't call the model again. With
+    SIMILARITY_CACHE on, a miss can also reuse this interview's response for
+    a near-identical transcript from scoring_embeddings.
+    
+    Args:
+        session_id: Interview session ID (optional, will be extracted from files)
+        transcript_file: Name of transcript file
+        force_refresh: Call the model even if a cached response exists
+        shared_parts: Uploaded (resume, job description) parts to reference
+            instead of sending the files, see upload_shared_files()
         
-        # Get or create interview record
-        interview_id = get_or_create_interview_data(session_id)
-        if not interview_id:
-            print("❌ Failed to get or create interview data")
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        prepared = prepare_scoring_session(session_id, transcript_file)
+        if not prepared:
             return False
+        session_id, interview_id = prepared
+        db_ops = get_db_ops()
         
-        print(f"Using interview ID: {interview_id}")
+        inputs = read_scoring_inputs(transcript_file)
+        cache_key = scoring_cache_key(inputs)
+        response_text = None if force_refresh else db_ops.get_cached_scoring(cache_key)
         
-        # Generate AI scoring (existing logic)
-        print("Generating AI scoring analysis...")
+        embedding = context_key = None
+        if response_text:
+            print("✅ Using cached AI scoring for unchanged inputs")
+        elif SIMILARITY_CACHE and not force_refresh:
+            context_key = scoring_context_key(inputs)
+            embedding = embed_transcript(inputs[0])
+            if embedding:
+                response_text = db_ops.find_similar_scoring(
+                    interview_id, context_key, embedding, SIMILARITY_THRESHOLD
+                )
+                if response_text:
+                    print("✅ Using cached AI scoring for a near-identical transcript")
+                    db_ops.cache_scoring(cache_key, response_text, SCORING_MODEL)
         
-        response = client.models.generate_content(
-            model="gemini-2.5-pro",
-            contents={
-                "role": "user",
-                "parts": [
-                    types.Part.from_bytes(
-                        mime_type="text/plain",
-                        data=open(transcript_file, "rb").read()
-                    ),
-                    types.Part.from_bytes(
-                        mime_type="text/plain",
-                        data=open("himanshu-resume.txt", "rb").read()
-                    ),
-                    types.Part.from_bytes(
-                        mime_type="text/plain",
-                        data=open("SDE_JD.txt", "rb").read()
-                    ),
-                    types.Part.from_text(
-                        text="""
-Score the candidate based on the following criteria:
-1. Technical Skills: Evaluate the candidate's proficiency in relevant technical skills and knowledge.
-2. Problem-Solving Ability: Assess the candidate's ability to analyze and solve problems effectively
-3. Communication Skills: Rate the candidate's ability to communicate ideas clearly and effectively.
-4. Cultural Fit: Determine how well the candidate aligns with the company's values and culture.
-5. Overall Impression: Provide an overall score based on the candidate's performance during the interview.
+        if not response_text:
+            # Generate AI scoring (existing logic)
+            print("Generating AI scoring analysis...")
+            
+            response_text = call_gemini_scorer(
+                inputs, shared_parts, progress_file=scoring_output_file(session_id)
+            )
+            db_ops.cache_scoring(cache_key, response_text, SCORING_MODEL)
+            if embedding:
+                db_ops.cache_scoring_embedding(
+                    interview_id, context_key, embedding, response_text
+                )
+            
+            print("✅ AI scoring completed")
+        return save_scoring_results(
+            session_id, interview_id, transcript_file, response_text, transcript=inputs[0]
+        )
+        
+    except Exception as e:
+        print(f"❌ Error during scoring: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def score_sessions_batch(sessions: List[Tuple[str, str]]) -> Dict[str, bool]:
+    """
+    Score many sessions as one Gemini Batch API job and save each result
 
-Give reasonings and key takeaways for each criteria. Provide a final score out of 10.
-Give Scores for resume match and interview performance separately and then take an average of both to give final score out of 10.
+    Batch jobs are billed at a discount and finish asynchronously (usually in
+    minutes), which suits scoring completed interviews offline.
 
-Format your response with clear sections and numerical scores out of 10 for each criteria.
-"""
-                    )
-                ]
-            }
+    Args:
+        sessions: (session_id, transcript_file) pairs
+
+    Returns:
+        dict: session_id -> True if that session was scored and saved
+    """
+    results = {session_id: False for session_id, _ in sessions}
+    try:
+        db_ops = get_db_ops()
+        prepared = []
+        for session_id, transcript_file in sessions:
+            session = prepare_scoring_session(session_id, transcript_file)
+            if not session:
+                continue
+            inputs = read_scoring_inputs(transcript_file)
+            cache_key = scoring_cache_key(inputs)
+            cached = db_ops.get_cached_scoring(cache_key)
+            if cached:
+                print(f"✅ Using cached AI scoring for {session[0]}")
+                results[session[0]] = save_scoring_results(
+                    *session, transcript_file, cached, transcript=inputs[0]
+                )
+            else:
+                prepared.append((*session, transcript_file, inputs, cache_key))
+        if not prepared:
+            return results
+
+        # Several requests share one upload of the resume and job description,
+        # and one cached copy of the job description and prompt
+        shared_parts = context_cache = None
+        if len(prepared) > 1:
+            shared_parts = upload_shared_files()
+            context_cache = create_context_cache(shared_parts[1])
+        config = scoring_config(context_cache)
+        print(f"Submitting batch scoring job for {len(prepared)} sessions...")
+        batch = get_client().batches.create(
+            model=SCORING_MODEL,
+            src=[{"contents": [scoring_contents(inputs, shared_parts, context_cache is not None)],
+                  "config": config}
+                 for _, _, _, inputs, _ in prepared],
+            config={"display_name": time.strftime("scoring_%Y%m%d_%H%M%S")},
         )
+        while batch.state.name not in BATCH_DONE_STATES:
+            print(f"Batch {batch.name}: {batch.state.name}, waiting...")
+            time.sleep(BATCH_POLL_SECONDS)
+            batch = get_client().batches.get(name=batch.name)
+        if context_cache:
+            get_client().caches.delete(name=context_cache)
+
+        if batch.state.name != "JOB_STATE_SUCCEEDED":
+            print(f"❌ Batch {batch.name} ended with {batch.state.name}")
+            return results
+
+        # Inlined responses come back in request order
+        for (session_id, interview_id, transcript_file, inputs, cache_key), inlined in zip(
+            prepared, batch.dest.inlined_responses
+        ):
+            if inlined.error or not inlined.response:
+                print(f"❌ Scoring failed for {session_id}: {inlined.error}")
+                continue
+            db_ops.cache_scoring(cache_key, inlined.response.text, SCORING_MODEL)
+            results[session_id] = save_scoring_results(
+                session_id, interview_id, transcript_file, inlined.response.text,
+                transcript=inputs[0]
+            )
+        return results
+
+    except Exception as e:
+        print(f"❌ Error during batch scoring: {e}")
+        import traceback
+        traceback.print_exc()
+        return results
+
+def score_candidates_concurrently(sessions: List[Tuple[str, str]],
+                                  max_workers: int = SCORE_CONCURRENCY) -> Dict[str, bool]:
+    """
+    Score each session with its own request, several requests at a time
+
+    Each session goes through score_candidate_with_database(), so caching and
+    saving are unchanged; wall-clock time is bounded by the slowest requests
+    rather than their sum. Database writes stay serialized by the database
+    manager's write lock.
+
+    Args:
+        sessions: (session_id, transcript_file) pairs
+
+    Returns:
+        dict: session_id -> True if that session was scored and saved
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scoring") as pool:
+        outcomes = pool.map(lambda session: score_candidate_with_database(*session), sessions)
+        return {session_id: ok for (session_id, _), ok in zip(sessions, outcomes)}
+
+def _bulk_chunks(prepared: List[Tuple[str, int, str, bytes]]):
+    """Split prepared sessions into groups that fit one bulk scoring request"""
+    chunk, chunk_bytes = [], 0
+    for session in prepared:
+        size = len(session[3])
+        if chunk and (len(chunk) >= BULK_MAX_CANDIDATES
+                      or chunk_bytes + size > BULK_MAX_TRANSCRIPT_BYTES):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(session)
+        chunk_bytes += size
+    if chunk:
+        yield chunk
+
+def score_candidates_bulk(sessions: List[Tuple[str, str]]) -> Dict[str, bool]:
+    """
+    Score many candidates with one generate_content call per group
+
+    The job description and resume are sent once per request and every
+    transcript is appended as its own section; the model returns a JSON array
+    keyed by session ID. Groups are split to stay under the request size limit.
+
+    Args:
+        sessions: (session_id, transcript_file) pairs
+
+    Returns:
+        dict: session_id -> True if that session was scored and saved
+    """
+    from google.genai import types
+
+    results = {session_id: False for session_id, _ in sessions}
+    try:
+        prepared = []
+        for session_id, transcript_file in sessions:
+            session = prepare_scoring_session(session_id, transcript_file)
+            if session:
+                prepared.append((*session, transcript_file, read_bytes_mmap(transcript_file)))
+        if not prepared:
+            return results
+
+        chunks = list(_bulk_chunks(prepared))
+        if len(chunks) > 1:
+            # Several requests share one upload of the resume and job description
+            resume_part, jd_part = upload_shared_files()
+            shared_parts = [jd_part, resume_part]
+        else:
+            shared_parts = [
+                types.Part.from_bytes(mime_type="text/plain", data=read_bytes_mmap(JD_FILE)),
+                types.Part.from_bytes(mime_type="text/plain", data=read_bytes_mmap(RESUME_FILE)),
+            ]
+        for chunk in chunks:
+            print(f"Scoring {len(chunk)} candidates in one request...")
+            parts = list(shared_parts)
+            for session_id, _, _, transcript in chunk:
+                parts.append(types.Part.from_text(
+                    text=f"### CANDIDATE {session_id}\nTranscript:\n"
+                         + transcript.decode("utf-8")
+                ))
+            parts.append(types.Part.from_text(text=BULK_SCORING_PROMPT))
+
+            response = get_client().models.generate_content(
+                model=SCORING_MODEL,
+                contents={"role": "user", "parts": parts},
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    response_schema=BULK_SCORING_SCHEMA,
+                ),
+            )
+            scored = {item.get("session_id"): item for item in json.loads(response.text)}
+
+            for session_id, interview_id, transcript_file, transcript in chunk:
+                item = scored.get(session_id)
+                if not item:
+                    print(f"❌ No score returned for {session_id}")
+                    continue
+                scoring_data = scoring_data_from_document(item)
+                scoring_data.pop("session_id", None)
+                results[session_id] = save_scoring_results(
+                    session_id, interview_id, transcript_file,
+                    json.dumps(item, indent=2), scoring_data, transcript
+                )
+        return results
+
+    except Exception as e:
+        print(f"❌ Error during bulk scoring: {e}")
+        import traceback
+        traceback.print_exc()
+        return results
+
+def scoring_output_file(session_id: str) -> str:
+    """Where a session's scoring response is written"""
+    return f"recordings/{session_id}_score.txt" if Path("recordings").exists() else "final_evaluation.txt"
+
+def save_scoring_results(session_id: str, interview_id: int,
+                         transcript_file: str, response_text: str,
+                         scoring_data: Optional[Dict[str, Any]] = None,
+                         transcript: Optional[bytes] = None) -> bool:
+    """
+    Save a scoring response to file and to the database
+
+    Args:
+        scoring_data: Already structured scores; loaded from response_text if omitted
+        transcript: The transcript file's bytes if already read for scoring
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        db_ops = get_db_ops()
         
-        print("✅ AI scoring completed")
-        
-        # Save original response to file (backward compatibility)
-        output_file = f"recordings/{session_id}_score.txt" if Path("recordings").exists() else "final_evaluation.txt"
+        # Save the readable evaluation to file (backward compatibility)
+        output_file = scoring_output_file(session_id)
         with open(output_file, "w", encoding="utf-8") as f:
-            f.write(response.text)
+            f.write(format_evaluation(response_text))
         print(f"✅ Score saved to {output_file}")
         
-        # Parse structured scoring data
-        scoring_data = parse_scoring_response(response.text)
+        # Load structured scoring data
+        if scoring_data is None:
+            scoring_data = scoring_data_from_response(response_text)
+        # Loading already averaged the section scores into a missing final
+        # score, so it is only missing when nothing was scored
+        final_score = scoring_data.get("final_score")
+        if final_score is None:
+            final_score = 5.0
+            print(f"⚠️ The scoring response has no scores, using {final_score:.1f}")
         
         # Save to database
         print("Saving scoring analysis to database...")
         analysis_id = db_ops.create_scoring_analysis(
-            interview_id, scoring_data, "gemini-2.5-pro"
+            interview_id, scoring_data, SCORING_MODEL
         )
         
         if analysis_id:
@@ -277,12 +742,11 @@ Format your response with clear sections and numerical scores out of 10 for each
             return False
         
         # Save final score
-        final_score = scoring_data.get("final_score", 5.0)
         recommendation = scoring_data.get("recommendation", "pending")
         
         final_score_id = db_ops.create_final_score(
             interview_id, final_score, recommendation,
-            scoring_methodology="AI-generated evaluation using gemini-2.5-pro",
+            scoring_methodology=f"AI-generated evaluation using {SCORING_MODEL}",
             confidence_level=0.8,  # Default confidence
             decision_reasoning=scoring_data.get("recommendation_reasoning", "Based on comprehensive AI analysis")
         )
@@ -294,12 +758,11 @@ Format your response with clear sections and numerical scores out of 10 for each
             return False
         
         # Add transcript to database if not already added
-        recordings = db_ops.get_interview_recordings(interview_id)
-        transcript_exists = any(r["recording_type"] == "transcript" for r in recordings)
-        
-        if not transcript_exists:
-            with open(transcript_file, 'r', encoding='utf-8') as f:
-                transcript_text = f.read()
+        if not db_ops.has_interview_recording(interview_id, "transcript"):
+            if transcript is None:
+                transcript = read_bytes_mmap(transcript_file)
+            # Newlines normalized as reading the file in text mode would
+            transcript_text = transcript.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
             
             recording_id = db_ops.add_interview_recording(
                 interview_id, "transcript",
@@ -328,7 +791,7 @@ Format your response with clear sections and numerical scores out of 10 for each
         return True
         
     except Exception as e:
-        print(f"❌ Error during scoring: {e}")
+        print(f"❌ Error saving scoring results: {e}")
         import traceback
         traceback.print_exc()
         return False
@@ -339,6 +802,9 @@ def main():
     print("AI Interview Scoring with Database Integration")
     print("=" * 50)
     
+    # Keep the scoring cache to its 30 day window
+    get_db_ops().purge_scoring_cache()
+    
     # Check for existing recording files
     recordings_dir = Path("recordings")
     transcript_files = []
@@ -346,23 +812,43 @@ def main():
     if recordings_dir.exists():
         transcript_files = list(recordings_dir.glob("*formatted_transcript.txt"))
     
-    if transcript_files:
+    sessions = [
+        (file.stem.replace("_formatted_transcript", ""), str(file))
+        for file in transcript_files
+    ]
+    
+    if transcript_files and BATCH_MODE:
+        results = score_sessions_batch(sessions)
+        for session_id, ok in results.items():
+            print(f"  {'✅' if ok else '❌'} {session_id}")
+        success = all(results.values())
+    
+    elif transcript_files:
         print(f"Found {len(transcript_files)} transcript files:")
         for i, file in enumerate(transcript_files):
             print(f"  {i+1}. {file.name}")
         
         try:
-            choice = input(f"\nSelect file (1-{len(transcript_files)}) or press Enter for latest: ").strip()
-            if choice:
-                selected_file = transcript_files[int(choice)-1]
+            choice = input(f"\nSelect file (1-{len(transcript_files)}), 'a' to score all together, 'p' to score all in parallel, or press Enter for latest: ").strip()
+            if choice.lower() in ("a", "p"):
+                if choice.lower() == "a":
+                    results = score_candidates_bulk(sessions)
+                else:
+                    results = score_candidates_concurrently(sessions)
+                for session_id, ok in results.items():
+                    print(f"  {'✅' if ok else '❌'} {session_id}")
+                success = all(results.values())
             else:
-                selected_file = max(transcript_files, key=lambda f: f.stat().st_mtime)
-            
-            # Extract session ID from filename
-            session_id = selected_file.stem.replace("_formatted_transcript", "")
-            
-            print(f"Processing: {selected_file}")
-            success = score_candidate_with_database(session_id, str(selected_file))
+                if choice:
+                    selected_file = transcript_files[int(choice)-1]
+                else:
+                    selected_file = max(transcript_files, key=lambda f: f.stat().st_mtime)
+                
+                # Extract session ID from filename
+                session_id = selected_file.stem.replace("_formatted_transcript", "")
+                
+                print(f"Processing: {selected_file}")
+                success = score_candidate_with_database(session_id, str(selected_file))
             
         except (ValueError, IndexError, KeyboardInterrupt):
             print("Invalid selection or cancelled")
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Shared Gemini scoring core
+
+The model, prompt, output schema and request layout used by both
+score_candidate.py and score_candidate_with_db.py, so changes to how a
+candidate is scored are made in one place.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+
+# google.genai takes hundreds of milliseconds to import, so it is imported
+# on first use rather than when a CLI starts up
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
+
+load_dotenv()
+
+SCORING_MODEL = "gemini-2.5-pro"
+RESUME_FILE = "himanshu-resume.txt"
+JD_FILE = "SDE_JD.txt"
+
+SCORING_PROMPT = """
+Score the candidate based on the following criteria:
+1. Technical Skills: Evaluate the candidate's proficiency in relevant technical skills and knowledge.
+2. Problem-Solving Ability: Assess the candidate's ability to analyze and solve problems effectively
+3. Communication Skills: Rate the candidate's ability to communicate ideas clearly and effectively.
+4. Cultural Fit: Determine how well the candidate aligns with the company's values and culture.
+5. Overall Impression: Provide an overall score based on the candidate's performance during the interview.
+
+Give reasonings and key takeaways for each criteria. Provide a final score out of 10.
+Give Scores for resume match and interview performance separately and then take an average of both to give final score out of 10.
+
+Scores are numbers out of 10. Put the full evaluation with key takeaways in detailed_feedback,
+and recommend one of "hire", "reject" or "second_interview".
+"""
+
+# Structured output for a scoring response: the scoring_data fields saved by
+# score_candidate_with_db plus final_score, so responses load with json.loads
+SCORE_FIELDS = (
+    "technical_skills_score", "problem_solving_score", "communication_score",
+    "cultural_fit_score", "resume_match_score", "interview_performance_score",
+    "overall_impression_score", "final_score",
+)
+REASONING_FIELDS = (
+    "technical_skills_reasoning", "problem_solving_reasoning", "communication_reasoning",
+    "cultural_fit_reasoning", "overall_impression_reasoning", "detailed_feedback",
+    "recommendation_reasoning",
+)
+SCORING_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        **{field: {"type": "NUMBER"} for field in SCORE_FIELDS},
+        **{field: {"type": "STRING"} for field in REASONING_FIELDS},
+        "recommendation": {"type": "STRING", "enum": ["hire", "reject", "second_interview"]},
+        "key_strengths": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "areas_for_improvement": {"type": "ARRAY", "items": {"type": "STRING"}},
+    },
+    "required": [*SCORE_FIELDS, "detailed_feedback", "recommendation"],
+}
+
+# format_evaluation() sections, in reading order: (heading, score field,
+# reasoning field)
+EVALUATION_SECTIONS = (
+    ("Technical Skills", "technical_skills_score", "technical_skills_reasoning"),
+    ("Problem Solving", "problem_solving_score", "problem_solving_reasoning"),
+    ("Communication", "communication_score", "communication_reasoning"),
+    ("Cultural Fit", "cultural_fit_score", "cultural_fit_reasoning"),
+    ("Resume Match", "resume_match_score", None),
+    ("Interview Performance", "interview_performance_score", None),
+    ("Overall Impression", "overall_impression_score", "overall_impression_reasoning"),
+)
+
+# Files above this size get a sequential read-ahead hint before they're mapped
+FADVISE_MIN_BYTES = 1024 * 1024
+
+# The transcript, resume and job description are read concurrently, so a
+# cold page cache costs one file's stall rather than three
+_read_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="scoring-read")
+
+
+@lru_cache(maxsize=None)
+def get_client() -> genai.Client:
+    """The shared Gemini client for scoring, created on first use"""
+    from google import genai
+
+    return genai.Client(
+        api_key=os.environ.get("GEMINI_API_KEY", "<Enter your API key here>"),
+    )
+
+
+def read_bytes_mmap(path: str) -> bytes:
+    """Read a file through a read-only memory map, closing it afterwards"""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return b""  # mmap cannot map an empty file
+        if size > FADVISE_MIN_BYTES and hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:]
+
+
+def read_scoring_inputs(transcript_file: str) -> Tuple[bytes, bytes, bytes]:
+    """The transcript, resume and job description sent for scoring"""
+    return tuple(_read_pool.map(read_bytes_mmap, (transcript_file, RESUME_FILE, JD_FILE)))
+
+@lru_cache(maxsize=8)
+def scoring_config(context_cache: Optional[str] = None) -> types.GenerateContentConfig:
+    """JSON output config for SCORING_SCHEMA, reading the job description and prompt from context_cache if given"""
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_schema=SCORING_SCHEMA,
+        cached_content=context_cache,
+    )
+
+
+def scoring_contents(inputs: Tuple[bytes, bytes, bytes],
+                     shared_parts: Optional[Tuple[types.Part, types.Part]] = None,
+                     context_cached: bool = False) -> Dict[str, Any]:
+    """
+    The scoring request: transcript, resume and job description plus the prompt
+
+    Args:
+        shared_parts: Uploaded (resume, job description) parts, used in place
+            of the file bytes
+        context_cached: The job description and prompt come from a context
+            cache, so only send the transcript and resume
+    """
+    from google.genai import types
+
+    transcript = types.Part.from_bytes(mime_type="text/plain", data=inputs[0])
+    if shared_parts is None:
+        shared_parts = [types.Part.from_bytes(mime_type="text/plain", data=data) for data in inputs[1:]]
+    if context_cached:
+        return {"role": "user", "parts": [transcript, shared_parts[0]]}
+    return {
+        "role": "user",
+        "parts": [transcript, *shared_parts, types.Part.from_text(text=SCORING_PROMPT)]
+    }
+
+
+def call_gemini_scorer(inputs: Tuple[bytes, bytes, bytes],
+                       shared_parts: Optional[Tuple[types.Part, types.Part]] = None,
+                       progress_file: Optional[str] = None) -> str:
+    """
+    Score one candidate and return the model's JSON response text
+
+    The response is streamed; with progress_file, each chunk is written and
+    flushed as it arrives, so a long generation can be followed (and a
+    failed one leaves its partial output behind).
+
+    Args:
+        inputs: Transcript, resume and job description bytes
+        shared_parts: Uploaded (resume, job description) parts, see scoring_contents()
+        progress_file: Path to write the response to while it streams
+    """
+    stream = get_client().models.generate_content_stream(
+        model=SCORING_MODEL,
+        contents=scoring_contents(inputs, shared_parts),
+        config=scoring_config(),
+    )
+    chunks = []
+    with open(progress_file or os.devnull, "w", encoding="utf-8") as f:
+        for chunk in stream:
+            if chunk.text:
+                chunks.append(chunk.text)
+                f.write(chunk.text)
+                f.flush()
+    return "".join(chunks)
+
+
+def format_evaluation(response_text: str) -> str:
+    """
+    Render a JSON scoring response as the plain-text evaluation people read
+
+    Text that isn't a JSON object, such as an older free-text response, is
+    returned unchanged.
+    """
+    try:
+        data = json.loads(response_text)
+    except ValueError:
+        return response_text
+    if not isinstance(data, dict):
+        return response_text
+
+    def score(value: Any) -> str:
+        return f"{value:g}/10" if isinstance(value, (int, float)) else "N/A"
+
+    lines = [f"Final Score: {score(data.get('final_score'))}"]
+    if data.get("recommendation"):
+        lines.append(f"Recommendation: {data['recommendation'].replace('_', ' ').title()}")
+    if data.get("recommendation_reasoning"):
+        lines.append(data["recommendation_reasoning"])
+    for heading, score_field, reasoning_field in EVALUATION_SECTIONS:
+        lines += ["", f"{heading}: {score(data.get(score_field))}"]
+        if reasoning_field and data.get(reasoning_field):
+            lines.append(data[reasoning_field])
+    for heading, field in (
+        ("Key Strengths", "key_strengths"),
+        ("Areas for Improvement", "areas_for_improvement"),
+    ):
+        if data.get(field):
+            lines += ["", f"{heading}:", *(f"- {item}" for item in data[field])]
+    if data.get("detailed_feedback"):
+        lines += ["", "Detailed Feedback:", data["detailed_feedback"]]
+    return "\n".join(lines) + "\n"
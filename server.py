@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 import requests
 
 from fastapi import (
+    Depends,
     FastAPI,
     WebSocket,
     WebSocketDisconnect,
@@ -40,7 +41,7 @@ from live_config import (
     DEFAULT_JOB_DESCRIPTION_TEXT,
     DEFAULT_RESUME_TEXT,
     build_live_config,
-    client,
+    get_client,
 )
 from enhanced_ai_config import get_enhanced_ai_config
 
@@ -57,6 +58,8 @@ try:
         JobDescription,
         Resume,
         Interview,
+        close_db_ops,
+        get_db_ops as get_shared_db_ops,
     )
 
     DATABASE_AVAILABLE = True
@@ -67,6 +70,17 @@ except ImportError:
     )
 
 
+def get_db_ops():
+    """FastAPI dependency: the process-wide InterviewDatabaseOps, or a 503.
+
+    The instance is the one database_operations.get_db_ops() shares with the
+    scoring code, so its connection pool and caches stay warm across requests.
+    """
+    if not DATABASE_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Database not available")
+    return get_shared_db_ops()
+
+
 # Pydantic models for API requests
 class JobDescriptionCreate(BaseModel):
     title: str
@@ -104,8 +118,9 @@ FINAL_SIGNOFF_PHRASES = (
 
 app = FastAPI(title="Live Interview API")
 
-# Add compression middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add compression middleware; level 5 keeps most of level 9's ratio on JSON
+# for a fraction of the CPU per response
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
 
 app.add_middleware(
     CORSMiddleware,
@@ -116,6 +131,20 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+def prepare_database() -> None:
+    """Bring an existing database up to date before serving requests."""
+    if DATABASE_AVAILABLE and not get_shared_db_ops().db_manager.prepare_database():
+        raise RuntimeError("Database could not be prepared; see the log for details")
+
+
+@app.on_event("shutdown")
+def shutdown_db_ops() -> None:
+    """Close the shared database connections when the server stops."""
+    if DATABASE_AVAILABLE:
+        close_db_ops()
+
+
 @app.get("/health")
 async def healthcheck() -> Dict[str, str]:
     return {"status": "ok"}
@@ -157,13 +186,12 @@ async def login(login_request: LoginRequest):
 
 # Job Descriptions
 @app.get("/api/jobs")
-async def get_job_descriptions(response: Response):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def get_job_descriptions(
+    response: Response,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
-        jobs = db_ops.list_job_descriptions(active_only=True)
+        jobs = await asyncio.to_thread(db_ops.list_job_descriptions, active_only=True)
 
         # Add caching headers for better performance
         response.headers["Cache-Control"] = "public, max-age=300"  # 5 minutes
@@ -175,12 +203,11 @@ async def get_job_descriptions(response: Response):
 
 
 @app.post("/api/jobs")
-async def create_job_description(job_data: JobDescriptionCreate):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def create_job_description(
+    job_data: JobDescriptionCreate,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
         # Create JobDescription dataclass object
         job_desc = JobDescription(
             title=job_data.title,
@@ -192,7 +219,7 @@ async def create_job_description(job_data: JobDescriptionCreate):
             location=job_data.location,
             salary_range=job_data.salary_range,
         )
-        job_id = db_ops.create_job_description(job_desc)
+        job_id = await asyncio.to_thread(db_ops.create_job_description, job_desc)
         return {"id": job_id, "message": "Job description created successfully"}
     except Exception as e:
         logger.error(f"Error creating job description: {e}")
@@ -200,13 +227,12 @@ async def create_job_description(job_data: JobDescriptionCreate):
 
 
 @app.get("/api/jobs/{job_id}")
-async def get_job_description(job_id: int):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def get_job_description(
+    job_id: int,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
-        job = db_ops.get_job_description(job_id)
+        job = await asyncio.to_thread(db_ops.get_job_description, job_id)
         if not job:
             raise HTTPException(status_code=404, detail="Job description not found")
         return job
@@ -217,13 +243,12 @@ async def get_job_description(job_id: int):
 
 # Resumes/Candidates
 @app.get("/api/resumes")
-async def get_resumes(response: Response):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def get_resumes(
+    response: Response,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
-        resumes = db_ops.list_resumes(active_only=True)
+        resumes = await asyncio.to_thread(db_ops.list_resumes, active_only=True)
 
         # Add caching headers for better performance
         response.headers["Cache-Control"] = "public, max-age=300"  # 5 minutes
@@ -235,12 +260,11 @@ async def get_resumes(response: Response):
 
 
 @app.post("/api/resumes")
-async def create_resume(resume_data: ResumeCreate):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def create_resume(
+    resume_data: ResumeCreate,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
         # Create Resume dataclass object
         resume = Resume(
             candidate_name=resume_data.candidate_name,
@@ -251,7 +275,7 @@ async def create_resume(resume_data: ResumeCreate):
             education=resume_data.education,
             experience_years=resume_data.experience_years,
         )
-        resume_id = db_ops.create_resume(resume)
+        resume_id = await asyncio.to_thread(db_ops.create_resume, resume)
         return {"id": resume_id, "message": "Resume created successfully"}
     except Exception as e:
         logger.error(f"Error creating resume: {e}")
@@ -263,14 +287,12 @@ async def upload_resume(
     candidate_name: str = Form(...),
     email: Optional[str] = Form(None),
     resume_file: UploadFile = File(...),
+    db_ops=Depends(get_db_ops),
 ):
     """Upload a resume file and create a resume record.
     - text files will be read into resume_text
     - other files (pdf, docx) will be stored and path saved in resume_pdf_path
     """
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
     try:
         # Save uploaded file
         uploads_dir = Path(BASE_DIR) / "uploads" / "resumes"
@@ -296,7 +318,6 @@ async def upload_resume(
             resume_text = None
 
         # Create resume record
-        db_ops = InterviewDatabaseOps()
         if details:
             resume = Resume(
                 candidate_name=details.get("candidate_name"),
@@ -317,7 +338,7 @@ async def upload_resume(
         #     email=email,
         #     resume_pdf_path=str(dest_path),
         # )
-        resume_id = db_ops.create_resume(resume)
+        resume_id = await asyncio.to_thread(db_ops.create_resume, resume)
 
         return {"id": resume_id, "message": "Resume uploaded and created successfully"}
 
@@ -327,13 +348,12 @@ async def upload_resume(
 
 
 @app.get("/api/resumes/{resume_id}")
-async def get_resume(resume_id: int):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def get_resume(
+    resume_id: int,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
-        resume = db_ops.get_resume(resume_id)
+        resume = await asyncio.to_thread(db_ops.get_resume, resume_id)
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         return resume
@@ -344,14 +364,10 @@ async def get_resume(resume_id: int):
 
 # Interviews
 @app.get("/api/interviews")
-async def get_interviews():
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def get_interviews(db_ops=Depends(get_db_ops)):
     try:
-        db_ops = InterviewDatabaseOps()
         # Get all interviews
-        interviews = db_ops.list_interviews(limit=50)
+        interviews = await asyncio.to_thread(db_ops.list_interviews, limit=50)
         return {"interviews": interviews}
     except Exception as e:
         logger.error(f"Error fetching interviews: {e}")
@@ -359,12 +375,11 @@ async def get_interviews():
 
 
 @app.post("/api/interviews")
-async def create_interview(interview_data: InterviewCreate):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def create_interview(
+    interview_data: InterviewCreate,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
         # Create Interview dataclass object
         interview = Interview(
             job_description_id=interview_data.job_description_id,
@@ -374,8 +389,9 @@ async def create_interview(interview_data: InterviewCreate):
             interview_link=f"http://localhost:5173/interview/{interview_data.session_id}",
             status="scheduled",  # Set default status
         )
-        resume = db_ops.get_resume(interview_data.resume_id)  # Verify resume exists
-        interview_id = db_ops.create_interview(interview)
+        # Verify resume exists
+        resume = await asyncio.to_thread(db_ops.get_resume, interview_data.resume_id)
+        interview_id = await asyncio.to_thread(db_ops.create_interview, interview)
         if interview_id:
             send_email(
                 recipients=[resume.get("email")],
@@ -389,15 +405,20 @@ async def create_interview(interview_data: InterviewCreate):
 
 
 @app.get("/api/interview-session/{session_id}")
-async def get_interview_details(session_id: str):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def get_interview_details(
+    session_id: str,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
-        interview_details = db_ops.get_interview_by_session(session_id)
-        jd = db_ops.get_job_description(interview_details["job_description_id"])
-        resume = db_ops.get_resume(interview_details["resume_id"])
+        interview_details = await asyncio.to_thread(
+            db_ops.get_interview_by_session, session_id
+        )
+        jd = await asyncio.to_thread(
+            db_ops.get_job_description, interview_details["job_description_id"]
+        )
+        resume = await asyncio.to_thread(
+            db_ops.get_resume, interview_details["resume_id"]
+        )
         if not interview_details:
             raise HTTPException(status_code=404, detail="Interview not found")
         return {
@@ -411,13 +432,14 @@ async def get_interview_details(session_id: str):
 
 
 @app.get("/api/interviews/{interview_id}")
-async def get_interview_details(interview_id: str):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def get_interview_details(
+    interview_id: str,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
-        interview_details = db_ops.get_interview_full_results(interview_id)
+        interview_details = await asyncio.to_thread(
+            db_ops.get_interview_full_results, interview_id
+        )
         if not interview_details:
             raise HTTPException(status_code=404, detail="Interview not found")
         return interview_details
@@ -427,13 +449,14 @@ async def get_interview_details(interview_id: str):
 
 
 @app.get("/api/interviews/{interview_id}/results")
-async def get_interview_results(interview_id: int):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def get_interview_results(
+    interview_id: int,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
-        interview_summary = db_ops.get_interview_summary(interview_id)
+        interview_summary = await asyncio.to_thread(
+            db_ops.get_interview_summary, interview_id
+        )
         if not interview_summary:
             raise HTTPException(status_code=404, detail="Interview not found")
         return interview_summary
@@ -475,37 +498,17 @@ async def executeCode(request: Request):
 
 # Analytics
 @app.get("/api/analytics/stats")
-async def get_analytics_stats():
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def get_analytics_stats(db_ops=Depends(get_db_ops)):
     try:
-        db_ops = InterviewDatabaseOps()
-
-        # Get basic counts using existing methods
-        all_jobs = db_ops.list_job_descriptions(active_only=False)
-        all_resumes = db_ops.list_resumes(active_only=False)
-        all_interviews = db_ops.list_interviews()  # Get all interviews
-        all_scores = db_ops.get_all_interview_results()["final_score"]
-
-        # Calculate stats
-        total_jobs = len(all_jobs)
-        total_candidates = len(all_resumes)
-        total_interviews = len(all_interviews)
-
-        # Simple average score calculation
-        # avg_score = 7.5  # Default placeholder
-        avg_score = (
-            sum(score["final_score"] for score in all_scores) / len(all_scores)
-            if all_scores
-            else 0
-        )
+
+        # Counts and average score in a single query
+        stats = await asyncio.to_thread(db_ops.get_analytics_counts)
 
         return {
-            "totalJobs": total_jobs,
-            "totalCandidates": total_candidates,
-            "totalInterviews": total_interviews,
-            "averageScore": avg_score,
+            "totalJobs": stats["job_descriptions"],
+            "totalCandidates": stats["resumes"],
+            "totalInterviews": stats["interviews"],
+            "averageScore": stats["average_score"],
         }
     except Exception as e:
         logger.error(f"Error fetching analytics stats: {e}")
@@ -514,22 +517,24 @@ async def get_analytics_stats():
 
 # UPDATE endpoints
 @app.put("/api/jobs/{job_id}")
-async def update_job_description(job_id: int, job_data: JobDescriptionCreate):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def update_job_description(
+    job_id: int,
+    job_data: JobDescriptionCreate,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
 
         # Convert Pydantic model to dict for update
         updates = job_data.model_dump(exclude_none=True)
 
-        success = db_ops.update_job_description(job_id, updates)
+        success = await asyncio.to_thread(
+            db_ops.update_job_description, job_id, updates
+        )
         if not success:
             raise HTTPException(status_code=404, detail="Job description not found")
 
         # Return updated job
-        updated_job = db_ops.get_job_description(job_id)
+        updated_job = await asyncio.to_thread(db_ops.get_job_description, job_id)
         return {"job": updated_job}
 
     except HTTPException:
@@ -540,12 +545,12 @@ async def update_job_description(job_id: int, job_data: JobDescriptionCreate):
 
 
 @app.put("/api/resumes/{resume_id}")
-async def update_resume(resume_id: int, resume_data: ResumeCreate):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def update_resume(
+    resume_id: int,
+    resume_data: ResumeCreate,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
 
         # Convert Pydantic model to dict for update
         updates = resume_data.model_dump(exclude_none=True)
@@ -569,12 +574,14 @@ async def update_resume(resume_id: int, resume_data: ResumeCreate):
             resume_id,
         )
 
-        success = db_ops.db_manager.execute_update(query, params)
+        success = await asyncio.to_thread(
+            db_ops.db_manager.execute_update, query, params
+        )
         if not success:
             raise HTTPException(status_code=404, detail="Resume not found")
 
         # Return updated resume
-        updated_resume = db_ops.get_resume(resume_id)
+        updated_resume = await asyncio.to_thread(db_ops.get_resume, resume_id)
         return {"resume": updated_resume}
 
     except HTTPException:
@@ -585,30 +592,34 @@ async def update_resume(resume_id: int, resume_data: ResumeCreate):
 
 
 @app.put("/api/interviews/{interview_id}/status")
-async def update_interview_status(interview_id: int, status_data: dict):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def update_interview_status(
+    interview_id: int,
+    status_data: dict,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
 
         status = status_data.get("status")
         if not status:
             raise HTTPException(status_code=400, detail="Status is required")
 
-        success = db_ops.update_interview_status(interview_id, status)
+        success = await asyncio.to_thread(
+            db_ops.update_interview_status, interview_id, status
+        )
         if not success:
             raise HTTPException(status_code=404, detail="Interview not found")
 
         # Return updated interview
-        updated_interview = db_ops.get_interview(interview_id)
+        updated_interview = await asyncio.to_thread(db_ops.get_interview, interview_id)
 
         # If interview completed, attempt to send notification email
         try:
             if status == "completed":
                 # Fetch resume email if available
                 resume = (
-                    db_ops.get_resume(updated_interview["resume_id"])
+                    await asyncio.to_thread(
+                        db_ops.get_resume, updated_interview["resume_id"]
+                    )
                     if updated_interview
                     else None
                 )
@@ -635,13 +646,13 @@ async def update_interview_status(interview_id: int, status_data: dict):
 
 
 @app.put("/api/interviews/{interview_id}")
-async def update_interview(interview_id: int, updates: dict):
+async def update_interview(
+    interview_id: int,
+    updates: dict,
+    db_ops=Depends(get_db_ops),
+):
     """Update arbitrary interview fields (scheduled_at, duration_minutes, interviewer_notes, etc.)"""
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
     try:
-        db_ops = InterviewDatabaseOps()
 
         # Validate allowed keys to prevent accidental schema changes
         allowed_keys = {
@@ -660,13 +671,15 @@ async def update_interview(interview_id: int, updates: dict):
                 status_code=400, detail="No valid update fields provided"
             )
 
-        success = db_ops.update_interview(interview_id, filtered_updates)
+        success = await asyncio.to_thread(
+            db_ops.update_interview, interview_id, filtered_updates
+        )
         if not success:
             raise HTTPException(
                 status_code=404, detail="Interview not found or update failed"
             )
 
-        updated = db_ops.get_interview(interview_id)
+        updated = await asyncio.to_thread(db_ops.get_interview, interview_id)
         return {"interview": updated}
 
     except HTTPException:
@@ -678,15 +691,16 @@ async def update_interview(interview_id: int, updates: dict):
 
 # DELETE endpoints
 @app.delete("/api/jobs/{job_id}")
-async def delete_job_description(job_id: int):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def delete_job_description(
+    job_id: int,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
 
         # Soft delete by setting is_active = False
-        success = db_ops.update_job_description(job_id, {"is_active": False})
+        success = await asyncio.to_thread(
+            db_ops.update_job_description, job_id, {"is_active": False}
+        )
         if not success:
             raise HTTPException(status_code=404, detail="Job description not found")
 
@@ -700,15 +714,16 @@ async def delete_job_description(job_id: int):
 
 
 @app.delete("/api/resumes/{resume_id}")
-async def delete_resume(resume_id: int):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def delete_resume(
+    resume_id: int,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
         # Soft delete by setting is_active = False to avoid violating FK constraints
         query = "UPDATE resumes SET is_active = 0, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
-        success = db_ops.db_manager.execute_update(query, (resume_id,))
+        success = await asyncio.to_thread(
+            db_ops.db_manager.execute_update, query, (resume_id,)
+        )
         if not success:
             raise HTTPException(status_code=404, detail="Resume not found")
 
@@ -723,13 +738,12 @@ async def delete_resume(resume_id: int):
 
 # SEARCH endpoints
 @app.get("/api/search/candidates")
-async def search_candidates(q: str):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def search_candidates(
+    q: str,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
-        candidates = db_ops.search_candidates(q)
+        candidates = await asyncio.to_thread(db_ops.search_candidates, q)
         return {"candidates": candidates}
 
     except Exception as e:
@@ -738,12 +752,8 @@ async def search_candidates(q: str):
 
 
 @app.get("/api/search/jobs")
-async def search_jobs(q: str):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def search_jobs(q: str, db_ops=Depends(get_db_ops)):
     try:
-        db_ops = InterviewDatabaseOps()
 
         # Search jobs by title or company
         query = """
@@ -753,7 +763,9 @@ async def search_jobs(q: str):
         """
 
         term = f"%{q}%"
-        rows = db_ops.db_manager.execute_query(query, (term, term))
+        rows = await asyncio.to_thread(
+            db_ops.db_manager.execute_query, query, (term, term)
+        )
         jobs = [dict(row) for row in rows] if rows else []
 
         return {"jobs": jobs}
@@ -765,12 +777,11 @@ async def search_jobs(q: str):
 
 # MATCH RATING endpoints
 @app.post("/api/match-rating")
-async def create_match_rating(rating_data: dict):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def create_match_rating(
+    rating_data: dict,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
 
         job_id = rating_data.get("job_description_id")
         resume_id = rating_data.get("resume_id")
@@ -780,7 +791,8 @@ async def create_match_rating(rating_data: dict):
         if not all([job_id, resume_id, score]):
             raise HTTPException(status_code=400, detail="Missing required fields")
 
-        rating_id = db_ops.create_match_rating(
+        rating_id = await asyncio.to_thread(
+            db_ops.create_match_rating,
             job_id,
             resume_id,
             score,
@@ -802,13 +814,13 @@ async def create_match_rating(rating_data: dict):
 
 
 @app.get("/api/match-rating/{job_id}/{resume_id}")
-async def get_match_rating(job_id: int, resume_id: int):
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
-
+async def get_match_rating(
+    job_id: int,
+    resume_id: int,
+    db_ops=Depends(get_db_ops),
+):
     try:
-        db_ops = InterviewDatabaseOps()
-        rating = db_ops.get_match_rating(job_id, resume_id)
+        rating = await asyncio.to_thread(db_ops.get_match_rating, job_id, resume_id)
 
         if not rating:
             raise HTTPException(status_code=404, detail="Match rating not found")
@@ -837,6 +849,10 @@ class WebSocketInterviewSession:
         self._looked_away_warnings = 0
         self._lookaway_threshold = 10
         self._max_warnings = 3
+        # Run the cascade on every third frame and reuse its answer in between
+        self._detect_every = 3
+        self._frame_counter = 0
+        self._face_found = True
         self._session_terminated = False
         self._resume_handle = resume_handle
         self._assistant_chunks: bytearray = bytearray()
@@ -905,7 +921,7 @@ class WebSocketInterviewSession:
                 )
 
             try:
-                async with client.aio.live.connect(
+                async with get_client().aio.live.connect(
                     model=MODEL, config=config
                 ) as session:
                     self.session = session
@@ -1156,24 +1172,38 @@ class WebSocketInterviewSession:
                 await self._finalize_session("client_stop")
                 break
 
+    def _detect_face(self, frame_bytes: bytes) -> Optional[bool]:
+        """Whether the encoded frame shows a face, or None if it can't be decoded."""
+        np_arr = np.frombuffer(frame_bytes, dtype=np.uint8)
+        # The JPEG decoder emits a half-size grayscale image directly, a
+        # quarter of the pixels with no separate resize or colour conversion
+        gray = cv2.imdecode(np_arr, cv2.IMREAD_REDUCED_GRAYSCALE_2)
+        if gray is None:
+            return None
+
+        faces = self._face_cascade.detectMultiScale(gray, 1.3, 4)
+        return len(faces) >= 1
+
     async def _process_frame(self, base64_frame: str) -> None:
         if self._face_cascade.empty() or self._session_terminated:
             return
-        try:
-            frame_bytes = base64.b64decode(base64_frame)
-        except (TypeError, ValueError):
-            logger.warning("Failed to decode frame payload")
-            return
-
-        np_arr = np.frombuffer(frame_bytes, dtype=np.uint8)
-        frame = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
-        if frame is None:
-            return
+        detect = self._frame_counter % self._detect_every == 0
+        self._frame_counter += 1
+        if detect:
+            try:
+                frame_bytes = base64.b64decode(base64_frame)
+            except (TypeError, ValueError):
+                logger.warning("Failed to decode frame payload")
+                return
 
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        faces = self._face_cascade.detectMultiScale(gray, 1.3, 4)
+            # Decoding and detection release the GIL, so a worker thread keeps
+            # them from stalling audio traffic on the event loop
+            face_found = await asyncio.to_thread(self._detect_face, frame_bytes)
+            if face_found is None:
+                return
+            self._face_found = face_found
 
-        if len(faces) >= 1:
+        if self._face_found:
             self._looked_away = 0
         else:
             self._looked_away += 1
@@ -1529,7 +1559,7 @@ class WebSocketInterviewSession:
         flush_current()
 
         formatted_text = "\n".join(lines)
-        response = client.models.generate_content(
+        response = get_client().models.generate_content(
             model="gemini-2.5-flash",
             contents={
                 "role": "user",
@@ -1596,7 +1626,7 @@ FORMAT: ```json
 """
 
             try:
-                response = client.models.generate_content(
+                response = get_client().models.generate_content(
                     model="gemini-2.5-flash",
                     contents={
                         "role": "user",
@@ -1631,7 +1661,7 @@ FORMAT: ```json
                     score_file.write(formatted_text or "")
                 return
 
-            db_ops = InterviewDatabaseOps()
+            db_ops = get_shared_db_ops()
             db_ops.update_interview_using_session_id(
                 self._interview_session_id,
                 {
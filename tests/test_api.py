@@ -29,8 +29,8 @@ def test_db_dir(tmp_path_factory):
 @pytest.fixture(scope="module")
 def client(test_db_dir):
     # Ensure server uses test DB
-    server.InterviewDatabaseOps = (
-        lambda *a, **k: database_operations.InterviewDatabaseOps(test_db_dir)
+    server.app.dependency_overrides[server.get_db_ops] = (
+        lambda: database_operations.InterviewDatabaseOps(test_db_dir)
     )
     # The server module sets DATABASE_AVAILABLE at import time; tests should enable it
     server.DATABASE_AVAILABLE = True
@@ -0,0 +1,679 @@
+import json
+import sqlite3
+import threading
+import uuid
+
+import pytest
+
+import database_operations
+import init_database
+from init_database import DatabaseManager, PERFORMANCE_INDEXES, STATS_TABLES
+from database_operations import (
+    InterviewDatabaseOps,
+    Interview,
+    JobDescription,
+    Resume,
+)
+
+
+@pytest.fixture
+def db_ops(tmp_path):
+    db_path = str(tmp_path / "test_interview_database.db")
+    assert DatabaseManager(db_path).create_database(force_recreate=True)
+    return InterviewDatabaseOps(db_path)
+
+
+@pytest.fixture
+def interview_id(db_ops):
+    job_id = db_ops.create_job_description(
+        JobDescription(title="Engineer", company="Acme", description_text="Build things")
+    )
+    resume_id = db_ops.create_resume(
+        Resume(candidate_name="Jane Doe", resume_text="Python", email="jane@example.com")
+    )
+    return db_ops.create_interview(
+        Interview(session_id="session_1", job_description_id=job_id, resume_id=resume_id)
+    )
+
+
+def test_schema_creates_performance_indexes(db_ops):
+    rows = db_ops.db_manager.execute_query(
+        "SELECT name FROM sqlite_master WHERE type = 'index'"
+    )
+    names = {row["name"] for row in rows}
+    for statement in PERFORMANCE_INDEXES:
+        assert statement.split()[5] in names
+
+
+def test_completed_status_sets_duration(db_ops, interview_id):
+    db_ops.update_interview(interview_id, {"started_at": "2020-01-01T10:00:00"})
+    assert db_ops.update_interview_status(interview_id, "completed")
+
+    interview = db_ops.get_interview(interview_id)
+    assert interview["status"] == "completed"
+    assert interview["duration_minutes"] > 0
+
+
+def test_pooled_connections_are_reused_and_reopened(db_ops, interview_id):
+    manager = db_ops.db_manager
+    with manager.get_read_connection() as first:
+        pass
+    with manager.get_read_connection() as second:
+        assert second is first
+
+    manager.close()
+    assert db_ops.get_interview(interview_id)["session_id"] == "session_1"
+
+
+def test_reads_inside_a_write_block_see_its_rows(db_ops):
+    seen_elsewhere = []
+    with db_ops.db_manager.get_connection():
+        resume_id = db_ops.create_resume(Resume(candidate_name="Jane Doe", resume_text="Python"))
+        assert db_ops.get_resume(resume_id)["candidate_name"] == "Jane Doe"
+        # Other threads read committed data from the pool
+        thread = threading.Thread(target=lambda: seen_elsewhere.append(db_ops.get_resume(resume_id)))
+        thread.start()
+        thread.join()
+    assert seen_elsewhere == [None]
+    assert db_ops.get_resume(resume_id)["candidate_name"] == "Jane Doe"
+
+    with pytest.raises(RuntimeError):
+        with db_ops.db_manager.get_connection():
+            rolled_back = db_ops.create_resume(Resume(candidate_name="John Roe", resume_text="Go"))
+            assert db_ops.get_resume(rolled_back)["candidate_name"] == "John Roe"
+            raise RuntimeError
+    assert db_ops.get_resume(rolled_back) is None
+
+
+def test_exhausted_read_pool_times_out(tmp_path, monkeypatch):
+    monkeypatch.setattr(init_database, "READ_POOL_TIMEOUT", 0.05)
+    db_path = str(tmp_path / "test_interview_database.db")
+    manager = DatabaseManager(db_path, read_pool_size=1)
+    assert manager.create_database(force_recreate=True)
+    with manager.get_read_connection():
+        with pytest.raises(sqlite3.OperationalError, match="No read connection free"):
+            with manager.get_read_connection():
+                pass
+        assert manager.execute_query("SELECT 1") == []
+
+
+def test_full_results_combines_header_and_children(db_ops, interview_id):
+    db_ops.add_interview_recording(interview_id, "transcript", transcript_text="Hello")
+    db_ops.db_manager.execute_update(
+        "INSERT INTO interview_feedback (interview_id, question_text, answer_text) VALUES (?, ?, ?)",
+        (interview_id, "Why?", "Because"),
+    )
+    db_ops.create_final_score(interview_id, 8.0, "hire")
+
+    results = db_ops.get_interview_full_results(interview_id)
+
+    assert results["interview"]["session_id"] == "session_1"
+    assert results["resume"]["candidate_name"] == "Jane Doe"
+    assert results["match_rating"] is None
+    assert results["final_score"]["final_decision"] == "hire"
+    assert [r["transcript_text"] for r in results["recordings"]] == ["Hello"]
+    assert [f["answer_text"] for f in results["feedback"]] == ["Because"]
+    assert "answer_text" not in results["recordings"][0]
+    assert db_ops.get_interview_full_results(interview_id + 100) == {}
+
+
+def test_bulk_inserts_use_one_call(db_ops, interview_id):
+    records = [
+        (interview_id, "transcript", None, f"text {n}", None, None, None, None, None)
+        for n in range(3)
+    ]
+    assert db_ops.add_interview_recordings_bulk(records) == 3
+    assert len(db_ops.get_interview_recordings(interview_id)) == 3
+
+    analyses = [(interview_id, {"technical_skills_score": 7, "key_strengths": ["a"]}, "v1")]
+    assert db_ops.create_scoring_analyses_bulk(analyses) == 1
+    assert db_ops.add_interview_recordings_bulk([]) == 0
+
+
+@pytest.mark.parametrize("has_returning", [True, False])
+def test_match_rating_upsert_returns_the_existing_id(db_ops, interview_id, monkeypatch, has_returning):
+    # Old SQLite (< 3.35) runs the upsert without RETURNING
+    monkeypatch.setattr(database_operations, "_HAS_RETURNING", has_returning)
+    first_id = db_ops.create_match_rating(1, 1, 6.0, "first")
+    db_ops.create_job_description(JobDescription(title="Other", company="Acme", description_text="Other role"))
+    db_ops.create_match_rating(2, 1, 4.0, "other job")
+    assert db_ops.create_match_rating(1, 1, 8.0, "second") == first_id
+
+    rating = db_ops.get_match_rating(1, 1)
+    assert (rating["id"], rating["overall_match_score"]) == (first_id, 8.0)
+
+
+def test_log_system_event_returns_the_event_id(db_ops):
+    event_id = db_ops.log_system_event("test_event", "test", 1, {"ok": True})
+    assert isinstance(event_id, int)
+    rows = db_ops.db_manager.execute_query(
+        "SELECT event_type, event_data FROM system_events WHERE id = ?", (event_id,)
+    )
+    assert rows[0]["event_type"] == "test_event"
+    assert json.loads(rows[0]["event_data"]) == {"ok": True}
+
+
+def test_async_system_events_are_written_in_background(db_ops):
+    futures = [db_ops.log_system_event_async("test_event", "test", n) for n in range(5)]
+    ids = [future.result(timeout=5) for future in futures]
+
+    assert ids == list(range(ids[0], ids[0] + 5))
+    rows = db_ops.db_manager.execute_query(
+        "SELECT entity_id FROM system_events WHERE event_type = 'test_event' ORDER BY id"
+    )
+    assert [row["entity_id"] for row in rows] == list(range(5))
+
+
+def test_async_system_event_failures_reach_the_future(db_ops):
+    with db_ops.db_manager.get_connection() as conn:
+        conn.execute("DROP TABLE system_events")
+    future = db_ops.log_system_event_async("test_event")
+    with pytest.raises(sqlite3.OperationalError):
+        future.result(timeout=5)
+
+
+def test_search_candidates_uses_full_text_index(db_ops, interview_id):
+    assert db_ops.db_manager.has_search_index
+    assert [c["candidate_name"] for c in db_ops.search_candidates("jan")] == ["Jane Doe"]
+    assert [c["email"] for c in db_ops.search_candidates("example")] == ["jane@example.com"]
+
+    db_ops.db_manager.execute_update(
+        "UPDATE resumes SET candidate_name = 'Janet Roe' WHERE email = 'jane@example.com'"
+    )
+    assert db_ops.search_candidates("doe") == []
+    assert [c["candidate_name"] for c in db_ops.search_candidates("roe")] == ["Janet Roe"]
+
+
+def test_candidate_and_recent_interview_lists_keep_all_columns(db_ops, interview_id):
+    resume_columns = {row["name"] for row in db_ops.db_manager.execute_query("PRAGMA table_info(resumes)")}
+    assert set(db_ops.search_candidates("jane")[0]) == resume_columns
+    assert set(db_ops.search_candidates("@")[0]) == resume_columns
+
+    db_ops.update_interview(interview_id, {"started_at": "2999-01-01T10:00:00"})
+    [recent] = db_ops.get_recent_interviews(7)
+    assert recent["job_title"] == "Engineer"
+    assert recent["company"] == "Acme"
+    assert recent["email"] == "jane@example.com"
+    # The view repeats some interviews columns, which SQLite renames "name:1"
+    view_columns = db_ops.db_manager.execute_query("SELECT * FROM interview_summary")[0].keys()
+    assert set(recent) == {name.split(":")[0] for name in view_columns}
+
+
+def test_summary_table_follows_interview_writes(db_ops, interview_id):
+    db_ops.update_interview(interview_id, {"started_at": "2999-01-01T10:00:00"})
+    db_ops.create_final_score(interview_id, 6.0, "reject")
+    db_ops.create_final_score(interview_id, 9.0, "hire")
+
+    [recent] = db_ops.get_recent_interviews(7)
+    assert recent["candidate_name"] == "Jane Doe"
+    assert recent["final_decision"] == "hire"
+    assert db_ops.get_recent_interview_stats(7) == {"total": 1, "hired": 1, "rejected": 0}
+
+    db_ops.db_manager.execute_update(
+        "DELETE FROM final_scores WHERE final_decision = 'hire'"
+    )
+    assert db_ops.get_recent_interviews(7)[0]["final_decision"] == "reject"
+
+
+def test_large_transcripts_round_trip(db_ops, interview_id):
+    transcript = "Interviewer: Tell me about yourself.\n" * 500
+    db_ops.add_interview_recording(interview_id, "transcript", transcript_text=transcript)
+    db_ops.add_interview_recordings_bulk(
+        [(interview_id, "transcript", None, transcript, None, None, None, None, None)]
+    )
+
+    recordings = db_ops.get_interview_recordings(interview_id)
+    assert [r["transcript_text"] for r in recordings] == [transcript, transcript]
+    assert "transcript_text_zstd" not in recordings[0]
+    results = db_ops.get_interview_full_results(interview_id)
+    assert results["recordings"][0]["transcript_text"] == transcript
+
+
+def test_has_interview_recording_checks_type(db_ops, interview_id):
+    assert not db_ops.has_interview_recording(interview_id, "transcript")
+    db_ops.add_interview_recording(interview_id, "audio", file_path="a.wav")
+    assert not db_ops.has_interview_recording(interview_id, "transcript")
+    db_ops.add_interview_recording(interview_id, "transcript", transcript_text="Hi")
+    assert db_ops.has_interview_recording(interview_id, "transcript")
+
+
+def test_average_final_score_is_computed_in_sql(db_ops, interview_id):
+    assert db_ops.average_final_score() == 0
+    db_ops.create_final_score(interview_id, 6.0, "hire")
+    db_ops.create_final_score(interview_id, 9.0, "hire")
+    assert db_ops.average_final_score() == pytest.approx(7.5)
+
+
+def test_average_final_score_defaults_to_zero(db_ops, monkeypatch):
+    monkeypatch.setattr(DatabaseManager, "execute_query", lambda self, query, params=(): [])
+    assert db_ops.average_final_score() == 0.0
+
+
+def test_analytics_counts_come_from_one_query(db_ops, interview_id):
+    db_ops.create_final_score(interview_id, 8.0, "hire")
+    db_ops.create_resume(Resume(candidate_name="John Roe", resume_text="Go"))
+    assert db_ops.get_analytics_counts() == {
+        "job_descriptions": 1,
+        "resumes": 2,
+        "interviews": 1,
+        "average_score": 8.0,
+    }
+
+
+def test_analytics_counts_default_to_zeros(db_ops, monkeypatch):
+    # execute_query() logs failures and returns no rows
+    monkeypatch.setattr(DatabaseManager, "execute_query", lambda self, query, params=(): [])
+    assert db_ops.get_analytics_counts() == {
+        "job_descriptions": 0,
+        "resumes": 0,
+        "interviews": 0,
+        "average_score": 0,
+    }
+
+
+def test_all_interview_results_are_paginated(db_ops, interview_id):
+    second_id = db_ops.create_interview(
+        Interview(session_id="session_2", job_description_id=1, resume_id=1)
+    )
+    for interview in (interview_id, second_id):
+        db_ops.create_final_score(interview, 7.0, "hire")
+
+    first = db_ops.get_all_interview_results(limit=1)
+    assert [s["interview_id"] for s in first["final_score"]] == [interview_id]
+    second = db_ops.get_all_interview_results(after_id=first["next_cursor"], limit=1)
+    assert [s["interview_id"] for s in second["final_score"]] == [second_id]
+    last = db_ops.get_all_interview_results(after_id=second["next_cursor"], limit=1)
+    assert last == {"scoring_analysis": [], "final_score": [], "next_cursor": None}
+
+
+def test_all_interview_results_are_unpaginated_by_default(db_ops, interview_id):
+    assert db_ops.get_all_interview_results() == {"scoring_analysis": None, "final_score": None}
+
+    for _ in range(3):
+        other_id = db_ops.create_interview(
+            Interview(session_id=str(uuid.uuid4()), job_description_id=1, resume_id=1)
+        )
+        db_ops.create_final_score(other_id, 7.0, "hire")
+    db_ops.create_final_score(interview_id, 5.0, "reject")
+
+    results = db_ops.get_all_interview_results()
+    assert "next_cursor" not in results
+    assert len(results["final_score"]) == 4
+    assert all(isinstance(score, dict) for score in results["final_score"])
+
+
+def test_unpaginated_interview_results_keep_every_row(db_ops, interview_id):
+    db_ops.create_final_score(interview_id, 7.0, "hire")
+    # The schema requires interview_id, but rows written without foreign key
+    # checks may point at no interview
+    run_script(
+        db_ops.db_manager.db_path,
+        "INSERT INTO final_scores (interview_id, final_score, final_decision) VALUES (0, 4.0, 'reject');",
+    )
+
+    results = db_ops.get_all_interview_results()
+    assert sorted(score["interview_id"] for score in results["final_score"]) == [0, interview_id]
+    after = db_ops.get_all_interview_results(after_id=0)
+    assert [score["interview_id"] for score in after["final_score"]] == [interview_id]
+
+
+def test_bulk_load_restores_indexes(db_ops, interview_id):
+    def index_names():
+        rows = db_ops.db_manager.execute_query(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )
+        return {row["name"] for row in rows}
+
+    with db_ops.bulk_load():
+        assert "idx_recordings_interview" not in index_names()
+        db_ops.add_interview_recording(interview_id, "transcript", transcript_text="Hi")
+
+    assert {"idx_recordings_interview", "idx_feedback_interview_created"} <= index_names()
+    assert len(db_ops.get_interview_recordings(interview_id)) == 1
+
+
+def test_list_resumes_pages_with_keyset_cursor(db_ops):
+    for n in range(5):
+        db_ops.create_resume(Resume(candidate_name=f"Candidate {n}", resume_text="text"))
+
+    seen, after = [], None
+    while True:
+        page = db_ops.list_resumes(after=after, limit=2)
+        seen.extend(resume["candidate_name"] for resume in page)
+        if len(page) < 2:
+            break
+        after = (page[-1]["created_at"], page[-1]["id"])
+
+    assert seen == [resume["candidate_name"] for resume in db_ops.list_resumes()]
+    assert len(seen) == 5
+
+
+def test_read_connections_are_query_only(db_ops):
+    manager = db_ops.db_manager
+    with manager.get_read_connection() as conn:
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+
+    manager.set_read_pragmas(["PRAGMA mmap_size = 1048576"])
+    with manager.get_read_connection() as conn:
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 0
+
+
+def test_search_candidate_interviews_joins_interviews(db_ops, interview_id):
+    db_ops.create_resume(Resume(candidate_name="Janet Smith", resume_text="Go"))
+    db_ops.create_final_score(interview_id, 8.0, "hire")
+
+    rows = db_ops.search_candidate_interviews("jan")
+
+    by_name = {row["candidate_name"]: row for row in rows}
+    assert len(rows) == 2
+    assert by_name["Jane Doe"]["session_id"] == "session_1"
+    assert by_name["Jane Doe"]["final_decision"] == "hire"
+    assert by_name["Janet Smith"]["id"] is None
+
+
+def test_backup_copies_committed_wal_pages(db_ops, interview_id, tmp_path):
+    backup_path = str(tmp_path / "backup.db")
+    assert db_ops.db_manager.backup_database(backup_path, pages=1)
+
+    backup = InterviewDatabaseOps(backup_path)
+    assert backup.get_interview(interview_id)["session_id"] == "session_1"
+
+
+def test_bulk_insert_chunks_and_rolls_back_on_error(db_ops, interview_id):
+    manager = db_ops.db_manager
+    columns = ["event_type", "entity_type", "entity_id"]
+    rows = [("bulk_event", "test", n) for n in range(40000)]
+    assert manager.bulk_insert("system_events", columns, rows) == 40000
+    assert manager.execute_many(
+        "DELETE FROM system_events WHERE entity_id = ?", [(n,) for n in range(10)]
+    )
+
+    count = "SELECT COUNT(*) AS n FROM system_events WHERE event_type = 'bulk_event'"
+    assert manager.execute_query(count)[0]["n"] == 39990
+
+    bad_rows = [(interview_id, "transcript"), (interview_id + 100, "transcript")]
+    assert manager.bulk_insert(
+        "interview_recordings", ["interview_id", "recording_type"], bad_rows
+    ) == 0
+    assert db_ops.get_interview_recordings(interview_id) == []
+    assert db_ops.add_interview_recording(interview_id, "transcript", transcript_text="Hi")
+    assert len(db_ops.get_interview_recordings(interview_id)) == 1
+
+
+def test_database_stats_follow_row_counts(db_ops, interview_id):
+    manager = db_ops.db_manager
+    stats = manager.get_database_stats()
+    assert (stats["interviews_count"], stats["resumes_count"]) == (1, 1)
+
+    db_ops.create_resume(Resume(candidate_name="John Roe", resume_text="Go"))
+    manager.execute_update("DELETE FROM interviews WHERE id = ?", (interview_id,))
+
+    stats = manager.get_database_stats()
+    assert (stats["interviews_count"], stats["resumes_count"]) == (0, 2)
+
+
+def test_recent_interviews_stat_uses_daily_counts(db_ops, interview_id):
+    manager = db_ops.db_manager
+    assert manager.get_database_stats()["recent_interviews"] == 1
+
+    manager.execute_update(
+        "UPDATE interviews SET created_at = datetime('now', '-7 days', '+1 hour')"
+    )
+    db_ops.create_interview(Interview(session_id="old", job_description_id=1, resume_id=1))
+    manager.execute_update(
+        "UPDATE interviews SET created_at = datetime('now', '-8 days') WHERE session_id = 'old'"
+    )
+
+    assert manager.get_database_stats()["recent_interviews"] == 1
+    days = manager.execute_query("SELECT SUM(n) AS n FROM daily_interview_counts")
+    assert days[0]["n"] == 2
+
+
+def test_failed_row_count_backfill_rolls_back_its_tables(db_ops, interview_id, monkeypatch):
+    manager = db_ops.db_manager
+    with manager.get_connection() as conn:
+        conn.execute("DROP TABLE table_row_counts")
+        conn.execute("DROP TABLE daily_interview_counts")
+
+    # The back-fill fails after the DDL ran; none of it may stay behind
+    monkeypatch.setattr("init_database.STATS_TABLES", (*STATS_TABLES, "no_such_table"))
+    assert not manager.ensure_row_counts()
+    rows = manager.execute_query("SELECT name FROM sqlite_master WHERE type = 'table'")
+    assert {"table_row_counts", "daily_interview_counts"}.isdisjoint(r["name"] for r in rows)
+
+    monkeypatch.undo()
+    assert manager.ensure_row_counts()
+    stats = manager.get_database_stats()
+    assert (stats["interviews_count"], stats["recent_interviews"]) == (1, 1)
+
+
+@pytest.fixture
+def unprepared_db(tmp_path):
+    db_path = str(tmp_path / "unprepared.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript(DatabaseManager(db_path).schema_path.read_text(encoding="utf-8"))
+    conn.close()
+    return db_path
+
+
+def run_script(db_path, script):
+    """Write to a database directly, as an older version of the app would"""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(script)
+    finally:
+        conn.close()
+
+
+def table_names(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    finally:
+        conn.close()
+
+
+def test_databases_are_prepared_on_first_use_not_on_open(unprepared_db, tmp_path):
+    manager = DatabaseManager(unprepared_db)
+    assert not manager.is_prepared
+    assert "table_row_counts" not in table_names(unprepared_db)
+
+    assert manager.execute_query("SELECT COUNT(*) AS n FROM resumes")[0]["n"] == 0
+    assert manager.is_prepared
+    assert "table_row_counts" in table_names(unprepared_db)
+
+    # A path that doesn't exist yet is not created by a read
+    missing = DatabaseManager(str(tmp_path / "missing.db"))
+    assert missing.execute_query("SELECT 1") == []
+    assert not (tmp_path / "missing.db").exists()
+
+
+def test_read_only_use_of_a_legacy_database(unprepared_db):
+    run_script(
+        unprepared_db,
+        """
+        INSERT INTO job_descriptions (title, company, description_text) VALUES ('Engineer', 'Acme', 'd');
+        INSERT INTO resumes (candidate_name, resume_text) VALUES ('Jane Doe', 'Python');
+        INSERT INTO interviews (session_id, job_description_id, resume_id, started_at, created_at)
+        VALUES ('legacy', 1, 1, datetime('now'), datetime('now'));
+        INSERT INTO final_scores (interview_id, final_score, final_decision) VALUES (1, 8, 'hire');
+        """,
+    )
+
+    # Only reads, as the viewer and reports do
+    db_ops = InterviewDatabaseOps(unprepared_db)
+    stats = db_ops.db_manager.get_database_stats()
+    assert (stats["interviews_count"], stats["recent_interviews"]) == (1, 1)
+    assert [i["session_id"] for i in db_ops.get_recent_interviews(7)] == ["legacy"]
+    assert db_ops.get_recent_interview_stats(7) == {"total": 1, "hired": 1, "rejected": 0}
+    assert db_ops.get_analytics_counts() == {
+        "job_descriptions": 1, "resumes": 1, "interviews": 1, "average_score": 8.0,
+    }
+    assert [c["candidate_name"] for c in db_ops.search_candidates("jane")] == ["Jane Doe"]
+
+
+def test_recent_interviews_without_the_summary_table(unprepared_db, monkeypatch):
+    monkeypatch.setattr(DatabaseManager, "ensure_summary_table", lambda self: False)
+    db_ops = InterviewDatabaseOps(unprepared_db)
+    run_script(
+        unprepared_db,
+        """
+        INSERT INTO job_descriptions (title, company, description_text) VALUES ('Engineer', 'Acme', 'd');
+        INSERT INTO resumes (candidate_name, resume_text) VALUES ('Jane Doe', 'Python');
+        INSERT INTO interviews (session_id, job_description_id, resume_id, started_at)
+        VALUES ('recent', 1, 1, datetime('now')), ('old', 1, 1, '2000-01-01');
+        INSERT INTO final_scores (interview_id, final_score, final_decision)
+        VALUES (1, 4, 'reject'), (1, 8, 'hire');
+        """,
+    )
+
+    [recent] = db_ops.get_recent_interviews(7)
+    assert (recent["session_id"], recent["final_decision"], recent["job_title"]) == ("recent", "hire", "Engineer")
+    assert db_ops.get_recent_interview_stats(7) == {"total": 1, "hired": 1, "rejected": 0}
+    assert not db_ops.db_manager.has_summary_table
+
+
+def test_stats_without_the_row_count_tables(unprepared_db, monkeypatch):
+    monkeypatch.setattr(DatabaseManager, "ensure_row_counts", lambda self: False)
+    manager = DatabaseManager(unprepared_db)
+    run_script(
+        unprepared_db,
+        """
+        INSERT INTO job_descriptions (title, company, description_text) VALUES ('Engineer', 'Acme', 'd');
+        INSERT INTO resumes (candidate_name, resume_text) VALUES ('Jane Doe', 'Python'), ('John Roe', 'Go');
+        INSERT INTO interviews (session_id, job_description_id, resume_id, created_at)
+        VALUES ('recent', 1, 1, datetime('now')), ('old', 1, 2, '2000-01-01');
+        """,
+    )
+
+    stats = manager.get_database_stats()
+    assert not manager.has_row_counts
+    assert "table_row_counts" not in table_names(unprepared_db)
+    assert (stats["resumes_count"], stats["interviews_count"], stats["recent_interviews"]) == (2, 2, 1)
+    assert manager.count_rows("interviews") == 2
+
+
+def test_unpreparable_databases_are_read_as_is(unprepared_db, monkeypatch):
+    calls = []
+    monkeypatch.setattr(DatabaseManager, "ensure_indexes", lambda self: calls.append(1) and False)
+    manager = DatabaseManager(unprepared_db)
+    for _ in range(3):
+        assert manager.execute_query("SELECT COUNT(*) AS n FROM resumes")[0]["n"] == 0
+    assert not manager.is_prepared
+    assert calls == [1]
+
+
+def test_failed_preparation_blocks_writes(unprepared_db, monkeypatch):
+    manager = DatabaseManager(unprepared_db)
+    monkeypatch.setattr(DatabaseManager, "ensure_indexes", lambda self: False)
+
+    with pytest.raises(sqlite3.DatabaseError):
+        with manager.get_connection() as conn:
+            conn.execute("INSERT INTO system_events (event_type) VALUES ('x')")
+    assert not manager.execute_update("INSERT INTO system_events (event_type) VALUES ('x')")
+    assert manager.execute_query("SELECT COUNT(*) AS n FROM system_events")[0]["n"] == 0
+
+
+def test_write_blocks_take_the_write_lock_up_front(db_ops):
+    other = sqlite3.connect(db_ops.db_manager.db_path, timeout=0)
+    try:
+        with db_ops.db_manager.get_connection():
+            with pytest.raises(sqlite3.OperationalError):
+                other.execute("BEGIN IMMEDIATE")
+        other.execute("BEGIN IMMEDIATE")
+        other.rollback()
+    finally:
+        other.close()
+
+
+def test_nested_write_blocks_use_savepoints(db_ops):
+    manager = db_ops.db_manager
+    insert = "INSERT INTO system_events (event_type) VALUES (?)"
+
+    with manager.get_connection() as conn:
+        conn.execute(insert, ("outer",))
+        with pytest.raises(RuntimeError):
+            with manager.get_connection() as inner:
+                inner.execute(insert, ("inner_failed",))
+                raise RuntimeError
+        with manager.get_connection() as inner:
+            inner.execute(insert, ("inner",))
+        # The inner block must not have committed the outer transaction
+        assert conn.in_transaction
+
+    with pytest.raises(RuntimeError):
+        with manager.get_connection() as conn:
+            conn.execute(insert, ("rolled_back",))
+            with manager.get_connection() as inner:
+                inner.execute(insert, ("rolled_back_inner",))
+            raise RuntimeError
+
+    rows = manager.execute_query("SELECT event_type FROM system_events ORDER BY id")
+    assert [r["event_type"] for r in rows] == ["outer", "inner"]
+
+
+def test_cached_rows_follow_writes_from_any_connection(db_ops, interview_id):
+    job_id = db_ops.get_interview(interview_id)["job_description_id"]
+    assert db_ops.get_job_description(job_id)["title"] == "Engineer"
+    hits = db_ops._row_cache.cache_info().hits
+    assert db_ops.get_job_description(job_id)["title"] == "Engineer"
+    assert db_ops._row_cache.cache_info().hits == hits + 1
+
+    with db_ops.db_manager.get_connection() as conn:
+        conn.execute("UPDATE job_descriptions SET title = 'Direct' WHERE id = ?", (job_id,))
+    assert db_ops.get_job_description(job_id)["title"] == "Direct"
+
+    other = InterviewDatabaseOps(db_ops.db_manager.db_path)
+    other.update_job_description(job_id, {"title": "Other instance"})
+    assert db_ops.get_job_description(job_id)["title"] == "Other instance"
+
+
+def test_single_row_lookups_return_plain_dicts(db_ops, interview_id):
+    interview = db_ops.get_interview(interview_id)
+    rows = [
+        interview,
+        db_ops.get_interview_by_session("session_1"),
+        db_ops.get_job_description(interview["job_description_id"]),
+        db_ops.get_resume(interview["resume_id"]),
+        db_ops.find_resume_by_email("jane@example.com"),
+    ]
+    for row in rows:
+        assert type(row) is dict
+        assert json.loads(json.dumps(row)) == row
+
+    # Callers own their copy; changing it must not leak into the row cache
+    job = db_ops.get_job_description(interview["job_description_id"])
+    job["title"] = "Changed"
+    job["extra"] = True
+    again = db_ops.get_job_description(interview["job_description_id"])
+    assert again["title"] == "Engineer"
+    assert "extra" not in again
+    assert db_ops.get_resume(999) is None
+
+
+def test_scoring_cache_round_trip_and_purge(db_ops):
+    assert db_ops.get_cached_scoring("abc") is None
+    assert db_ops.cache_scoring("abc", "Technical: 8/10", "model")
+    assert db_ops.get_cached_scoring("abc") == "Technical: 8/10"
+
+    db_ops.db_manager.execute_update(
+        "UPDATE scoring_cache SET created_at = datetime('now', '-31 days')"
+    )
+    assert db_ops.get_cached_scoring("abc") is None
+    assert db_ops.purge_scoring_cache()
+    rows = db_ops.db_manager.execute_query("SELECT COUNT(*) AS n FROM scoring_cache")
+    assert rows[0]["n"] == 0
+
+
+def test_similar_scoring_matches_by_cosine_within_context(db_ops):
+    assert db_ops.cache_scoring_embedding(1, "ctx", [1.0, 0.0], "first")
+    assert db_ops.cache_scoring_embedding(1, "ctx", [0.0, 1.0], "second")
+
+    assert db_ops.find_similar_scoring(1, "ctx", [0.99, 0.141]) == "first"
+    assert db_ops.find_similar_scoring(1, "ctx", [0.6, 0.8]) is None
+    assert db_ops.find_similar_scoring(1, "other", [1.0, 0.0]) is None
+
+
+def test_similar_scoring_is_never_shared_between_interviews(db_ops):
+    assert db_ops.cache_scoring_embedding(1, "ctx", [1.0, 0.0], "first interview")
+    assert db_ops.find_similar_scoring(2, "ctx", [1.0, 0.0]) is None
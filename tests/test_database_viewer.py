@@ -0,0 +1,121 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import database_viewer
+from database_operations import InterviewDatabaseOps, Interview, JobDescription, Resume
+from init_database import DatabaseManager
+
+
+def make_db_ops(db_path):
+    assert DatabaseManager(db_path).create_database(force_recreate=True)
+    ops = InterviewDatabaseOps(db_path)
+    ops.create_job_description(
+        JobDescription(title="Engineer", company="Acme", description_text="Build things")
+    )
+    ops.create_resume(Resume(candidate_name="Jane Doe", resume_text="Python", email="jane@example.com"))
+    return ops
+
+
+@pytest.fixture
+def db_ops(tmp_path):
+    return make_db_ops(str(tmp_path / "test_interview_database.db"))
+
+
+def add_interviews(db_ops, count):
+    for n in range(count):
+        db_ops.create_interview(
+            Interview(session_id=f"session_{n}", job_description_id=1, resume_id=1)
+        )
+
+
+def test_view_interviews_shows_the_total(db_ops, capsys):
+    add_interviews(db_ops, 3)
+    assert database_viewer.view_interviews(page_size=2, db_ops=db_ops) is not None
+    out = capsys.readouterr().out
+    assert "Interviews (3 total):" in out
+    assert out.count("Interview ID:") == 2
+
+
+def test_view_interviews_total_without_row_counts(db_ops, monkeypatch, capsys):
+    add_interviews(db_ops, 3)
+    # A stale table_row_counts shows if the viewer reads it anyway
+    db_ops.db_manager.execute_update("UPDATE table_row_counts SET row_count = 0")
+    monkeypatch.setattr(DatabaseManager, "_row_count_paths", set())
+    assert database_viewer.view_interviews(page_size=2, db_ops=db_ops) is not None
+    assert "Interviews (3 total):" in capsys.readouterr().out
+
+
+def test_view_interviews_offers_no_empty_last_page(db_ops, capsys):
+    add_interviews(db_ops, 4)
+    cursor = database_viewer.view_interviews(page_size=2, db_ops=db_ops)
+    assert cursor is not None
+    assert database_viewer.view_interviews(page_size=2, after=cursor, db_ops=db_ops) is None
+    out = capsys.readouterr().out
+    assert out.count("Interview ID:") == 4
+    assert "No interviews found." not in out
+
+
+def test_view_interviews_without_rows(db_ops, capsys):
+    assert database_viewer.view_interviews(db_ops=db_ops) is None
+    assert "No interviews found." in capsys.readouterr().out
+
+
+def test_iter_interviews_walks_every_page(db_ops):
+    add_interviews(db_ops, 5)
+    sessions = [row["session_id"] for row in database_viewer.iter_interviews(db_ops, 2)]
+    assert sorted(sessions) == [f"session_{n}" for n in range(5)]
+
+
+def test_ndjson_page_option_prints_one_page(tmp_path):
+    db_dir = tmp_path / "db"
+    db_dir.mkdir()
+    ops = make_db_ops(str(db_dir / "interview_database.db"))
+    add_interviews(ops, 5)
+    ops.db_manager.close()
+
+    script = Path(database_viewer.__file__)
+    result = subprocess.run(
+        [sys.executable, str(script), "--format", "ndjson", "--page", "3", "--page-size", "2"],
+        cwd=tmp_path, capture_output=True, text=True, check=True,
+    )
+    schema, *rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert schema == {"schema": list(database_viewer.INTERVIEW_COLUMNS)}
+    assert len(rows) == 1
+
+
+def test_table_listings_show_totals(db_ops, capsys):
+    database_viewer.view_resumes(db_ops)
+    database_viewer.view_job_descriptions(db_ops)
+    out = capsys.readouterr().out
+    assert "Resumes (1 total, showing first 1):" in out
+    assert "   Name: Jane Doe" in out
+    assert "   Company: Acme" in out
+
+
+def test_detailed_interview_lists_every_section(db_ops, capsys):
+    add_interviews(db_ops, 1)
+    db_ops.create_scoring_analysis(
+        1, {"technical_skills_score": 8, "key_strengths": ["Python", "APIs", "SQL", "Go"]}
+    )
+    db_ops.create_final_score(1, 7.5, "hire")
+    database_viewer.view_detailed_interview(1, db_ops)
+    out = capsys.readouterr().out
+    assert "  Name: Jane Doe" in out
+    assert "  Technical Skills: 8.0/10" in out
+    assert "  Key Strengths: Python, APIs, SQL" in out
+    assert "  Decision: HIRE" in out
+
+
+def test_search_groups_interviews_by_candidate(db_ops, capsys, monkeypatch):
+    add_interviews(db_ops, 2)
+    db_ops.create_resume(Resume(candidate_name="Janet Roe", resume_text="Go"))
+    monkeypatch.setattr("builtins.input", lambda prompt: "jan")
+    database_viewer.search_interviews(db_ops)
+    out = capsys.readouterr().out
+    assert "Found 2 candidates:" in out
+    assert "    Interviews (2):" in out
+    assert "    No interviews found" in out
@@ -0,0 +1,39 @@
+from format_transcription import format_transcription
+
+
+def run(tmp_path, log: str) -> str:
+    source = tmp_path / "transcriptions.txt"
+    target = tmp_path / "final_transcription.txt"
+    source.write_text(log, encoding="utf-8")
+    format_transcription(str(source), str(target))
+    return target.read_text(encoding="utf-8")
+
+
+def test_turns_are_labelled_and_joined(tmp_path):
+    log = (
+        'session started\n'
+        'OUTPUT: {"text": "Hello "}\n'
+        'OUTPUT: {"text": "there."}\n'
+        'INPUT: {"text": "Hi"}\n'
+        'unrelated line\n'
+        'INPUT: {"text": " thanks  "}\n'
+        'OUTPUT: {"text": "Bye  "}\n'
+    )
+    assert run(tmp_path, log) == (
+        "[Interviewer]: Hello there.\n[Interviewee]: Hi thanks  \n[Interviewer]: Bye"
+    )
+
+
+def test_bad_payloads_are_reported_and_skipped(tmp_path, capsys):
+    log = 'OUTPUT: {"text": "Hi"}\nOUTPUT: not json\nINPUT: {"text": "Hello"}\n'
+    assert run(tmp_path, log) == "[Interviewer]: Hi\n[Interviewee]: Hello"
+    assert "Original string: not json" in capsys.readouterr().out
+
+
+def test_non_ascii_text_round_trips(tmp_path):
+    log = 'INPUT: {"text": "Grüße, 你好"}\n'
+    assert run(tmp_path, log) == "[Interviewee]: Grüße, 你好"
+
+
+def test_empty_log_gives_empty_transcript(tmp_path):
+    assert run(tmp_path, "") == ""
@@ -0,0 +1,63 @@
+import importlib
+
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("google.genai")
+
+import live_config
+
+
+@pytest.fixture
+def fresh_live_config():
+    return importlib.reload(live_config)
+
+
+def test_import_builds_neither_client_nor_config(fresh_live_config):
+    assert fresh_live_config.get_client.cache_info().currsize == 0
+    assert fresh_live_config._base_config.cache_info().currsize == 0
+    assert fresh_live_config.CONFIG is fresh_live_config.CONFIG
+
+
+def test_system_prompt_matches_the_template():
+    context = {"interview_type": "Onsite", "session_id": "s1", "timestamp": "t1"}
+    prompt = live_config._build_system_instruction("  My resume ", "The job\n", context)
+    assert prompt == live_config.SYSTEM_PROMPT_TEMPLATE.format(
+        resume="My resume",
+        job_description="The job",
+        interview_type="Onsite",
+        session_id="s1",
+        timestamp="t1",
+    )
+
+
+def test_system_prompt_defaults():
+    assert live_config._build_system_instruction() == live_config.SYSTEM_PROMPT_TEMPLATE.format(
+        resume=live_config.DEFAULT_RESUME_TEXT.strip(),
+        job_description=live_config.DEFAULT_JOB_DESCRIPTION_TEXT.strip(),
+        interview_type="Technical Screen",
+        session_id="N/A",
+        timestamp="N/A",
+    )
+
+
+def test_reconnects_reuse_the_session_prompt():
+    context = {"session_id": "s2", "timestamp": "t2"}
+    first = live_config.build_live_config("handle-1", resume_text="R", session_context=context)
+    second = live_config.build_live_config("handle-2", resume_text="R", session_context=dict(context))
+    assert first.system_instruction is second.system_instruction
+
+
+def test_build_live_config_leaves_config_untouched():
+    base = live_config.CONFIG
+    config = live_config.build_live_config("handle-1", resume_text="Other resume")
+    assert config.session_resumption.handle == "handle-1"
+    assert "Other resume" in config.system_instruction
+    assert base.session_resumption.handle is None
+    assert "Other resume" not in base.system_instruction
+    assert config.speech_config is base.speech_config
+
+
+@pytest.mark.parametrize("handle", [None, "", "   "])
+def test_blank_session_handles_are_dropped(handle):
+    assert live_config.build_live_config(handle).session_resumption.handle is None
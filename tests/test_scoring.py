@@ -0,0 +1,198 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+import score_candidate_with_db
+from database_operations import InterviewDatabaseOps
+from init_database import DatabaseManager
+from scoring_core import JD_FILE, RESUME_FILE, format_evaluation
+
+RESPONSE = {
+    "technical_skills_score": 8, "technical_skills_reasoning": "Knows Python.",
+    "problem_solving_score": 7, "communication_score": 9, "cultural_fit_score": 6,
+    "resume_match_score": 8, "interview_performance_score": 7,
+    "overall_impression_score": 7.5, "final_score": 7.5,
+    "recommendation": "second_interview", "recommendation_reasoning": "Solid.",
+    "key_strengths": ["Python", "APIs"], "areas_for_improvement": ["SQL"],
+    "detailed_feedback": "Good overall.",
+}
+
+
+@pytest.fixture
+def db_ops(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / RESUME_FILE).write_text("Python developer", encoding="utf-8")
+    (tmp_path / JD_FILE).write_text("Build GenAI services", encoding="utf-8")
+    for name in ("t1.txt", "t2.txt", "t3.txt"):
+        (tmp_path / name).write_text(f"[Interviewer]: hi\n[Interviewee]: {name}\n", encoding="utf-8")
+
+    db_path = str(tmp_path / "test_interview_database.db")
+    assert DatabaseManager(db_path).create_database(force_recreate=True)
+    ops = InterviewDatabaseOps(db_path)
+    monkeypatch.setattr(score_candidate_with_db, "get_db_ops", lambda: ops)
+    return ops
+
+
+def saved_final_score(db_ops, session_id):
+    interview = db_ops.get_interview_by_session(session_id)
+    rows = db_ops.db_manager.execute_query(
+        "SELECT final_score FROM final_scores WHERE interview_id = ?", (interview["id"],)
+    )
+    return [row["final_score"] for row in rows]
+
+
+def failing_client():
+    def fail(**kwargs):
+        raise AssertionError("the model should not be called")
+    models = SimpleNamespace(generate_content=fail, generate_content_stream=fail)
+    return SimpleNamespace(models=models)
+
+
+def test_format_evaluation_renders_json_responses():
+    text = format_evaluation(json.dumps(RESPONSE))
+    assert text.startswith("Final Score: 7.5/10\nRecommendation: Second Interview\nSolid.\n")
+    assert "\nTechnical Skills: 8/10\nKnows Python.\n" in text
+    assert "\nProblem Solving: 7/10\n" in text
+    assert "\nAreas for Improvement:\n- SQL\n" in text
+    assert text.endswith("\nDetailed Feedback:\nGood overall.\n")
+
+
+def test_format_evaluation_passes_other_text_through():
+    assert format_evaluation("Final score: 7/10") == "Final score: 7/10"
+    assert format_evaluation("[1, 2]") == "[1, 2]"
+
+
+def test_scoring_data_from_json_fills_missing_fields():
+    data = score_candidate_with_db.scoring_data_from_response(json.dumps({"final_score": 6}))
+    assert data["final_score"] == 6
+    assert data["recommendation"] == "pending"
+    assert data["key_strengths"] == []
+
+
+def test_scoring_data_from_json_averages_a_missing_final_score():
+    response = {"technical_skills_score": 6, "communication_score": 9, "final_score": None}
+    data = score_candidate_with_db.scoring_data_from_response(json.dumps(response))
+    assert data["final_score"] == 7.5
+    assert "final_score" not in score_candidate_with_db.scoring_data_from_response("{}")
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        ({"technical_skills_score": 6, "communication_score": 8, "recommendation": "hire"}, 7.0),
+        ({"detailed_feedback": "No scores given"}, 5.0),
+    ],
+)
+def test_save_scoring_results_without_final_score(db_ops, tmp_path, response, expected):
+    interview_id = score_candidate_with_db.get_or_create_interview_data("session_1_1")
+    assert score_candidate_with_db.save_scoring_results(
+        "session_1_1", interview_id, "t1.txt", json.dumps(response)
+    )
+    assert saved_final_score(db_ops, "session_1_1") == [expected]
+    evaluation = (tmp_path / "final_evaluation.txt").read_text(encoding="utf-8")
+    assert evaluation.startswith("Final Score: N/A\n")
+    assert db_ops.has_interview_recording(interview_id, "transcript")
+
+
+def test_cached_responses_skip_the_model(db_ops, monkeypatch):
+    monkeypatch.setattr(score_candidate_with_db, "get_client", failing_client)
+    inputs = score_candidate_with_db.read_scoring_inputs("t1.txt")
+    db_ops.cache_scoring(score_candidate_with_db.scoring_cache_key(inputs), json.dumps(RESPONSE))
+
+    assert score_candidate_with_db.score_candidate_with_database("session_1_1", "t1.txt")
+    assert saved_final_score(db_ops, "session_1_1") == [7.5]
+
+
+def test_bulk_chunks_respect_count_and_size_limits(monkeypatch):
+    monkeypatch.setattr(score_candidate_with_db, "BULK_MAX_CANDIDATES", 2)
+    monkeypatch.setattr(score_candidate_with_db, "BULK_MAX_TRANSCRIPT_BYTES", 10)
+    prepared = [(f"s{n}", n, "t.txt", b"x" * size) for n, size in enumerate((4, 4, 4, 20, 1))]
+    chunks = [[s[0] for s in chunk] for chunk in score_candidate_with_db._bulk_chunks(prepared)]
+    assert chunks == [["s0", "s1"], ["s2"], ["s3"], ["s4"]]
+
+
+def test_concurrent_scoring_reports_each_session(monkeypatch):
+    monkeypatch.setattr(
+        score_candidate_with_db,
+        "score_candidate_with_database",
+        lambda session_id, transcript_file: session_id != "b",
+    )
+    sessions = [("a", "t1.txt"), ("b", "t2.txt"), ("c", "t3.txt")]
+    assert score_candidate_with_db.score_candidates_concurrently(sessions, max_workers=2) == {
+        "a": True, "b": False, "c": True,
+    }
+
+
+def test_bulk_scoring_uploads_shared_files_once(db_ops, monkeypatch):
+    pytest.importorskip("google.genai")
+    monkeypatch.setattr(score_candidate_with_db, "BULK_MAX_CANDIDATES", 1)
+    uploads, requests = [], []
+
+    def upload(file, config=None):
+        uploads.append(file)
+        return SimpleNamespace(uri=f"files/{file}", mime_type="text/plain")
+
+    def generate_content(model, contents, config):
+        requests.append(contents)
+        session_id = contents["parts"][2].text.split()[2]
+        return SimpleNamespace(text=json.dumps([{**RESPONSE, "session_id": session_id}]))
+
+    client = SimpleNamespace(
+        files=SimpleNamespace(upload=upload),
+        models=SimpleNamespace(generate_content=generate_content),
+    )
+    monkeypatch.setattr(score_candidate_with_db, "get_client", lambda: client)
+
+    sessions = [("session_1_1", "t1.txt"), ("session_2_2", "t2.txt"), ("session_3_3", "t3.txt")]
+    results = score_candidate_with_db.score_candidates_bulk(sessions)
+    assert results == {"session_1_1": True, "session_2_2": True, "session_3_3": True}
+    assert sorted(uploads) == sorted([RESUME_FILE, JD_FILE])
+    assert len(requests) == 3
+    assert saved_final_score(db_ops, "session_3_3") == [7.5]
+
+
+def test_batch_scoring_saves_inlined_responses(db_ops, monkeypatch):
+    pytest.importorskip("google.genai")
+    jobs, deleted_caches = [], []
+
+    def create_batch(model, src, config):
+        jobs.append(src)
+        responses = [
+            SimpleNamespace(error=None, response=SimpleNamespace(text=json.dumps(RESPONSE))),
+            SimpleNamespace(error="quota", response=None),
+        ]
+        return SimpleNamespace(
+            name="batches/1",
+            state=SimpleNamespace(name="JOB_STATE_SUCCEEDED"),
+            dest=SimpleNamespace(inlined_responses=responses),
+        )
+
+    client = SimpleNamespace(
+        files=SimpleNamespace(
+            upload=lambda file, config=None: SimpleNamespace(uri=f"files/{file}", mime_type="text/plain")
+        ),
+        caches=SimpleNamespace(
+            create=lambda model, config: SimpleNamespace(name="cachedContents/1"),
+            delete=lambda name: deleted_caches.append(name),
+        ),
+        batches=SimpleNamespace(create=create_batch),
+    )
+    monkeypatch.setattr(score_candidate_with_db, "get_client", lambda: client)
+
+    results = score_candidate_with_db.score_sessions_batch(
+        [("session_1_1", "t1.txt"), ("session_2_2", "t2.txt")]
+    )
+    assert results == {"session_1_1": True, "session_2_2": False}
+    assert len(jobs) == 1 and len(jobs[0]) == 2
+    assert jobs[0][0]["config"].cached_content == "cachedContents/1"
+    assert deleted_caches == ["cachedContents/1"]
+    assert saved_final_score(db_ops, "session_1_1") == [7.5]
+
+    # The saved response is reused without another job
+    assert score_candidate_with_db.score_sessions_batch([("session_1_1", "t1.txt")]) == {
+        "session_1_1": True
+    }
+    assert len(jobs) == 1
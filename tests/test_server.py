@@ -0,0 +1,145 @@
+import asyncio
+import base64
+import threading
+
+import pytest
+
+pytest.importorskip("fastapi")
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import database_operations
+import server
+from init_database import DatabaseManager
+
+
+@pytest.fixture
+def db_ops(tmp_path):
+    db_path = str(tmp_path / "test_interview_database.db")
+    assert DatabaseManager(db_path).create_database(force_recreate=True)
+    return database_operations.InterviewDatabaseOps(db_path)
+
+
+@pytest.fixture
+def client(db_ops):
+    # Not used as a context manager, so the startup hook leaves the real database alone
+    server.app.dependency_overrides[server.get_db_ops] = lambda: db_ops
+    yield TestClient(server.app)
+    server.app.dependency_overrides.clear()
+
+
+def test_dependency_is_the_shared_instance(monkeypatch):
+    assert server.get_shared_db_ops is database_operations.get_db_ops
+    shared = object()
+    monkeypatch.setattr(server, "get_shared_db_ops", lambda: shared)
+    assert server.get_db_ops() is shared
+
+    monkeypatch.setattr(server, "DATABASE_AVAILABLE", False)
+    with pytest.raises(HTTPException) as excinfo:
+        server.get_db_ops()
+    assert excinfo.value.status_code == 503
+
+
+def test_shutdown_closes_the_shared_connections(monkeypatch):
+    closed = []
+    monkeypatch.setattr(server, "close_db_ops", lambda: closed.append(True))
+    server.shutdown_db_ops()
+    assert closed == [True]
+
+
+def test_endpoint_queries_run_off_the_event_loop(client, db_ops, monkeypatch):
+    counts = db_ops.get_analytics_counts
+    loops = []
+
+    def get_analytics_counts():
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return counts()
+
+    monkeypatch.setattr(db_ops, "get_analytics_counts", get_analytics_counts)
+    r = client.get("/api/analytics/stats")
+    assert r.status_code == 200
+    assert r.json() == {"totalJobs": 0, "totalCandidates": 0, "totalInterviews": 0, "averageScore": 0}
+    assert loops == [None]
+
+
+class FakeCascade:
+    def __init__(self, faces):
+        self.faces = faces
+        self.calls = []
+
+    def empty(self):
+        return False
+
+    def detectMultiScale(self, image, *args):
+        self.calls.append((image.shape, threading.get_ident()))
+        return self.faces
+
+
+class Recorder:
+    def __init__(self):
+        self.sent = []
+
+    async def send_client_content(self, **kwargs):
+        self.sent.append(kwargs)
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+
+def make_session(tmp_path, monkeypatch, faces):
+    monkeypatch.setattr(server, "BASE_DIR", tmp_path)
+    session = server.WebSocketInterviewSession(websocket=Recorder())
+    session.session = Recorder()
+    session._face_cascade = FakeCascade(faces)
+    return session
+
+
+def jpeg_frame(height=240, width=320):
+    ok, encoded = cv2.imencode(".jpg", np.zeros((height, width, 3), dtype=np.uint8))
+    assert ok
+    return base64.b64encode(encoded.tobytes()).decode()
+
+
+def process(session, frame, count):
+    async def run():
+        for _ in range(count):
+            await session._process_frame(frame)
+    asyncio.run(run())
+
+
+def test_faces_are_detected_on_every_third_frame_at_half_size(tmp_path, monkeypatch):
+    session = make_session(tmp_path, monkeypatch, faces=[])
+    process(session, jpeg_frame(), 6)
+    cascade = session._face_cascade
+    assert [shape for shape, _ in cascade.calls] == [(120, 160), (120, 160)]
+    assert all(thread != threading.get_ident() for _, thread in cascade.calls)
+    # Frames between detections reuse the last answer
+    assert session._looked_away == 6
+
+
+def test_looking_away_past_the_threshold_warns(tmp_path, monkeypatch):
+    session = make_session(tmp_path, monkeypatch, faces=[])
+    process(session, jpeg_frame(), session._lookaway_threshold + 1)
+    assert session._looked_away_warnings == 1
+    assert session.websocket.sent[-1]["event"] == "look_away_warning"
+    assert session.session.sent
+
+
+def test_visible_faces_reset_the_look_away_count(tmp_path, monkeypatch):
+    session = make_session(tmp_path, monkeypatch, faces=[(0, 0, 40, 40)])
+    session._looked_away = 5
+    process(session, jpeg_frame(), 3)
+    assert session._looked_away == 0
+
+
+def test_undecodable_frames_are_ignored(tmp_path, monkeypatch):
+    session = make_session(tmp_path, monkeypatch, faces=[])
+    process(session, base64.b64encode(b"not a jpeg").decode(), 1)
+    assert session._face_cascade.calls == []
+    assert session._looked_away == 0